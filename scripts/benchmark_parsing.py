@@ -0,0 +1,95 @@
+"""Time SearchManager's HTML extraction per page for each installed tree builder.
+
+Pages are built from the markup fixtures in tests/unit/test_parsing.py,
+repeated to the size of a real listing, and handed to the provider parsers
+with RequestManager mocked out.
+
+    python scripts/benchmark_parsing.py --items 200 --repeat 50
+"""
+
+import argparse
+import sys
+import timeit
+from importlib.util import find_spec
+from pathlib import Path
+from unittest.mock import patch
+
+_root = Path(__file__).resolve().parent.parent
+if str(_root) not in sys.path:
+    sys.path.insert(0, str(_root))
+
+from stream2mediaserver.config import config  # noqa: E402
+from stream2mediaserver.processors.request_manager import RequestManager  # noqa: E402
+from stream2mediaserver.processors.search_manager import SearchManager  # noqa: E402
+from tests.unit.test_parsing import (  # noqa: E402
+    AnitubeSearchFieldTests,
+    FakeResponse,
+    UaflixSeasonGroupingTests,
+)
+
+UAKINO_EPISODE = (
+    '<li data-id="{i}" data-voice="Струґачка" data-file="//ashdi.vip/vod/{i}">'
+    "Серія {i}</li>"
+)
+ANITUBE_EPISODE = (
+    '<li data-id="0_0_0">TOGARASHI</li>'
+    '<li data-id="0_0_0_0" data-file="https://ashdi.vip/vod/{i}">{i} серія</li>'
+)
+# Detail pages carry far more than the episode list.
+PAGE_NOISE = (
+    "<script>var x = 1;</script><nav><ul>"
+    + "".join(f'<li><a href="/menu/{n}">Menu {n}</a></li>' for n in range(40))
+    + "</ul></nav>"
+)
+
+
+def pages(items: int) -> dict:
+    """One synthetic page per parser, `items` results/episodes each."""
+    uakino_episodes = "".join(UAKINO_EPISODE.format(i=i) for i in range(items))
+    anitube_episodes = "".join(ANITUBE_EPISODE.format(i=i) for i in range(items))
+    uaflix_page = UaflixSeasonGroupingTests._page(
+        [f"Сезон 1 Серія {i} Назва" for i in range(items)]
+    )
+    return {
+        "anitube search": lambda: _search_anitube(AnitubeSearchFieldTests.HTML * items),
+        "uakino series": lambda: SearchManager._parse_uakino_series(
+            FakeResponse({"response": f"<ul>{uakino_episodes}</ul>"})
+        ),
+        "anitube series": lambda: SearchManager._parse_anitube_series(
+            FakeResponse({"response": f"<ul>{anitube_episodes}</ul>"})
+        ),
+        "uaflix episode page": lambda: SearchManager.parse_uaflix_series_page_html(
+            FakeResponse(text=PAGE_NOISE * 10 + uaflix_page.text)
+        ),
+    }
+
+
+def _search_anitube(html: str):
+    with patch.object(RequestManager, "post", return_value=FakeResponse(text=html)):
+        return SearchManager._search_html(
+            "anitube", "q", "hash", "https://anitube.in.ua", "url", None
+        )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--items", type=int, default=200, help="results per page")
+    parser.add_argument("--repeat", type=int, default=30, help="parses per timing")
+    args = parser.parse_args()
+
+    builders = [
+        b for b in ("html.parser", "lxml") if b == "html.parser" or find_spec(b)
+    ]
+    cases = pages(args.items)
+    print(f"{'page':<22}" + "".join(f"{b:>14}" for b in builders) + "   (ms/page)")
+    for name, parse in cases.items():
+        row = f"{name:<22}"
+        for builder in builders:
+            with patch.object(config.provider_config, "html_parser", builder):
+                seconds = min(timeit.repeat(parse, number=args.repeat, repeat=3))
+            row += f"{seconds / args.repeat * 1000:>14.2f}"
+        print(row)
+
+
+if __name__ == "__main__":
+    main()
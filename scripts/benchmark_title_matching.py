@@ -0,0 +1,119 @@
+"""Time Animeon result filtering: per-result difflib scoring vs TitleMatcher.
+
+Builds a synthetic response of `--results` items whose titles mix real
+words, spelling variants and filler, scores each against a few queries the
+old way (every query token against every title token with difflib) and
+with one TitleMatcher per query, and checks both keep the same results.
+
+    python scripts/benchmark_title_matching.py --results 1000 --repeat 5
+"""
+
+import argparse
+import random
+import sys
+import timeit
+from difflib import SequenceMatcher
+from pathlib import Path
+from unittest.mock import patch
+
+_root = Path(__file__).resolve().parent.parent
+if str(_root) not in sys.path:
+    sys.path.insert(0, str(_root))
+
+from stream2mediaserver.processors import title_matcher  # noqa: E402
+from stream2mediaserver.processors.title_matcher import (  # noqa: E402
+    SEARCH_STOPWORDS,
+    TitleMatcher,
+    _FUZZY_MIN_RATIO,
+    _FUZZY_MIN_TOKEN_LEN,
+    tokenize,
+)
+
+QUERIES = ["Attack on Titan", "Naruto Shippuden", "Stranger Things", "Dan Da Dan"]
+WORDS = (
+    "attack titan naruto shippuuden shippuden stranger things amazing dandadan "
+    "academia hero girl data river небо березі червоної річки атака титанів "
+    "наруто дівчинка погана сезон частина chronicles kingdom sword online "
+    "slayer demon hunter season part the and"
+).split()
+MIN_TITLE_MATCH = 0.6
+
+
+def difflib_score(query: str, titles: list) -> float:
+    """title_match_score before TitleMatcher, kept as the reference."""
+    query_tokens = [
+        t for t in tokenize(query) if len(t) > 1 and t not in SEARCH_STOPWORDS
+    ]
+    if not query_tokens:
+        return 1.0
+    candidate_tokens = set()
+    for title in titles:
+        candidate_tokens.update(tokenize(title))
+    if not candidate_tokens:
+        return 0.0
+    matched = 0
+    for token in query_tokens:
+        if token in candidate_tokens:
+            matched += 1
+        elif len(token) >= _FUZZY_MIN_TOKEN_LEN and any(
+            SequenceMatcher(None, token, other).ratio() >= _FUZZY_MIN_RATIO
+            for other in candidate_tokens
+        ):
+            matched += 1
+    return matched / len(query_tokens)
+
+
+def results(count: int) -> list:
+    """Titles (Ukrainian, English, synonyms) for count synthetic results."""
+    rng = random.Random(0)
+
+    def title() -> str:
+        return " ".join(rng.choice(WORDS) for _ in range(rng.randint(2, 5)))
+
+    return [[title(), title(), *(title() for _ in range(2))] for _ in range(count)]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--results", type=int, default=1000, help="results per response"
+    )
+    parser.add_argument("--repeat", type=int, default=5, help="responses per timing")
+    args = parser.parse_args()
+
+    items = results(args.results)
+
+    def kept_difflib(query):
+        return [difflib_score(query, t) >= MIN_TITLE_MATCH for t in items]
+
+    def kept_matcher(query):
+        matcher = TitleMatcher(query)
+        return [matcher.score(t) >= MIN_TITLE_MATCH for t in items]
+
+    engines = {"difflib per result": kept_difflib, "TitleMatcher": kept_matcher}
+    if title_matcher.Indel is not None:
+        engines["TitleMatcher, no rapidfuzz"] = lambda query: _without_rapidfuzz(
+            kept_matcher, query
+        )
+
+    print(f"{'query':<20}" + "".join(f"{name:>28}" for name in engines) + "   (ms)")
+    for query in QUERIES:
+        expected = kept_difflib(query)
+        row = f"{query:<20}"
+        for name, engine in engines.items():
+            if engine(query) != expected:
+                raise SystemExit(f"{name} disagrees with difflib on {query!r}")
+            seconds = min(
+                timeit.repeat(lambda: engine(query), number=args.repeat, repeat=3)
+            )
+            row += f"{seconds / args.repeat * 1000:>28.2f}"
+        print(row + f"   kept {sum(expected)}/{len(items)}")
+
+
+def _without_rapidfuzz(engine, query):
+    with patch.object(title_matcher, "Indel", None):
+        return engine(query)
+
+
+if __name__ == "__main__":
+    main()
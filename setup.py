@@ -18,9 +18,14 @@ setup(
     packages=find_packages(),
     install_requires=[
         "requests",
-        "beautifulsoup4",
+        "beautifulsoup4>=4.13",
+        "lxml",
         "m3u8",
         "py3createtorrent",
         "curl_cffi",
     ],
+    extras_require={
+        # Faster fuzzy title matching (see processors/title_matcher.py)
+        "speedups": ["rapidfuzz"],
+    },
 )
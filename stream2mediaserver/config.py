@@ -6,7 +6,7 @@ logging and provider settings.
 
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Dict, Optional
+from typing import Dict, List, Optional, Tuple
 
 
 @dataclass
@@ -29,8 +29,100 @@ class ProviderConfig:
         "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
         "(KHTML, like Gecko) Chrome/131.0.0.0 Safari/537.36"
     )
-    # Minimum seconds to wait between requests to the same host (throttle Cloudflare)
+    # Minimum seconds to wait between requests to the same host (throttle Cloudflare).
+    # With adaptive_throttle this is only the starting interval for a new host.
     request_delay_seconds: float = 2.0
+    # Tune each host's interval from its responses: fast 2xx responses shave
+    # adaptive_step_seconds off, 429/503/Retry-After double it (AIMD)
+    adaptive_throttle: bool = True
+    min_request_delay_seconds: float = 0.25
+    max_request_delay_seconds: float = 30.0
+    adaptive_step_seconds: float = 0.1
+    # Successes slower than this don't speed the host up
+    adaptive_fast_latency_seconds: float = 1.0
+    # JSON file keeping learned per-host intervals across runs; None keeps them in memory
+    pacing_state_path: Optional[Path] = Path("data/host_pacing.json")
+    # Concurrent requests allowed per host; each host gets its own session. 0 = no limit
+    max_connections_per_host: int = 6
+    # Seconds an idle keep-alive connection may be reused before it is reopened
+    keepalive_idle_seconds: int = 60
+    # None keeps the impersonated browser's negotiation (HTTP/2 via ALPN);
+    # True forces HTTP/2 multiplexing, False pins HTTP/1.1
+    http2: Optional[bool] = None
+    # Consecutive failed attempts (transport errors, 5xx, 429, Cloudflare challenges)
+    # after which a host is cut off for circuit_reset_seconds. 0 disables the breaker
+    circuit_failure_threshold: int = 5
+    circuit_reset_seconds: float = 60.0
+    # Seconds MainLogic.search waits for providers before answering with the ones
+    # that finished; None waits for all of them
+    search_timeout_budget: Optional[float] = None
+    # BeautifulSoup tree builder for provider pages ("lxml", "html.parser");
+    # None uses lxml when installed
+    html_parser: Optional[str] = None
+    # How long a scraped DLE login hash is reused before the homepage is refetched
+    dle_hash_ttl_seconds: float = 3600.0
+    # JSON file keeping session tokens across restarts; None keeps them in memory only
+    token_cache_path: Optional[Path] = Path("data/dle_tokens.json")
+
+
+def default_cache_ttls() -> List[Tuple[str, float]]:
+    """Default (URL regex, seconds) freshness rules; the first match wins."""
+    return [
+        # Media is large and fetched once; playlists may be live.
+        (r"\.(ts|m4s|mp4|mkv|m3u8)(\?|$)", 0),
+        # Timestamped playlist requests never repeat.
+        (r"[?&]time=\d+", 0),
+        # Provider homepages (DLE login hash) and episode lists.
+        (r"^https?://[^/]+/?$", 3600),
+        (r"/engine/ajax/playlists\.php|/api/player/", 900),
+    ]
+
+
+@dataclass
+class HttpCacheConfig:
+    """On-disk GET response cache settings."""
+
+    # SQLite database path; None disables the cache
+    path: Optional[Path] = None
+    max_bytes: int = 256 * 1024 * 1024
+    ttl_rules: List[Tuple[str, float]] = field(default_factory=default_cache_ttls)
+    # Freshness for URLs no rule matches
+    default_ttl_seconds: float = 600.0
+
+
+@dataclass
+class DownloadConfig:
+    """Media download settings."""
+
+    # Segments of one HLS stream fetched concurrently (still capped per host by
+    # ProviderConfig.max_connections_per_host)
+    segment_workers: int = 6
+    # Extra attempts for a segment whose transfer broke off mid-body
+    segment_retries: int = 2
+    # Per-job scratch directories (provider/title/studio/episode) live here
+    work_root: Path = Path("media/work")
+    # Bytes all open work directories may hold together; None = no limit
+    disk_budget_bytes: Optional[int] = 20 * 1024**3
+    # Never fill the disk below this much free space
+    min_free_bytes: int = 1024**3
+    # How long a download waits for budget to free up before giving up
+    disk_wait_seconds: float = 600.0
+    # Byte-range parts a large single-file (MP4) download is split into
+    file_parts: int = 4
+    # Files smaller than this per part are fetched in one stream
+    min_part_bytes: int = 16 * 1024 * 1024
+    # Times a broken file transfer is resumed from where it stopped
+    file_retries: int = 3
+    # Variant selection: caps on resolution height and advertised bits/s,
+    # CODECS prefixes in order of preference (e.g. ["avc1"]); None/empty = no limit
+    max_height: Optional[int] = None
+    max_bandwidth: Optional[int] = None
+    preferred_codecs: List[str] = field(default_factory=list)
+    # Pick the best HLS variant expected to download within this many seconds,
+    # judged by a timed fetch of one segment; None always takes the best allowed
+    target_download_seconds: Optional[float] = None
+    # Stop following a live HLS playlist that has not grown for this long
+    live_idle_seconds: float = 120.0
 
 
 def default_providers() -> Dict[str, bool]:
@@ -50,6 +142,8 @@ class AppConfig:
     providers: Dict[str, bool] = field(default_factory=default_providers)
     log_config: LogConfig = field(default_factory=LogConfig)
     provider_config: ProviderConfig = field(default_factory=ProviderConfig)
+    http_cache: HttpCacheConfig = field(default_factory=HttpCacheConfig)
+    download: DownloadConfig = field(default_factory=DownloadConfig)
 
 
 # Global configuration instance
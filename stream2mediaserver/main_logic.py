@@ -1,13 +1,21 @@
 """Main logic module for stream2mediaserver."""
 
 import asyncio
+import contextvars
+import functools
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from importlib import import_module
-from typing import Dict, Iterable, List, Optional, Type, Union
+from typing import AsyncIterator, Dict, Iterable, List, Optional, Tuple, Type, Union
 
 from .config import AppConfig, config as default_config
-from .models.search_result import SearchResult
+from .models.search_result import (
+    CombinedSearchResults,
+    ProviderSearchStatus,
+    SearchResult,
+)
 from .models.series import Series, SeriesGroup
+from .processors.request_manager import RequestManager
+from .processors.result_merger import ResultMerger
 from .providers.provider_base import ProviderBase
 from .utils.logger import logger
 
@@ -58,19 +66,44 @@ class MainLogic:
             logger.error(f"Failed to load provider {provider_name}: {e}")
             return None
 
-    async def search(self, query: str) -> List[SearchResult]:
+    async def search(
+        self, query: str, timeout_budget: Optional[float] = None
+    ) -> CombinedSearchResults:
         """Search for content across all enabled providers.
 
         Args:
             query: Search query string
+            timeout_budget: Seconds to wait for providers; those still running
+                when it runs out are abandoned. Defaults to
+                ProviderConfig.search_timeout_budget (None waits for all)
 
         Returns:
-            List of search results from all providers
+            List of search results from the providers that answered in time,
+            with per-provider outcomes in its `statuses` and the results
+            merged into one entry per work in its `works`
+        """
+        return await self._search_providers(
+            query, self._enabled_providers(), timeout_budget
+        )
 
-        Raises:
-            Exception: If search operation fails
+    async def search_iter(
+        self, query: str, timeout_budget: Optional[float] = None
+    ) -> AsyncIterator[Tuple[ProviderSearchStatus, List[SearchResult]]]:
+        """Search all enabled providers, yielding each one's results as it answers.
+
+        Args:
+            query: Search query string
+            timeout_budget: See search
+
+        Yields:
+            (status, results) per provider in completion order; providers
+            still running when the budget runs out are yielded last with a
+            TIMEOUT status and no results
         """
-        return await self._search_providers(query, self._enabled_providers())
+        async for outcome in self._iter_provider_searches(
+            query, self._enabled_providers(), timeout_budget
+        ):
+            yield outcome
 
     async def process_item(self, item: Union[SearchResult, Series]) -> bool:
         """Process a search result or series item.
@@ -136,12 +169,16 @@ class MainLogic:
         provider = provider_class(self.config)
         return provider.search_title(query)
 
-    async def search_releases(self, query: str):
-        return await self._search_providers(query, self._enabled_providers())
+    async def search_releases(self, query: str, timeout_budget: Optional[float] = None):
+        return await self._search_providers(
+            query, self._enabled_providers(), timeout_budget
+        )
 
-    async def search_releases_for_provider(self, provider_name: str, query: str):
+    async def search_releases_for_provider(
+        self, provider_name: str, query: str, timeout_budget: Optional[float] = None
+    ):
         provider_names = [provider_name]
-        return await self._search_providers(query, provider_names)
+        return await self._search_providers(query, provider_names, timeout_budget)
 
     def get_release_details(self, provider_name: str, release_url: str):
         provider_class = self.get_provider_class(provider_name)
@@ -176,28 +213,113 @@ class MainLogic:
         return self._enabled_providers()
 
     async def _search_providers(
-        self, query: str, provider_names: Iterable[str]
-    ) -> List[SearchResult]:
-        tasks = [
-            asyncio.to_thread(self._search_provider, provider_name, query)
-            for provider_name in provider_names
-        ]
-        results = await asyncio.gather(*tasks, return_exceptions=True)
-        combined: List[SearchResult] = []
-        for provider_name, result in zip(provider_names, results):
-            if isinstance(result, Exception):
-                logger.error(f"{provider_name} generated an exception: {result}")
-                continue
-            combined.extend(result)
-            logger.info(f"Results from {provider_name} received.")
+        self,
+        query: str,
+        provider_names: Iterable[str],
+        timeout_budget: Optional[float] = None,
+    ) -> CombinedSearchResults:
+        combined = CombinedSearchResults()
+        async for status, results in self._iter_provider_searches(
+            query, provider_names, timeout_budget
+        ):
+            combined.statuses[status.provider] = status
+            combined.extend(results)
+        combined.works = ResultMerger.merge(combined)
         return combined
 
+    async def _iter_provider_searches(
+        self,
+        query: str,
+        provider_names: Iterable[str],
+        timeout_budget: Optional[float] = None,
+    ) -> AsyncIterator[Tuple[ProviderSearchStatus, List[SearchResult]]]:
+        if timeout_budget is None:
+            timeout_budget = self.config.provider_config.search_timeout_budget
+        provider_names = list(provider_names)
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        # A pool of our own rather than the loop's default executor: asyncio.run
+        # joins the default one on exit, which would make the caller wait for
+        # the very providers the budget gave up on.
+        executor = ThreadPoolExecutor(
+            max_workers=max(len(provider_names), 1),
+            thread_name_prefix="provider-search",
+        )
+        tasks = {
+            loop.run_in_executor(
+                executor,
+                functools.partial(
+                    contextvars.copy_context().run,
+                    self._search_provider,
+                    provider_name,
+                    query,
+                ),
+            ): provider_name
+            for provider_name in provider_names
+        }
+        pending = set(tasks)
+        try:
+            while pending:
+                remaining = None
+                if timeout_budget is not None:
+                    remaining = timeout_budget - (loop.time() - started)
+                    if remaining <= 0:
+                        break
+                done, pending = await asyncio.wait(
+                    pending, timeout=remaining, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    provider_name = tasks[task]
+                    elapsed = loop.time() - started
+                    error = task.exception()
+                    if error is not None:
+                        logger.error(f"{provider_name} generated an exception: {error}")
+                        yield ProviderSearchStatus(
+                            provider_name,
+                            ProviderSearchStatus.ERROR,
+                            elapsed=elapsed,
+                            error=error,
+                        ), []
+                        continue
+                    results = task.result() or []
+                    logger.info(f"Results from {provider_name} received.")
+                    yield ProviderSearchStatus(
+                        provider_name,
+                        ProviderSearchStatus.OK,
+                        count=len(results),
+                        elapsed=elapsed,
+                    ), results
+            for task in pending:
+                provider_name = tasks[task]
+                logger.warning(
+                    f"{provider_name} did not answer within {timeout_budget}s; "
+                    "returning without it."
+                )
+                yield ProviderSearchStatus(
+                    provider_name,
+                    ProviderSearchStatus.TIMEOUT,
+                    elapsed=loop.time() - started,
+                ), []
+        finally:
+            # The worker threads cannot be interrupted; they finish in the
+            # background and their results are dropped. Nothing waits for them.
+            for task in tasks:
+                task.cancel()
+            executor.shutdown(wait=False, cancel_futures=True)
+
     def _search_provider(self, provider_name: str, query: str) -> List[SearchResult]:
         provider_class = self.get_provider_class(provider_name)
         if not provider_class:
             logger.error(f"Provider {provider_name} could not be loaded.")
             return []
-        return self.search_titles(provider_class, query)
+        provider = provider_class(self.config)
+        base_url = getattr(provider, "base_url", "")
+        if base_url and RequestManager.circuit_open(base_url):
+            # The host failed repeatedly; answer with the other providers now
+            # instead of waiting for its requests to be refused one by one.
+            logger.warning(f"Skipping {provider_name}: {base_url} is unavailable.")
+            return []
+        return provider.search_title(query)
 
 
 def add_release_by_url(config):
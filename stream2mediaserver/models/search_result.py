@@ -24,6 +24,45 @@ class SearchResult:
         self.provider = provider
 
 
+class MergedSearchResult:
+    """One work found by one or more providers.
+
+    The descriptive fields are taken from the first source that has them;
+    `results` keeps every provider's own SearchResult, in input order.
+    """
+
+    def __init__(self, results, year=None):
+        self.results = list(results)
+        self.year = year
+        self.title = self._first("title")
+        self.title_eng = self._first("title_eng")
+        self.description = self._first("description")
+        self.image_url = self._first("image_url")
+        self.series_info = self._first("series_info")
+        self.rating = self._first("rating")
+
+    def _first(self, field):
+        return next(
+            (getattr(r, field) for r in self.results if getattr(r, field, None)), None
+        )
+
+    @property
+    def providers(self):
+        """Provider names, without repeats, in input order."""
+        return list(dict.fromkeys(r.provider for r in self.results))
+
+    @property
+    def links(self):
+        """Provider name -> links to this work on that provider."""
+        links = {}
+        for r in self.results:
+            links.setdefault(r.provider, []).append(r.link)
+        return links
+
+    def __repr__(self):
+        return f"MergedSearchResult(title={self.title!r}, year={self.year!r}, providers={self.providers!r})"
+
+
 class SearchResults:
     def __init__(self):
         self.results = []
@@ -38,3 +77,44 @@ class SearchResults:
 
     def set_no_results_message(self, message):
         self.no_results_message = message
+
+
+class ProviderSearchStatus:
+    """How one provider's part of a multi-provider search ended."""
+
+    OK = "ok"
+    ERROR = "error"
+    TIMEOUT = "timeout"
+
+    def __init__(self, provider, state, count=0, elapsed=0.0, error=None):
+        self.provider = provider
+        self.state = state
+        self.count = count
+        self.elapsed = elapsed
+        self.error = error
+
+    def __repr__(self):
+        return f"ProviderSearchStatus(provider={self.provider!r}, state={self.state!r}, count={self.count}, elapsed={self.elapsed:.2f})"
+
+
+class CombinedSearchResults(list):
+    """Search results from several providers, plus how each provider fared.
+
+    Behaves as a plain list of SearchResult; `statuses` maps provider name to its
+    ProviderSearchStatus so callers can tell an empty answer from a timeout.
+    `works` holds the same results merged across providers, one
+    MergedSearchResult per title.
+    """
+
+    def __init__(self, results=()):
+        super().__init__(results)
+        self.statuses = {}
+        self.works = []
+
+    @property
+    def complete(self):
+        """True if every provider answered before the deadline."""
+        return all(
+            status.state != ProviderSearchStatus.TIMEOUT
+            for status in self.statuses.values()
+        )
@@ -1,16 +1,7 @@
 import sqlite3
 
-from ..config import config
 from ..processors.request_manager import RequestManager
 
-# Bulk scraping makes tens of thousands of calls to animeon's own JSON API, which
-# tolerates fast pacing; the 2s/host provider throttle would take days.
-SCRAPE_DELAY_SECONDS = 0.3
-
-
-def _pace_for_scraping() -> None:
-    config.provider_config.request_delay_seconds = SCRAPE_DELAY_SECONDS
-
 
 def create_connection(db_file):
     conn = None
@@ -427,7 +418,6 @@ def get_last_index(conn):
 
 
 def initiate_scrap(conn):
-    _pace_for_scraping()
     last_index = get_last_index(conn)
     index = last_index + 1  # Start from the next index after the last processed one
     while True:
@@ -520,7 +510,6 @@ def check_new_animes(conn):
 
 
 def delta(conn):
-    _pace_for_scraping()
     check_new_animes(conn)
     process_new_anime_ids(conn)
     clear_processed_ids(conn)
@@ -0,0 +1,161 @@
+"""Declarative extraction of records from provider HTML."""
+
+import re
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Mapping, Optional, Sequence, Tuple
+
+from bs4 import BeautifulSoup
+
+from .html_backend import Strainer, css, make_soup
+
+
+@dataclass(frozen=True)
+class Field:
+    """How to read one value out of a record's element.
+
+    The value is the text (or `attr`) of the first element under the record
+    matching `selector`, or of the record element itself when there is no
+    selector. `pattern` keeps its first group (or the whole match) and
+    `transforms` run in order. A value that ends up None or empty becomes
+    `default`; if the field is `required`, the record is skipped instead.
+    """
+
+    selector: Optional[str] = None
+    attr: Optional[str] = None
+    pattern: Optional[str] = None
+    transforms: Tuple[Callable[[Any], Any], ...] = ()
+    default: Any = None
+    required: bool = False
+
+
+@dataclass
+class Extraction:
+    """Records a spec produced and how many candidates it skipped."""
+
+    records: List[Any] = field(default_factory=list)
+    skipped: int = 0
+
+
+class ExtractionSpec:
+    """Compiled description of the records on a page.
+
+    Selectors and patterns are compiled once, when the spec is created
+    (typically at import). Each record element is found with one selector.
+    Each distinct field selector is then looked up once per record, so
+    fields reading the same element share the lookup. Records are built as
+    `model(**fields, **constants)` when a model is given, otherwise
+    returned as dicts. With `parse_only`, markup is parsed partially: only
+    the elements the spec reads are built.
+    """
+
+    def __init__(
+        self,
+        items: str,
+        fields: Mapping[str, Field],
+        model: Optional[Callable[..., Any]] = None,
+        constants: Optional[Mapping[str, Any]] = None,
+        scope: Sequence[str] = (),
+        finalize: Optional[Callable[[dict, int, dict], Optional[dict]]] = None,
+        parse_only: Optional[Strainer] = None,
+    ):
+        """Compile the spec.
+
+        Args:
+            items: CSS selector matching one element per record
+            fields: Record keys (model keyword arguments) and how to read them
+            model: Callable building a record from its fields, e.g. SearchResult
+            constants: Extra keyword arguments for every record
+            scope: Container selectors tried in order; records are only looked
+                for under the first one found, and there are none if none is
+            finalize: (fields, index, context) -> fields, or None to skip the
+                record; for values that depend on other fields or the caller
+            parse_only: Strainer keeping the scope (or the items) and their
+                subtrees; the selectors must still match in what it keeps
+        """
+        self.fields = dict(fields)
+        self.model = model
+        self.constants = dict(constants or {})
+        self.finalize = finalize
+        self.parse_only = parse_only
+        self._items = css(items)
+        self._scope = [css(selector) for selector in scope]
+        self._selectors = {
+            f.selector: css(f.selector) for f in self.fields.values() if f.selector
+        }
+        self._patterns = {
+            f.pattern: re.compile(f.pattern, re.DOTALL)
+            for f in self.fields.values()
+            if f.pattern
+        }
+
+    def extract(self, page, **context) -> Extraction:
+        """Extract the records from page (markup or an already parsed soup).
+
+        Args:
+            page: HTML text or a BeautifulSoup tree
+            **context: Passed to finalize, e.g. the page's base URL
+        """
+        soup = page if isinstance(page, BeautifulSoup) else self.soup(page)
+        root = soup
+        if self._scope:
+            root = next(
+                (c for c in (s.select_one(soup) for s in self._scope) if c), None
+            )
+            if root is None:
+                return Extraction()
+        result = Extraction()
+        for index, item in enumerate(self._items.select(root)):
+            record = self._read(item)
+            if record is not None and self.finalize is not None:
+                record = self.finalize(record, index, context)
+            if record is None:
+                result.skipped += 1
+                continue
+            if self.model is not None:
+                record = self.model(**record, **self.constants)
+            result.records.append(record)
+        return result
+
+    def soup(self, markup) -> BeautifulSoup:
+        """Parse markup, partially if the spec has parse_only."""
+        return make_soup(markup, parse_only=self.parse_only)
+
+    def _read(self, item) -> Optional[Dict[str, Any]]:
+        nodes: Dict[str, Any] = {}
+        record = {}
+        for name, spec in self.fields.items():
+            if spec.selector is None:
+                node = item
+            else:
+                if spec.selector not in nodes:
+                    nodes[spec.selector] = self._selectors[spec.selector].select_one(
+                        item
+                    )
+                node = nodes[spec.selector]
+            value = self._value(node, spec)
+            if value is None or value == "":
+                if spec.required:
+                    return None
+                value = spec.default
+            record[name] = value
+        return record
+
+    def _value(self, node, spec: Field) -> Any:
+        if node is None:
+            return None
+        if spec.attr is None:
+            value = node.get_text()
+        else:
+            value = node.get(spec.attr)
+            if isinstance(value, list):  # multi-valued attributes such as class
+                value = " ".join(value)
+        if value is not None and spec.pattern is not None:
+            match = self._patterns[spec.pattern].search(value)
+            if match is None:
+                return None
+            value = match.group(1) if match.re.groups else match.group(0)
+        for transform in spec.transforms:
+            if value is None:
+                break
+            value = transform(value)
+        return value
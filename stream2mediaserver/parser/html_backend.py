@@ -0,0 +1,127 @@
+"""Tree building and precompiled selectors for provider HTML."""
+
+import re
+from functools import lru_cache
+from importlib.util import find_spec
+from typing import Dict, FrozenSet, List, Optional, Tuple
+
+import soupsieve
+from bs4 import BeautifulSoup
+from bs4.filter import ElementFilter
+
+from ..config import config
+
+# Fastest first; html.parser ships with Python and is always available.
+_PREFERRED_BUILDERS = ("lxml", "html.parser")
+
+
+@lru_cache(maxsize=None)
+def _installed(builder: str) -> bool:
+    return builder == "html.parser" or find_spec(builder) is not None
+
+
+def tree_builder() -> str:
+    """BeautifulSoup tree builder for provider pages.
+
+    ProviderConfig.html_parser picks one explicitly; by default lxml's C
+    parser is used when installed, falling back to the pure-Python
+    html.parser.
+    """
+    configured = config.provider_config.html_parser
+    if configured:
+        return configured
+    return next(b for b in _PREFERRED_BUILDERS if _installed(b))
+
+
+def make_soup(markup, parse_only=None) -> BeautifulSoup:
+    """Parse markup with the configured tree builder.
+
+    Args:
+        markup: HTML text or bytes
+        parse_only: Optional Strainer (or SoupStrainer) limiting which
+            elements are built
+    """
+    return BeautifulSoup(markup, tree_builder(), parse_only=parse_only)
+
+
+@lru_cache(maxsize=None)
+def css(selector: str) -> soupsieve.SoupSieve:
+    """Compile a CSS selector once; use .select()/.select_one() on any tag."""
+    return soupsieve.compile(selector)
+
+
+# tag, then any of .class, #id, [attr] and [attr="value"]
+_RULE = re.compile(r"^([\w-]*)((?:[.#][\w-]+|\[[\w-]+(?:=\"[^\"]*\")?\])*)$")
+_RULE_PART = re.compile(r"\.([\w-]+)|#([\w-]+)|\[([\w-]+)(?:=\"([^\"]*)\")?\]")
+
+
+class Strainer(ElementFilter):
+    """Partial parsing: only elements matching a rule are built, with their subtrees.
+
+    Everything outside them (scripts, navigation, ads) is skipped while the
+    page is tokenized, so it never becomes Tag objects. Rules are simple
+    selectors, e.g. "div#sers-wr", "a.search-result-link" or
+    'li[data-id]'; an element is kept if it matches any of them. Unlike
+    SoupStrainer(class_=...), a class rule matches one class among several.
+    """
+
+    def __init__(self, *rules: str):
+        super().__init__()
+        self.rules = tuple(rules)
+        self._rules = [self._compile(rule) for rule in rules]
+
+    @staticmethod
+    def _compile(
+        rule: str,
+    ) -> Tuple[str, FrozenSet[str], Dict[str, Optional[str]]]:
+        match = _RULE.match(rule)
+        if match is None:
+            raise ValueError(f"Unsupported strainer rule: {rule!r}")
+        name, parts = match.groups()
+        classes: List[str] = []
+        attrs: Dict[str, Optional[str]] = {}
+        for part in _RULE_PART.finditer(parts):
+            cls, id_, attr, value = part.groups()
+            if cls:
+                classes.append(cls)
+            elif id_:
+                attrs["id"] = id_
+            else:
+                attrs[attr] = value
+        return name, frozenset(classes), attrs
+
+    @property
+    def includes_everything(self) -> bool:
+        return False
+
+    def allow_tag_creation(self, nsprefix, name, attrs) -> bool:
+        attrs = attrs or {}
+        return any(self._matches(rule, name, attrs) for rule in self._rules)
+
+    def allow_string_creation(self, string: str) -> bool:
+        return False
+
+    def match(self, element, _known_rules: bool = False) -> bool:
+        name = getattr(element, "name", None)
+        if name is None:
+            return False
+        return self.allow_tag_creation(None, name, element.attrs)
+
+    @staticmethod
+    def _matches(rule, name: str, attrs) -> bool:
+        rule_name, classes, rule_attrs = rule
+        if rule_name and rule_name != name:
+            return False
+        if classes:
+            value = attrs.get("class") or ""
+            present = value.split() if isinstance(value, str) else value
+            if not classes.issubset(present):
+                return False
+        for attr, expected in rule_attrs.items():
+            value = attrs.get(attr)
+            if value is None or (expected is not None and value != expected):
+                return False
+        return True
+
+    def __repr__(self) -> str:
+        return f"Strainer{self.rules!r}"
@@ -0,0 +1,80 @@
+"""Per-host circuit breaking for failing providers."""
+
+import threading
+import time
+from typing import Dict, Optional
+
+
+class _Circuit:
+    def __init__(self) -> None:
+        self.failures = 0
+        self.opened_at: Optional[float] = None
+        self.probe_started: Optional[float] = None
+
+
+class CircuitBreaker:
+    """Stops sending to hosts that keep failing.
+
+    A host's circuit opens after `threshold` consecutive failed attempts, and
+    while it is open requests are refused without touching the network. Once
+    `reset_timeout` seconds have passed it is half-open: one probe request is let
+    through, and its success closes the circuit while its failure re-opens it for
+    another `reset_timeout`. A probe that never reports back frees the slot for a
+    new probe after the same timeout.
+    """
+
+    def __init__(self) -> None:
+        self._circuits: Dict[str, _Circuit] = {}
+        self._lock = threading.Lock()
+
+    def allow(self, host: str, reset_timeout: float) -> bool:
+        """Whether a request to host may be sent now; may claim the half-open probe."""
+        with self._lock:
+            circuit = self._circuits.get(host)
+            if circuit is None or circuit.opened_at is None:
+                return True
+            now = time.monotonic()
+            if now - circuit.opened_at < reset_timeout:
+                return False
+            if (
+                circuit.probe_started is not None
+                and now - circuit.probe_started < reset_timeout
+            ):
+                return False
+            circuit.probe_started = now
+            return True
+
+    def is_open(self, host: str, reset_timeout: float) -> bool:
+        """Whether requests to host are currently refused (probe in flight included)."""
+        with self._lock:
+            circuit = self._circuits.get(host)
+            if circuit is None or circuit.opened_at is None:
+                return False
+            now = time.monotonic()
+            return now - circuit.opened_at < reset_timeout or (
+                circuit.probe_started is not None
+                and now - circuit.probe_started < reset_timeout
+            )
+
+    def record_success(self, host: str) -> None:
+        with self._lock:
+            self._circuits.pop(host, None)
+
+    def record_failure(self, host: str, threshold: int) -> bool:
+        """Count a failed attempt; returns True if it (re)opened the circuit."""
+        with self._lock:
+            circuit = self._circuits.setdefault(host, _Circuit())
+            circuit.failures += 1
+            if circuit.opened_at is None and circuit.failures < threshold:
+                return False
+            circuit.opened_at = time.monotonic()
+            circuit.probe_started = None
+            return True
+
+    def reset(self, host: Optional[str] = None) -> None:
+        """Close the circuit for one host, or for all hosts."""
+        with self._lock:
+            if host is None:
+                self._circuits.clear()
+            else:
+                self._circuits.pop(host, None)
@@ -1,10 +1,13 @@
 from pathlib import Path
 import subprocess
+import tempfile
 from typing import Iterable, Optional
 
 from ..config import AppConfig
 from ..models.series import Series
 from ..utils.logger import logger
+from .download_workspace import DownloadWorkspace
+from .file_manager import FileManager
 
 
 class ConvertorManager:
@@ -39,6 +42,56 @@ class ConvertorManager:
             return False
         return True
 
+    @staticmethod
+    def remux_stream(chunks: Iterable[bytes], output_file_path: str) -> bool:
+        """Pipe MPEG-TS bytes, in order, into one ffmpeg remux to output_file_path.
+
+        Nothing is staged on disk besides the output; ffmpeg reads as fast as
+        `chunks` produces, and a full pipe blocks the producer instead of
+        buffering. On any failure (`chunks` raising, ffmpeg exiting early or
+        with an error) the partial output is removed, so it cannot be taken
+        for a finished file; an error from `chunks` also kills ffmpeg and
+        propagates.
+        """
+        Path(output_file_path).parent.mkdir(parents=True, exist_ok=True)
+        succeeded = False
+        # stderr goes to a file: a pipe nobody drains would stall ffmpeg.
+        with tempfile.TemporaryFile() as stderr:
+            process = subprocess.Popen(
+                ConvertorManager._build_pipe_command(output_file_path),
+                stdin=subprocess.PIPE,
+                stdout=subprocess.DEVNULL,
+                stderr=stderr,
+            )
+            try:
+                try:
+                    for chunk in chunks:
+                        process.stdin.write(chunk)
+                except BrokenPipeError:
+                    # ffmpeg exited early; its status and stderr say why.
+                    pass
+                except BaseException:
+                    process.kill()
+                    raise
+                finally:
+                    try:
+                        process.stdin.close()
+                    except BrokenPipeError:
+                        pass
+                    returncode = process.wait()
+                if returncode != 0:
+                    stderr.seek(0)
+                    logger.error(
+                        "Error during streaming remux: %s",
+                        stderr.read().decode("utf-8", errors="replace"),
+                    )
+                    return False
+                succeeded = True
+            finally:
+                if not succeeded:
+                    Path(output_file_path).unlink(missing_ok=True)
+        return True
+
     @staticmethod
     def concatenate_segments_ts(
         segment_files: Iterable[str],
@@ -95,6 +148,20 @@ class ConvertorManager:
             output_file_path,
         ]
 
+    @staticmethod
+    def _build_pipe_command(output_file_path: str) -> list[str]:
+        return [
+            "ffmpeg",
+            "-y",
+            "-f",
+            "mpegts",
+            "-i",
+            "pipe:0",
+            "-c",
+            "copy",
+            output_file_path,
+        ]
+
     @staticmethod
     def _concatenate(
         segment_files: Iterable[str],
@@ -102,16 +169,26 @@ class ConvertorManager:
         filename: str,
         extension: str,
     ) -> Optional[str]:
+        segment_files = list(segment_files)
         if not segment_files:
             logger.error("No segment files provided for concatenation.")
             return None
         output_dir = Path(media_dir)
         output_dir.mkdir(parents=True, exist_ok=True)
         output_file = output_dir / f"{filename}.{extension}"
+        if extension == "ts" and all(
+            FileManager.is_ts_aligned(f) for f in segment_files
+        ):
+            # Whole TS packets join byte-for-byte; no remux, no ffmpeg.
+            if FileManager.concatenate_files(segment_files, str(output_file)):
+                DownloadWorkspace.discard(segment_files)
+                return str(output_file)
+            return None
         input_txt_path = output_dir / f"{filename}_input.txt"
         ConvertorManager.create_input_file_for_concatenation(
             segment_files, str(input_txt_path)
         )
         if ConvertorManager.concatenate_to_mkv(str(input_txt_path), str(output_file)):
+            DownloadWorkspace.discard(segment_files)
             return str(output_file)
         return None
@@ -0,0 +1,114 @@
+"""Per-download record of completed segments."""
+
+import hashlib
+import json
+import os
+import threading
+from pathlib import Path
+from typing import Dict, Optional
+
+from ..utils.logger import logger
+
+
+class DownloadManifest:
+    """JSON manifest of the segments of one download that landed intact.
+
+    Each entry holds a segment's file, its byte length (and the length the
+    server announced, if any) and a SHA-256 of its contents. The manifest is
+    rewritten atomically after every recorded segment, so after a crash it
+    lists exactly the segments that can be kept.
+    """
+
+    VERSION = 1
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self._segments: Dict[str, dict] = {}
+        self._lock = threading.Lock()
+        self._load()
+
+    def verified(self, uri: str, file_path: str) -> bool:
+        """Whether uri was recorded as file_path and the file still matches."""
+        with self._lock:
+            entry = self._segments.get(uri)
+        if entry is None or entry["path"] != str(file_path):
+            return False
+        try:
+            if os.path.getsize(file_path) != entry["size"]:
+                return False
+            return self.checksum(file_path) == entry["sha256"]
+        except OSError:
+            return False
+
+    def record(
+        self,
+        uri: str,
+        file_path: str,
+        size: int,
+        sha256: str,
+        expected_size: Optional[int] = None,
+    ) -> None:
+        with self._lock:
+            self._segments[uri] = {
+                "path": str(file_path),
+                "size": size,
+                "expected_size": expected_size,
+                "sha256": sha256,
+            }
+            self._save()
+
+    def alias(self, uri: str, other_uri: str) -> None:
+        """Record other_uri as the same content as the recorded uri.
+
+        Used when a download moves to a mirror serving identical segments
+        under different URLs, so the segments already on disk are kept.
+        """
+        with self._lock:
+            entry = self._segments.get(uri)
+            if entry is None:
+                return
+            self._segments[other_uri] = dict(entry)
+            self._save()
+
+    def reset(self) -> None:
+        """Forget every segment, e.g. to force a full re-download."""
+        with self._lock:
+            self._segments.clear()
+            self._save()
+
+    def remove(self) -> None:
+        """Delete the manifest file once the download is no longer needed."""
+        try:
+            self.path.unlink()
+        except FileNotFoundError:
+            pass
+
+    @staticmethod
+    def checksum(file_path: str) -> str:
+        digest = hashlib.sha256()
+        with open(file_path, "rb") as f:
+            for chunk in iter(lambda: f.read(1024 * 1024), b""):
+                digest.update(chunk)
+        return digest.hexdigest()
+
+    def _load(self) -> None:
+        if not self.path.exists():
+            return
+        try:
+            data = json.loads(self.path.read_text(encoding="utf-8"))
+            if data.get("version") == self.VERSION:
+                self._segments = data["segments"]
+        except (OSError, ValueError, KeyError, AttributeError) as e:
+            logger.warning(f"Ignoring unreadable download manifest {self.path}: {e}")
+
+    def _save(self) -> None:
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.path.with_suffix(f"{self.path.suffix}.tmp")
+            tmp_path.write_text(
+                json.dumps({"version": self.VERSION, "segments": self._segments}),
+                encoding="utf-8",
+            )
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            logger.warning(f"Failed to persist download manifest {self.path}: {e}")
@@ -0,0 +1,148 @@
+"""Per-download scratch directories and the disk budget they share."""
+
+import hashlib
+import re
+import shutil
+import threading
+import time
+from pathlib import Path
+from typing import Dict, Iterable, Optional
+
+from ..config import config
+from ..utils.logger import logger
+
+
+class DownloadWorkspace:
+    """Scratch directory holding one episode's segments until they are joined.
+
+    Every job gets its own directory under DownloadConfig.work_root, keyed by
+    provider, title, studio and episode, so concurrent downloads whose
+    segments share file names never touch each other's files. All workspaces
+    in the process draw on one disk budget: before a segment is fetched,
+    `ensure_room` waits until the bytes held by every open workspace are under
+    DownloadConfig.disk_budget_bytes and the disk keeps min_free_bytes free.
+    Segments already in flight can overshoot the budget by up to one segment
+    per worker.
+    """
+
+    _used: Dict[Path, int] = {}
+    _room = threading.Condition()
+
+    def __init__(
+        self,
+        provider: Optional[str] = None,
+        title: Optional[str] = None,
+        studio: Optional[str] = None,
+        episode: Optional[str] = None,
+    ):
+        parts = [
+            self._slug(part)
+            for part in (provider, title, studio, episode)
+            if part is not None and str(part).strip()
+        ]
+        self.path = (
+            Path(config.download.work_root).joinpath(*(parts or ["default"])).resolve()
+        )
+        self.path.mkdir(parents=True, exist_ok=True)
+        with self._room:
+            # Segments kept from an interrupted run count against the budget.
+            self._used[self.path] = sum(
+                f.stat().st_size for f in self.path.rglob("*") if f.is_file()
+            )
+
+    @classmethod
+    def for_series(cls, series, provider: Optional[str] = None) -> "DownloadWorkspace":
+        """Workspace for one episode of a Series.
+
+        Series carry no title of their own, so unless one was attached the
+        page URL stands in for it; studio and episode label alone would put
+        the same episode of two shows in one directory.
+        """
+        title = getattr(series, "title", None) or series.url
+        return cls(
+            provider or series.provider, title, series.studio_name, series.series
+        )
+
+    @classmethod
+    def for_url(cls, url: str, provider: Optional[str] = None) -> "DownloadWorkspace":
+        """Workspace for a job known only by its playlist or page URL."""
+        return cls(provider, episode=url)
+
+    def file(self, name: str) -> str:
+        return str(self.path / name)
+
+    def ensure_room(self) -> None:
+        """Block until the disk budget allows another segment.
+
+        Raises:
+            Exception: If no room frees up within DownloadConfig.disk_wait_seconds
+        """
+        download_config = config.download
+        deadline = time.monotonic() + download_config.disk_wait_seconds
+        with self._room:
+            while not self._has_room():
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise Exception(
+                        f"Disk budget exhausted for download in {self.path}"
+                    )
+                # Free space can also change outside this process; poll it.
+                self._room.wait(min(remaining, 5.0))
+
+    def charge(self, nbytes: int, replaced: int = 0) -> None:
+        """Count a file of nbytes written into this workspace.
+
+        Args:
+            nbytes: Size of the file written
+            replaced: Size of the file it overwrote (a re-downloaded segment),
+                which stops counting
+        """
+        with self._room:
+            self._used[self.path] = self._used.get(self.path, 0) + nbytes - replaced
+            if replaced > nbytes:
+                self._room.notify_all()
+
+    def cleanup(self) -> None:
+        """Delete the workspace and give its bytes back to the budget."""
+        shutil.rmtree(self.path, ignore_errors=True)
+        with self._room:
+            self._used.pop(self.path, None)
+            self._room.notify_all()
+
+    @classmethod
+    def discard(cls, segment_files: Iterable[str]) -> None:
+        """Remove the workspaces holding segment_files, e.g. after concatenation.
+
+        Files outside DownloadConfig.work_root are left alone.
+        """
+        work_root = Path(config.download.work_root).resolve()
+        for directory in {Path(f).resolve().parent for f in segment_files}:
+            if directory != work_root and work_root in directory.parents:
+                logger.info("Removing download workspace %s", directory)
+                shutil.rmtree(directory, ignore_errors=True)
+                with cls._room:
+                    cls._used.pop(directory, None)
+                    cls._room.notify_all()
+
+    @classmethod
+    def used_bytes(cls) -> int:
+        with cls._room:
+            return sum(cls._used.values())
+
+    def _has_room(self) -> bool:
+        download_config = config.download
+        budget = download_config.disk_budget_bytes
+        if budget is not None and sum(self._used.values()) >= budget:
+            return False
+        free = shutil.disk_usage(self.path).free
+        return free >= download_config.min_free_bytes
+
+    @staticmethod
+    def _slug(value) -> str:
+        """Filesystem-safe directory name for value, unique even after cleaning."""
+        text = str(value)
+        slug = re.sub(r"[^\w.-]+", "_", text, flags=re.UNICODE).strip("._")[:60]
+        if slug == text:
+            return slug
+        digest = hashlib.sha1(text.encode("utf-8")).hexdigest()[:8]
+        return f"{slug}-{digest}" if slug else digest
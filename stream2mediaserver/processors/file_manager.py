@@ -1,37 +1,310 @@
+import errno
 import os
-import urllib.request
+import re
+import shutil
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 
+from ..config import config
 from ..utils.logger import logger
+from .request_manager import RequestManager
+
+TS_PACKET_SIZE = 188
+TS_SYNC_BYTE = b"\x47"
+COPY_BUFFER_SIZE = 1024 * 1024
+# Errors meaning the kernel cannot copy between these files (old kernel,
+# filesystem without support, cross-device); fall back to a userspace copy.
+_NO_KERNEL_COPY = {
+    errno.ENOSYS,
+    errno.EXDEV,
+    errno.EINVAL,
+    errno.EOPNOTSUPP,
+    errno.ENOTSOCK,
+}
 
 
 class FileManager:
     @staticmethod
-    def download_file(url, destination_folder, file_name):
-        if not os.path.exists(destination_folder):
-            os.makedirs(
-                destination_folder, exist_ok=True
-            )  # Use exist_ok to avoid race conditions
+    def download_file(
+        url, destination_folder, file_name, parts=None, progress=None, headers=None
+    ):
+        """Download url to destination_folder/file_name without holding it in memory.
+
+        The body is streamed through RequestManager (impersonated session,
+        retries, circuit breaker) into `<file>.part`, which is renamed into
+        place only once its length matches Content-Length. A .part file left by
+        an interrupted run is resumed with a Range request. When the server
+        accepts ranges and the file is large enough, it is fetched as several
+        byte ranges in parallel, each resumable on its own, and joined at the end.
+
+        Args:
+            url: File URL
+            destination_folder: Directory to save into (created if missing)
+            file_name: Name of the saved file
+            parts: Parallel byte-range parts; defaults to DownloadConfig.file_parts
+            progress: Called as progress(bytes_done, total_bytes_or_None)
+            headers: Extra request headers (e.g. Referer)
+
+        Returns:
+            The saved file's path, or None on failure
+        """
+        os.makedirs(destination_folder, exist_ok=True)
         file_path = os.path.join(destination_folder, file_name)
-        req = urllib.request.Request(url)
-        try:
-            with (
-                urllib.request.urlopen(req) as response,
-                open(file_path, "wb") as out_file,
-            ):
-                out_file.write(response.read())
-        except urllib.error.URLError as e:
-            logger.error(f"Failed to download the file from {url}. Error: {e}")
+        part_path = f"{file_path}.part"
+        download_config = config.download
+
+        probe = RequestManager.head(url, headers=headers)
+        total = FileManager._content_length(probe)
+        ranged = (
+            probe is not None
+            and probe.headers.get("Accept-Ranges", "").lower() == "bytes"
+        )
+        parts = max(1, download_config.file_parts if parts is None else parts)
+        if not ranged or total is None:
+            parts = 1
+        else:
+            parts = min(parts, max(1, total // max(1, download_config.min_part_bytes)))
+
+        tracker = _Progress(total, progress)
+        if parts == 1:
+            # Open-ended: the length is checked against `total` below.
+            ok = FileManager._download_range(
+                url, part_path, 0, None, ranged, headers, tracker
+            )
+        else:
+            bounds = [total * i // parts for i in range(parts + 1)]
+            ranges = [
+                (f"{part_path}{i}", bounds[i], bounds[i + 1] - 1) for i in range(parts)
+            ]
+            with ThreadPoolExecutor(
+                max_workers=parts, thread_name_prefix="file-part"
+            ) as executor:
+                results = list(
+                    executor.map(
+                        lambda r: FileManager._download_range(
+                            url, r[0], r[1], r[2], True, headers, tracker
+                        ),
+                        ranges,
+                    )
+                )
+            ok = all(results) and bool(
+                FileManager.concatenate_files([r[0] for r in ranges], part_path)
+            )
+            if ok:
+                for path, _, _ in ranges:
+                    os.remove(path)
+
+        if not ok:
+            logger.error(f"Failed to download the file from {url}.")
+            return None
+        size = os.path.getsize(part_path)
+        total = tracker.total
+        if total is not None and size != total:
+            logger.error(
+                f"Download of {url} is {size} bytes, expected {total}; discarding it."
+            )
+            os.remove(part_path)
             return None
+        os.replace(part_path, file_path)
+        logger.info(f"Downloaded {url} to {file_path} ({size} bytes).")
         return file_path
 
+    @staticmethod
+    def _download_range(url, path, start, end, ranged, headers, tracker):
+        """Fetch bytes start..end (end None: to EOF) of url into path, resuming it.
+
+        A resumed request's body goes to `<path>.tail` and is appended only
+        once the server has answered 206. A server that ignores the Range and
+        answers 200 has sent the whole file, which replaces path as a fresh
+        download instead of being fetched again. For a whole-file download
+        (start 0, end None) a resume is attempted even if the HEAD probe did
+        not advertise ranges, and the length is learnt from the GET when the
+        probe did not give it.
+
+        Returns:
+            True once path holds the whole range
+        """
+        length = None if end is None else end - start + 1
+        whole_file = start == 0 and end is None
+        tail_path = f"{path}.tail"
+        confirmed = False  # a 206 seen: a broken resume's tail can be trusted
+        retries = max(0, config.download.file_retries)
+        for attempt in range(retries + 1):
+            have = os.path.getsize(path) if os.path.exists(path) else 0
+            if not (ranged or whole_file) or (length is not None and have > length):
+                have = 0
+            tracker.update(path, have)
+            if length is not None and have == length:
+                return True
+            request_headers = dict(headers or {})
+            if have or start or end is not None:
+                last = "" if end is None else end
+                request_headers["Range"] = f"bytes={start + have}-{last}"
+            target = tail_path if have else path
+            with open(target, "wb") as f:
+
+                def sink(chunk):
+                    f.write(chunk)
+                    tracker.advance(path, len(chunk))
+
+                response = RequestManager.stream(
+                    url, sink, headers=request_headers, throttle=False
+                )
+            status = None if response is None else response.status_code
+            if status == 206:
+                confirmed = True
+            if whole_file and length is None and response is not None:
+                length = FileManager._full_length(response)
+                if length is not None and tracker.total is None:
+                    tracker.total = length
+            if "Range" in request_headers and status is not None and status != 206:
+                if not whole_file:
+                    # The whole file came back for one part; it cannot be used.
+                    logger.warning(f"{url} ignored the Range request for a part.")
+                    os.remove(target)
+                    tracker.update(path, 0)
+                    return False
+                # The server ignored the range and sent the whole file: keep
+                # it as a fresh download rather than transfer it again.
+                logger.warning(f"{url} ignored the Range request; restarted it.")
+                os.replace(target, path)
+                tracker.update(path, os.path.getsize(path))
+                ranged = False
+            elif target == tail_path:
+                if response is not None or confirmed:
+                    # Not "ab": copy_file_range refuses O_APPEND targets.
+                    with open(path, "r+b") as out, open(tail_path, "rb") as tail:
+                        out.seek(0, os.SEEK_END)
+                        FileManager._append(tail, out)
+                os.remove(tail_path)
+                tracker.update(path, os.path.getsize(path))
+            if response is not None and (
+                length is None or os.path.getsize(path) == length
+            ):
+                return True
+            if attempt < retries:
+                wait = min(2.0**attempt, RequestManager.MAX_RETRY_WAIT)
+                logger.warning(
+                    f"Transfer of {url} broke off, resuming in {wait:.0f}s "
+                    f"({attempt + 1}/{retries})"
+                )
+                time.sleep(wait)
+        return False
+
+    @staticmethod
+    def _full_length(response):
+        """Size of the whole file from a GET answer (200 or 206), if stated."""
+        if response.status_code == 206:
+            match = re.search(r"/(\d+)\s*$", response.headers.get("Content-Range", ""))
+            return int(match.group(1)) if match else None
+        return FileManager._content_length(response)
+
+    @staticmethod
+    def _content_length(response):
+        if response is None or response.headers.get("Content-Encoding"):
+            return None
+        try:
+            return int(response.headers.get("Content-Length"))
+        except (TypeError, ValueError):
+            return None
+
     @staticmethod
     def concatenate_files(segment_files, output_file):
+        """Append segment_files into output_file in one sequential pass.
+
+        Data is moved by the kernel (copy_file_range, else sendfile) where the
+        platform allows it, and otherwise copied in bounded chunks; a segment
+        is never read into memory whole.
+        """
         try:
             with open(output_file, "wb") as outfile:
                 for segment_file in segment_files:
                     with open(segment_file, "rb") as readfile:
-                        outfile.write(readfile.read())
-        except IOError as e:
+                        FileManager._append(readfile, outfile)
+        except OSError as e:
             logger.error(f"Error during file concatenation. Error: {e}")
             return None
         return output_file
+
+    @staticmethod
+    def is_ts_aligned(file_path):
+        """Whether file_path looks like whole 188-byte MPEG-TS packets.
+
+        Checks the length and the sync byte of the first and last packets;
+        concatenating such files byte-for-byte yields a valid stream.
+        """
+        try:
+            size = os.path.getsize(file_path)
+            if size == 0 or size % TS_PACKET_SIZE:
+                return False
+            with open(file_path, "rb") as f:
+                first = f.read(1)
+                f.seek(size - TS_PACKET_SIZE)
+                last = f.read(1)
+        except OSError:
+            return False
+        return first == last == TS_SYNC_BYTE
+
+    @staticmethod
+    def _append(readfile, outfile):
+        outfile.flush()
+        size = os.fstat(readfile.fileno()).st_size
+        start = os.fstat(outfile.fileno()).st_size
+        try:
+            FileManager._kernel_copy(readfile.fileno(), outfile.fileno(), size)
+        except OSError as e:
+            if e.errno not in _NO_KERNEL_COPY:
+                raise
+        # Measured on the output, so bytes moved before a failed call count too.
+        copied = os.fstat(outfile.fileno()).st_size - start
+        if copied < size:
+            # Resume after whatever the kernel already moved.
+            readfile.seek(copied)
+            outfile.seek(0, os.SEEK_END)
+            shutil.copyfileobj(readfile, outfile, COPY_BUFFER_SIZE)
+            outfile.flush()
+
+    @staticmethod
+    def _kernel_copy(in_fd, out_fd, size):
+        """Copy size bytes from in_fd's start to out_fd's end; returns bytes moved."""
+        copied = 0
+        if hasattr(os, "copy_file_range"):
+            while copied < size:
+                sent = os.copy_file_range(in_fd, out_fd, size - copied, copied)
+                if sent == 0:
+                    break
+                copied += sent
+        elif hasattr(os, "sendfile"):
+            while copied < size:
+                sent = os.sendfile(out_fd, in_fd, copied, size - copied)
+                if sent == 0:
+                    break
+                copied += sent
+        return copied
+
+
+class _Progress:
+    """Thread-safe byte counter across the parts of one download."""
+
+    def __init__(self, total, callback):
+        self.total = total
+        self._callback = callback
+        self._done = {}
+        self._lock = threading.Lock()
+
+    def update(self, part, nbytes):
+        with self._lock:
+            self._done[part] = nbytes
+            done = sum(self._done.values())
+        self._report(done)
+
+    def advance(self, part, nbytes):
+        with self._lock:
+            self._done[part] = self._done.get(part, 0) + nbytes
+            done = sum(self._done.values())
+        self._report(done)
+
+    def _report(self, done):
+        if self._callback is not None:
+            self._callback(done, self.total)
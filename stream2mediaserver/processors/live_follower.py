@@ -0,0 +1,126 @@
+"""Incremental download of HLS playlists that are still being published."""
+
+import threading
+import time
+from typing import Optional
+
+from ..config import config
+from ..utils.logger import logger
+from .m3u8_manager import M3U8Manager
+from .segment_downloader import SegmentDownloader
+from .variant_policy import VariantPolicy
+
+
+class LiveFollower:
+    """Follows a live or event media playlist, appending new segments to a file.
+
+    The playlist is re-polled every target duration (half of it when nothing
+    changed, as RFC 8216 suggests). Only segments whose media sequence number
+    is past the last one written are fetched, and they are appended to the
+    output in order, so the work and memory of each poll scale with the new
+    segments alone. Each poll bypasses the HTTP cache, and a poll that fails
+    is logged and retried like an unchanged one. Following ends at
+    #EXT-X-ENDLIST, when `stop` is set, or once the playlist has not grown
+    (or could not be fetched) for DownloadConfig.live_idle_seconds.
+    Segments are joined byte-for-byte, so the output is an MPEG-TS stream.
+    """
+
+    def __init__(
+        self,
+        media_url: str,
+        output_file: str,
+        stop: Optional[threading.Event] = None,
+    ):
+        """Initialize the follower.
+
+        Args:
+            media_url: URL of the media (not master) playlist
+            output_file: File the segments are appended to; created if missing
+            stop: Set from another thread to stop after the current poll
+        """
+        self.media_url = media_url
+        self.output_file = output_file
+        self.stop = stop or threading.Event()
+        # Media sequence number of the last segment written; None before the first.
+        self.last_sequence: Optional[int] = None
+
+    @classmethod
+    def from_master(
+        cls,
+        m3u8_url: str,
+        output_file: str,
+        stop: Optional[threading.Event] = None,
+        policy: Optional[VariantPolicy] = None,
+    ) -> "LiveFollower":
+        """Follower for the variant of m3u8_url that VariantPolicy picks.
+
+        Live variants cannot be sized up front, so the policy's throughput
+        mode does not apply here.
+        """
+        master_m3u8 = M3U8Manager.load_m3u8(m3u8_url)
+        if not master_m3u8.is_variant:
+            return cls(m3u8_url, output_file, stop)
+        chosen = M3U8Manager.choose_variant(
+            master_m3u8, policy or VariantPolicy.from_config()
+        )
+        return cls(chosen.absolute_uri, output_file, stop)
+
+    def run(self) -> int:
+        """Follow the playlist until it ends, stops growing, or stop is set.
+
+        Returns:
+            Number of segments appended
+
+        Raises:
+            Exception: If a new segment cannot be downloaded
+        """
+        written = 0
+        idle_since = time.monotonic()
+        downloader = SegmentDownloader()
+        target = 10
+        while True:
+            new_urls = []
+            try:
+                playlist = M3U8Manager.load_m3u8(self.media_url, fresh=True)
+            except Exception as e:
+                logger.warning("Polling live playlist %s failed: %s", self.media_url, e)
+            else:
+                new_urls = self._new_segments(playlist)
+                if new_urls:
+                    written += self._append(downloader, new_urls)
+                    idle_since = time.monotonic()
+                if playlist.is_endlist:
+                    logger.info("Live playlist %s ended", self.media_url)
+                    break
+                target = playlist.target_duration or 10
+            if time.monotonic() - idle_since > config.download.live_idle_seconds:
+                logger.warning(
+                    "Live playlist %s stopped growing, giving up", self.media_url
+                )
+                break
+            if self.stop.wait(target if new_urls else target / 2):
+                break
+        return written
+
+    def _new_segments(self, playlist) -> list:
+        first = playlist.media_sequence or 0
+        if self.last_sequence is None:
+            self.last_sequence = first - 1
+        elif first > self.last_sequence + 1:
+            logger.warning(
+                "Live playlist %s dropped segments %d-%d before they were fetched",
+                self.media_url,
+                self.last_sequence + 1,
+                first - 1,
+            )
+            self.last_sequence = first - 1
+        skip = self.last_sequence + 1 - first
+        return [segment.absolute_uri for segment in playlist.segments[skip:]]
+
+    def _append(self, downloader: SegmentDownloader, urls: list) -> int:
+        with open(self.output_file, "ab") as f:
+            for body in downloader.iter_bodies(urls):
+                f.write(body)
+                self.last_sequence += 1
+        logger.info("Appended %d live segments to %s", len(urls), self.output_file)
+        return len(urls)
@@ -1,12 +1,19 @@
 """M3U8 playlist processing manager."""
 
-import os
+import asyncio
 import re
+import time
+from pathlib import Path
 
 import m3u8
 
 from ..utils.logger import logger
-from .request_manager import RequestManager
+from .covertor_manager import ConvertorManager
+from .download_manifest import DownloadManifest
+from .download_workspace import DownloadWorkspace
+from .request_manager import AsyncRequestManager, RequestManager
+from .segment_downloader import SegmentDownloader
+from .variant_policy import VariantPolicy
 
 
 class M3U8Manager:
@@ -14,25 +21,69 @@ class M3U8Manager:
         self.request_manager = RequestManager()
 
     @staticmethod
-    def load_m3u8(url, headers=None):
-        headers = (
-            headers
-            if headers is not None
-            else {
-                "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/58.0.3029.110 Safari/537.36"
-            }
+    def load_m3u8(url, headers=None, fresh=False):
+        """Fetch and parse the playlist at url through RequestManager.
+
+        Pass fresh=True for playlists that change between fetches (live ones),
+        so the HTTP cache cannot answer with an earlier copy.
+
+        Raises:
+            Exception: If the playlist cannot be fetched
+        """
+        return M3U8Manager._parse(
+            url, RequestManager.get(url, headers=headers, fresh=fresh)
         )
-        return m3u8.load(url, headers=headers)
 
     @staticmethod
-    def get_best_quality_playlist(master_m3u8):
-        highest_bandwidth = 0
-        highest_quality_playlist = None
-        for playlist in master_m3u8.playlists:
-            if playlist.stream_info.bandwidth > highest_bandwidth:
-                highest_bandwidth = playlist.stream_info.bandwidth
-                highest_quality_playlist = playlist
-        return highest_quality_playlist
+    def _parse(url, response):
+        if not response or not response.ok:
+            raise Exception(f"Failed to load playlist: {url}")
+        # Relative segment URIs resolve against where redirects ended up.
+        return m3u8.loads(response.text, uri=str(getattr(response, "url", "") or url))
+
+    @staticmethod
+    def get_best_quality_playlist(
+        master_m3u8, policy=None, duration=None, throughput=None
+    ):
+        """Variant to download under policy (DownloadConfig's by default).
+
+        With no caps configured this is the highest-bandwidth variant.
+        """
+        policy = policy or VariantPolicy.from_config()
+        return policy.select(master_m3u8.playlists, duration, throughput)
+
+    @staticmethod
+    def measure_throughput(segment_url):
+        """Bytes/s achieved fetching segment_url once; None if it failed.
+
+        A single connection is timed, so parallel segment downloads usually do
+        better; the estimate errs on the safe side.
+        """
+        timing = M3U8Manager.time_segment(segment_url)
+        return timing[2] if timing else None
+
+    @staticmethod
+    def time_segment(segment_url):
+        """Fetch segment_url once, discarding the body, and time it.
+
+        Returns:
+            (seconds to first byte, body size, bytes/s), or None if it failed
+        """
+        received = 0
+        first_byte = None
+
+        def sink(chunk):
+            nonlocal received, first_byte
+            if first_byte is None:
+                first_byte = time.monotonic()
+            received += len(chunk)
+
+        started = time.monotonic()
+        response = RequestManager.stream(segment_url, sink, throttle=False)
+        elapsed = time.monotonic() - started
+        if not response or not received or elapsed <= 0:
+            return None
+        return first_byte - started, received, received / elapsed
 
     @staticmethod
     def get_master_playlist(series_url, headers=None):
@@ -54,30 +105,195 @@ class M3U8Manager:
         return None
 
     @staticmethod
-    def download_series_content(m3u8_url):
-        os.makedirs("media", exist_ok=True)
+    def load_media_playlist(m3u8_url, policy=None):
+        """Load the variant playlist of the master at m3u8_url chosen by policy.
 
+        In the policy's throughput mode the lightest variant is loaded first to
+        learn the stream's duration and time the download of one segment.
+        """
+        policy = policy or VariantPolicy.from_config()
         master_m3u8 = M3U8Manager.load_m3u8(m3u8_url)
-        highest_quality_playlist = M3U8Manager.get_best_quality_playlist(master_m3u8)
+        if not master_m3u8.is_variant:
+            return master_m3u8
+        duration = throughput = None
+        if policy.measures_throughput and master_m3u8.playlists:
+            probe = M3U8Manager.load_m3u8(
+                M3U8Manager._lightest(master_m3u8).absolute_uri
+            )
+            duration, throughput = M3U8Manager._probe_speed(probe)
+        chosen = M3U8Manager.choose_variant(master_m3u8, policy, duration, throughput)
+        return M3U8Manager.load_m3u8(chosen.absolute_uri)
+
+    @staticmethod
+    def _lightest(master_m3u8):
+        return min(master_m3u8.playlists, key=lambda p: p.stream_info.bandwidth or 0)
+
+    @staticmethod
+    def _probe_speed(playlist_m3u8):
+        """(stream duration, bytes/s fetching its first segment) of a media playlist."""
+        duration = sum(segment.duration or 0 for segment in playlist_m3u8.segments)
+        throughput = None
+        if playlist_m3u8.segments:
+            throughput = M3U8Manager.measure_throughput(
+                playlist_m3u8.segments[0].absolute_uri
+            )
+        return duration, throughput
+
+    @staticmethod
+    def choose_variant(master_m3u8, policy, duration=None, throughput=None):
+        """get_best_quality_playlist, raising if the master lists no variant."""
+        chosen = M3U8Manager.get_best_quality_playlist(
+            master_m3u8, policy, duration, throughput
+        )
 
-        if highest_quality_playlist is None:
+        if chosen is None:
             raise Exception("No available streams found in the playlist")
 
-        playlist_m3u8 = M3U8Manager.load_m3u8(highest_quality_playlist.uri)
-        segment_files = []
+        logger.info(
+            "Selected variant %s (%s bit/s)", chosen.uri, chosen.stream_info.bandwidth
+        )
+        return chosen
+
+    @staticmethod
+    def download_series_content(m3u8_url, resume=True, workspace=None):
+        """Download the best-quality variant of m3u8_url into a work directory.
+
+        Finished segments are recorded in a manifest next to them; with resume,
+        segments it verifies are kept instead of being fetched again. The work
+        directory is removed once ConvertorManager has joined the segments.
 
-        for segment in playlist_m3u8.segments:
-            segment_url = segment.absolute_uri
-            file_name = os.path.join("media", segment_url.split("/")[-1])
-            logger.info("Downloading %s to %s", segment_url, file_name)
-            segment_files.append(file_name)
-            response = RequestManager.get(segment_url)
+        Args:
+            m3u8_url: Master playlist URL
+            resume: Keep verified segments from an earlier, interrupted run
+            workspace: DownloadWorkspace for this episode; defaults to one
+                keyed by m3u8_url
+
+        Returns:
+            Segment file paths in playlist order
+        """
+        if workspace is None:
+            workspace = DownloadWorkspace.for_url(m3u8_url)
 
-            if response and response.ok:
-                with open(file_name, "wb") as f:
-                    f.write(response.content)
-            else:
-                logger.warning("Failed to download segment: %s", segment_url)
+        playlist_m3u8 = M3U8Manager.load_media_playlist(m3u8_url)
+        return M3U8Manager.download_playlist(playlist_m3u8, workspace, resume)
+
+    @staticmethod
+    def download_playlist(playlist_m3u8, workspace, resume=True):
+        """Download the segments of an already loaded media playlist.
+
+        See download_series_content.
+
+        Raises:
+            Exception: If a segment cannot be downloaded
+        """
+        segments = [
+            (segment.absolute_uri, M3U8Manager.segment_file(workspace, index))
+            for index, segment in enumerate(playlist_m3u8.segments)
+        ]
+        manifest = DownloadManifest(workspace.file("manifest.json"))
+        if not resume:
+            manifest.reset()
+        segment_files = SegmentDownloader(
+            manifest=manifest, workspace=workspace
+        ).download(segments)
 
         logger.info("Download completed.")
         return segment_files
+
+    @staticmethod
+    def segment_file(workspace, index):
+        """Path of the index-th segment in workspace."""
+        # Numbered names: segment URLs of one playlist may share a basename.
+        return workspace.file(f"{index:05d}.ts")
+
+    @staticmethod
+    def remux_series_content(m3u8_url, output_file):
+        """Download the best-quality variant of m3u8_url straight into output_file.
+
+        Segments are fetched concurrently but piped to a single ffmpeg remux
+        in playlist order, so no segment file or concat list touches the disk
+        and memory stays bounded by DownloadConfig.segment_workers segments.
+        The container follows output_file's extension (e.g. .mkv). A failed
+        remux leaves no partial output_file behind.
+
+        Returns:
+            output_file if the remux succeeded, None otherwise
+
+        Raises:
+            Exception: If a segment cannot be downloaded
+        """
+        playlist_m3u8 = M3U8Manager.load_media_playlist(m3u8_url)
+        bodies = SegmentDownloader().iter_bodies(
+            [segment.absolute_uri for segment in playlist_m3u8.segments]
+        )
+        try:
+            remuxed = ConvertorManager.remux_stream(bodies, output_file)
+        except BaseException:
+            Path(output_file).unlink(missing_ok=True)
+            raise
+        finally:
+            # Stops the segment downloads still in flight.
+            bodies.close()
+        if not remuxed:
+            Path(output_file).unlink(missing_ok=True)
+            return None
+        logger.info("Remux completed: %s", output_file)
+        return output_file
+
+
+class AsyncM3U8Manager(M3U8Manager):
+    """Playlist loading on AsyncRequestManager.
+
+    Master and media playlists of many episodes (e.g. a whole season) can be
+    resolved concurrently on one event loop; the per-host connection limit
+    and pacing still apply to every request.
+    """
+
+    @staticmethod
+    async def load_m3u8(url, headers=None):
+        """Awaitable M3U8Manager.load_m3u8."""
+        response = await AsyncRequestManager.get(url, headers=headers)
+        return M3U8Manager._parse(url, response)
+
+    @staticmethod
+    async def load_media_playlist(m3u8_url, policy=None):
+        """Awaitable M3U8Manager.load_media_playlist.
+
+        The throughput probe, if the policy asks for one, runs on a thread.
+        """
+        policy = policy or VariantPolicy.from_config()
+        master_m3u8 = await AsyncM3U8Manager.load_m3u8(m3u8_url)
+        if not master_m3u8.is_variant:
+            return master_m3u8
+        duration = throughput = None
+        if policy.measures_throughput and master_m3u8.playlists:
+            probe = await AsyncM3U8Manager.load_m3u8(
+                M3U8Manager._lightest(master_m3u8).absolute_uri
+            )
+            duration, throughput = await asyncio.to_thread(
+                M3U8Manager._probe_speed, probe
+            )
+        chosen = M3U8Manager.choose_variant(master_m3u8, policy, duration, throughput)
+        return await AsyncM3U8Manager.load_m3u8(chosen.absolute_uri)
+
+    @staticmethod
+    async def resolve_media_playlists(m3u8_urls, policy=None):
+        """Load the chosen media playlist of every master in m3u8_urls at once.
+
+        Args:
+            m3u8_urls: Master (or media) playlist URLs, e.g. one per episode
+            policy: VariantPolicy for every episode; defaults to DownloadConfig's
+
+        Returns:
+            Media playlists in the order of m3u8_urls, None where loading failed
+        """
+        policy = policy or VariantPolicy.from_config()
+
+        async def resolve(url):
+            try:
+                return await AsyncM3U8Manager.load_media_playlist(url, policy)
+            except Exception as e:
+                logger.warning("Failed to resolve playlist %s: %s", url, e)
+                return None
+
+        return list(await asyncio.gather(*(resolve(url) for url in m3u8_urls)))
@@ -0,0 +1,145 @@
+"""Ranking of and failover between mirrors of the same episode."""
+
+import statistics
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import List, Optional, Sequence
+
+from ..utils.logger import logger
+from .download_manifest import DownloadManifest
+from .download_workspace import DownloadWorkspace
+from .m3u8_manager import M3U8Manager
+
+
+@dataclass
+class MirrorProbe:
+    """How one mirror answered a probe of its first media segment."""
+
+    url: str
+    playlist: object
+    ttfb: float
+    segment_bytes: int
+    throughput: float
+
+    def expected_seconds(self, segment_bytes: float) -> float:
+        """Estimated time to fetch a segment of segment_bytes from this mirror."""
+        return self.ttfb + segment_bytes / self.throughput
+
+
+class MirrorSelector:
+    """Downloads an episode from the fastest of several HLS mirrors.
+
+    Every mirror's media playlist is loaded and its first segment fetched
+    concurrently. Mirrors are ranked by the time they would take for a
+    typical segment (time to first byte plus transfer at the measured
+    throughput). The download runs from the best one; if a segment fails
+    there after its retries (a stalled transfer is aborted by the request
+    timeout), it moves to the next mirror. When both mirrors serve the same
+    encode, the segments already downloaded are kept.
+    """
+
+    @staticmethod
+    def probe(m3u8_url: str) -> Optional[MirrorProbe]:
+        """Load m3u8_url's media playlist and time its first segment.
+
+        Returns:
+            The probe, or None if the mirror failed to answer
+        """
+        try:
+            playlist = M3U8Manager.load_media_playlist(m3u8_url)
+        except Exception as e:
+            logger.warning("Mirror %s unavailable: %s", m3u8_url, e)
+            return None
+        if not playlist.segments:
+            logger.warning("Mirror %s has no segments", m3u8_url)
+            return None
+        timing = M3U8Manager.time_segment(playlist.segments[0].absolute_uri)
+        if timing is None:
+            logger.warning("Mirror %s failed to serve its first segment", m3u8_url)
+            return None
+        ttfb, segment_bytes, throughput = timing
+        return MirrorProbe(m3u8_url, playlist, ttfb, segment_bytes, throughput)
+
+    @staticmethod
+    def rank(m3u8_urls: Sequence[str]) -> List[MirrorProbe]:
+        """Probe every mirror concurrently; fastest first, failed ones left out."""
+        urls = list(dict.fromkeys(m3u8_urls))
+        if not urls:
+            return []
+        with ThreadPoolExecutor(
+            max_workers=len(urls), thread_name_prefix="mirror"
+        ) as executor:
+            probes = [p for p in executor.map(MirrorSelector.probe, urls) if p]
+        if not probes:
+            return []
+        # Score everyone on the same segment size so small first segments
+        # do not flatter a mirror.
+        reference = statistics.median(p.segment_bytes for p in probes)
+        probes.sort(key=lambda p: p.expected_seconds(reference))
+        for p in probes:
+            logger.info(
+                "Mirror %s: first byte %.2fs, %.0f KiB/s",
+                p.url,
+                p.ttfb,
+                p.throughput / 1024,
+            )
+        return probes
+
+    @staticmethod
+    def download(m3u8_urls: Sequence[str], workspace=None) -> List[str]:
+        """Download from the fastest mirror, failing over to the others.
+
+        Args:
+            m3u8_urls: Master (or media) playlist URLs of the same episode
+            workspace: DownloadWorkspace shared by all mirrors; defaults to
+                one keyed by the first URL
+
+        Returns:
+            Segment file paths in playlist order
+
+        Raises:
+            Exception: If no mirror responds or every mirror fails
+        """
+        probes = MirrorSelector.rank(m3u8_urls)
+        if not probes:
+            raise Exception("No mirror answered the probe")
+        if workspace is None:
+            workspace = DownloadWorkspace.for_url(m3u8_urls[0])
+        previous = None
+        for probe in probes:
+            if previous is not None:
+                MirrorSelector._carry_over(previous, probe, workspace)
+            try:
+                return M3U8Manager.download_playlist(probe.playlist, workspace)
+            except Exception as e:
+                logger.warning("Mirror %s failed: %s", probe.url, e)
+                previous = probe
+        raise Exception(f"All {len(probes)} mirrors failed")
+
+    @staticmethod
+    def _carry_over(failed: MirrorProbe, mirror: MirrorProbe, workspace) -> None:
+        """Keep failed's finished segments if mirror serves the same encode."""
+        if not MirrorSelector._same_encode(failed, mirror):
+            return
+        manifest = DownloadManifest(workspace.file("manifest.json"))
+        kept = 0
+        for index, (old, new) in enumerate(
+            zip(failed.playlist.segments, mirror.playlist.segments)
+        ):
+            path = M3U8Manager.segment_file(workspace, index)
+            if manifest.verified(old.absolute_uri, path):
+                manifest.alias(old.absolute_uri, new.absolute_uri)
+                kept += 1
+        logger.info("Switching to mirror %s, keeping %d segments", mirror.url, kept)
+
+    @staticmethod
+    def _same_encode(a: MirrorProbe, b: MirrorProbe) -> bool:
+        """Whether both mirrors split the same file into the same segments."""
+        if a.segment_bytes != b.segment_bytes:
+            return False
+        if len(a.playlist.segments) != len(b.playlist.segments):
+            return False
+        return all(
+            abs((x.duration or 0) - (y.duration or 0)) < 0.001
+            for x, y in zip(a.playlist.segments, b.playlist.segments)
+        )
@@ -1,32 +1,26 @@
 """MP4 file processing manager."""
 
-from bs4 import BeautifulSoup
-
+from ..parser.html_backend import css, make_soup
 from ..utils.logger import logger
 from .file_manager import FileManager
 from .request_manager import RequestManager
+from .variant_policy import VariantPolicy
+
+_SCRIPT = css("script")
 
 
 class MP4Manager:
     @staticmethod
-    def identify_best_quality(urls):
-        quality_dict = {"360p": 1, "480p": 2, "720p": 3, "1080p": 4}
-        best_quality = 0
-        best_url = ""
-        for url in urls:
-            for quality in quality_dict:
-                if f"[{quality}]" in url:
-                    if quality_dict[quality] > best_quality:
-                        best_quality = quality_dict[quality]
-                        best_url = url.split("]")[1]
-        return best_url
+    def identify_best_quality(urls, policy=None):
+        """URL of the highest "[NNNp]" rendition DownloadConfig's policy allows."""
+        return (policy or VariantPolicy.from_config()).select_ladder(urls)
 
     @staticmethod
     def get_master_playlist(series_url):
         response = RequestManager.get(series_url)
         if response and response.ok:
-            soup = BeautifulSoup(response.json()["response"], "html.parser")
-            scripts = soup.find_all("script")
+            soup = make_soup(response.json()["response"])
+            scripts = _SCRIPT.select(soup)
             for script in scripts:
                 if "Playerjs" in script.text:
                     start = script.text.find('file:"') + 6
@@ -0,0 +1,172 @@
+"""Per-host request scheduling."""
+
+import json
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Dict, Optional
+from urllib.parse import urlparse
+
+from ..utils.logger import logger
+
+
+def host_of(url: str) -> Optional[str]:
+    """Host a request is throttled under, or None if the URL cannot be parsed."""
+    try:
+        parsed = urlparse(url)
+    except Exception:
+        return None
+    return parsed.netloc or parsed.path or None
+
+
+class HostRateLimiter:
+    """Hands out per-host send slots at least `interval` seconds apart.
+
+    A caller reserves its slot under a lock held only for the bookkeeping and then
+    sleeps outside it, so a thread waiting on one host never delays requests to
+    another, and concurrent callers for the same host queue up in reservation
+    order instead of racing for the lock after every sleep.
+    """
+
+    def __init__(self) -> None:
+        self._next_slot: Dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    def reserve(self, host: str, interval: float) -> float:
+        """Claim the next free slot for host.
+
+        Args:
+            host: Host key, see host_of
+            interval: Minimum seconds between consecutive sends to host
+
+        Returns:
+            Seconds the caller must wait before sending (0 if it may send now)
+        """
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot.get(host, 0.0))
+            self._next_slot[host] = slot + interval
+        return slot - now
+
+    def defer(self, host: str, seconds: float) -> None:
+        """Hold every send to host back for at least `seconds` (e.g. Retry-After)."""
+        with self._lock:
+            resume = time.monotonic() + seconds
+            self._next_slot[host] = max(self._next_slot.get(host, 0.0), resume)
+
+    def reset(self, host: Optional[str] = None) -> None:
+        """Forget scheduled slots for one host, or for all hosts."""
+        with self._lock:
+            if host is None:
+                self._next_slot.clear()
+            else:
+                self._next_slot.pop(host, None)
+
+
+class AdaptivePacer:
+    """Per-host send interval tuned AIMD-style from observed responses.
+
+    Each host starts at `initial` seconds between requests. Every fast 2xx
+    shaves `step` off the interval (additive increase of the request rate) down
+    to `floor`; a rate-limit signal (429, 503, a Cloudflare challenge or a
+    transport error) doubles it up to `ceiling`, and a Retry-After raises it to
+    at least that many seconds. Slow successes leave it unchanged. Intervals are
+    mirrored to a JSON file when `path` is set, so the next run starts at the
+    pace each host was last found to tolerate.
+    """
+
+    # Rewriting the state file on every response would dominate bulk scrapes.
+    SAVE_INTERVAL = 10.0
+
+    def __init__(self, path: Optional[Path] = None):
+        self.path = Path(path) if path is not None else None
+        self._intervals: Dict[str, float] = {}
+        self._lock = threading.Lock()
+        self._loaded = False
+        self._last_save = 0.0
+
+    def interval(self, host: str, initial: float) -> float:
+        """Current interval for host; `initial` for hosts not seen yet."""
+        with self._lock:
+            self._load()
+            return self._intervals.get(host, initial)
+
+    def observe(
+        self,
+        host: str,
+        initial: float,
+        floor: float,
+        ceiling: float,
+        step: float,
+        backoff: bool,
+        fast: bool,
+        retry_after: Optional[float] = None,
+    ) -> float:
+        """Fold one response into host's interval and return the new interval.
+
+        Args:
+            host: Host key, see host_of
+            initial: Interval for hosts not seen yet
+            floor: Smallest interval the pacer may reach
+            ceiling: Largest interval the pacer may reach
+            step: Seconds removed per fast success
+            backoff: The response signalled overload or rate limiting
+            fast: The response was a success within the latency target
+            retry_after: Server-requested delay, if any
+        """
+        with self._lock:
+            self._load()
+            current = self._intervals.get(host, initial)
+            if backoff:
+                updated = min(ceiling, max(current * 2, floor, step))
+                if retry_after:
+                    updated = max(updated, min(retry_after, ceiling))
+            elif fast:
+                updated = max(floor, current - step)
+            else:
+                updated = current
+            self._intervals[host] = updated
+            if updated != current and (
+                backoff or time.monotonic() - self._last_save >= self.SAVE_INTERVAL
+            ):
+                self._save()
+        return updated
+
+    def reset(self, host: Optional[str] = None) -> None:
+        """Forget learned intervals for one host, or for all hosts."""
+        with self._lock:
+            self._load()
+            if host is None:
+                self._intervals.clear()
+            else:
+                self._intervals.pop(host, None)
+            self._save()
+
+    def _load(self) -> None:
+        if self._loaded:
+            return
+        self._loaded = True
+        if self.path is None or not self.path.exists():
+            return
+        try:
+            self._intervals = {
+                host: float(value)
+                for host, value in json.loads(
+                    self.path.read_text(encoding="utf-8")
+                ).items()
+            }
+        except (OSError, ValueError, AttributeError) as e:
+            logger.warning(f"Ignoring unreadable pacing state {self.path}: {e}")
+
+    def _save(self) -> None:
+        self._last_save = time.monotonic()
+        if self.path is None:
+            return
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.path.with_suffix(f"{self.path.suffix}.tmp")
+            tmp_path.write_text(json.dumps(self._intervals), encoding="utf-8")
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            logger.warning(f"Failed to persist pacing state {self.path}: {e}")
@@ -1,18 +1,26 @@
 """HTTP request management module."""
 
+import asyncio
 import threading
 import time
-from typing import Dict, Optional
-from urllib.parse import urlparse
+import weakref
+from pathlib import Path
+from typing import Callable, Optional, Tuple
 
 # curl_cffi replicates a real Chrome TLS/JA3 fingerprint. Plain `requests` is
 # fingerprinted and served a Cloudflare "Just a moment..." challenge (403) by
 # uakino.best regardless of headers.
-from curl_cffi import requests
+from curl_cffi import CurlHttpVersion, CurlOpt, requests
+from curl_cffi.curl import CURL_WRITEFUNC_ERROR
 
 from ..config import config
 from ..utils.logger import logger
 from ..utils.test_data_logger import TestDataLogger
+from .circuit_breaker import CircuitBreaker
+from .rate_limiter import AdaptivePacer, HostRateLimiter, host_of
+from .response_cache import CacheEntry, ResponseCache
+from .session_pool import HostSessionPool
+from .single_flight import AsyncSingleFlight, SingleFlight
 
 
 class RequestManager:
@@ -40,50 +48,377 @@ class RequestManager:
     }
     # Statuses worth another attempt: rate limits, and transient origin/CDN faults.
     RETRY_STATUSES = frozenset({429, 500, 502, 503, 504, 520, 521, 522, 524})
+    # Statuses that mean "slow down" rather than "this request is broken".
+    BACKOFF_STATUSES = frozenset({429, 503})
     MAX_RETRY_WAIT = 30.0
-    _session = requests.Session(impersonate="chrome")
-    _last_request_by_host: Dict[str, float] = {}
-    _host_lock = threading.Lock()
+    STREAM_CHUNK_SIZE = 256 * 1024
+    _rate_limiter = HostRateLimiter()
+    _pacer: Optional[AdaptivePacer] = None
+    _pacer_lock = threading.Lock()
+    _breaker = CircuitBreaker()
+    _pool: Optional[HostSessionPool] = None
+    _pool_lock = threading.Lock()
+    _cache: Optional[ResponseCache] = None
+    _cache_lock = threading.Lock()
+    _flights = SingleFlight()
 
     @classmethod
-    def _throttle_host(cls, url: str) -> None:
-        """Wait if needed to respect minimum delay between requests to same host."""
-        delay = config.provider_config.request_delay_seconds
+    def _session_options(cls) -> dict:
+        """Session keyword arguments derived from ProviderConfig."""
+        provider_config = config.provider_config
+        options = {
+            "impersonate": "chrome",
+            "curl_options": {
+                CurlOpt.MAXCONNECTS: max(1, provider_config.max_connections_per_host),
+                CurlOpt.MAXAGE_CONN: provider_config.keepalive_idle_seconds,
+                # Abort transfers that stall for `timeout` seconds. Streamed
+                # downloads run without an overall deadline and rely on this.
+                CurlOpt.LOW_SPEED_LIMIT: 1,
+                CurlOpt.LOW_SPEED_TIME: provider_config.timeout,
+            },
+        }
+        if provider_config.http2 is not None:
+            options["http_version"] = (
+                CurlHttpVersion.V2TLS if provider_config.http2 else CurlHttpVersion.V1_1
+            )
+        return options
+
+    @classmethod
+    def _session_pool(cls) -> HostSessionPool:
+        with cls._pool_lock:
+            if cls._pool is None:
+                cls._pool = HostSessionPool(
+                    lambda: requests.Session(**cls._session_options()),
+                    config.provider_config.max_connections_per_host,
+                )
+            return cls._pool
+
+    @classmethod
+    def reset_sessions(cls) -> None:
+        """Drop pooled sessions so the next request picks up changed ProviderConfig."""
+        with cls._pool_lock:
+            pool, cls._pool = cls._pool, None
+        if pool is not None:
+            pool.close()
+
+    @classmethod
+    def _session_for(cls, url: str):
+        return cls._session_pool().session(host_of(url) or "")
+
+    @classmethod
+    def _response_cache(cls) -> Optional[ResponseCache]:
+        """The shared on-disk cache, or None while config.http_cache.path is unset."""
+        cache_config = config.http_cache
+        if cache_config.path is None:
+            return None
+        with cls._cache_lock:
+            if cls._cache is None or cls._cache.path != Path(cache_config.path):
+                cls._cache = ResponseCache(
+                    cache_config.path,
+                    cache_config.max_bytes,
+                    cache_config.ttl_rules,
+                    cache_config.default_ttl_seconds,
+                )
+            return cls._cache
+
+    @classmethod
+    def _cache_lookup(
+        cls,
+        method: str,
+        url: str,
+        params: Optional[dict],
+        data: Optional[dict] = None,
+        fresh: bool = False,
+    ) -> Tuple[Optional[str], Optional[CacheEntry]]:
+        """Cache key and stored entry for a cacheable request, else (None, None).
+
+        GETs are cacheable; POSTs only when their form `data` is given (the
+        caller opted in for an idempotent search form), keyed on that body and
+        never revalidated, so a stale POST entry is a miss. With fresh, the
+        stored entry is ignored (the key is still returned, so the new
+        response replaces it).
+        """
+        cache = cls._response_cache()
+        if cache is None or cache.ttl_for(url) <= 0:
+            return None, None
+        if method == "GET":
+            key = cache.key(url, params)
+        elif method == "POST" and data is not None:
+            key = cache.key(url, params, data)
+        else:
+            return None, None
+        entry = None if fresh else cache.lookup(key)
+        if entry is not None and method != "GET" and not entry.fresh:
+            entry = None
+        return key, entry
+
+    @classmethod
+    def _cache_update(
+        cls, url: str, key: Optional[str], entry: Optional[CacheEntry], response
+    ):
+        """Store a fresh response, or renew and return the entry on 304 Not Modified."""
+        cache = cls._response_cache()
+        if cache is None or key is None or response is None:
+            return response
+        ttl = cache.ttl_for(url)
+        if response.status_code == 304 and entry is not None:
+            cache.refresh(key, ttl)
+            return entry.response
+        if response.status_code == 200:
+            cache.store(key, response, ttl)
+        return response
+
+    @classmethod
+    def _host_pacer(cls) -> AdaptivePacer:
+        """The shared adaptive pacer, rebuilt if pacing_state_path changes."""
+        path = config.provider_config.pacing_state_path
+        path = Path(path) if path is not None else None
+        with cls._pacer_lock:
+            if cls._pacer is None or cls._pacer.path != path:
+                cls._pacer = AdaptivePacer(path)
+            return cls._pacer
+
+    @classmethod
+    def _throttle_wait(cls, url: str) -> float:
+        """Reserve the next send slot for url's host; returns seconds to wait."""
+        provider_config = config.provider_config
+        delay = provider_config.request_delay_seconds
         if delay <= 0:
+            return 0.0
+        host = host_of(url)
+        if host is None:
+            return 0.0
+        if provider_config.adaptive_throttle:
+            delay = cls._host_pacer().interval(host, delay)
+        return cls._rate_limiter.reserve(host, delay)
+
+    @staticmethod
+    def _is_challenge(response) -> bool:
+        """Cloudflare served its bot challenge instead of the page."""
+        return (
+            response is not None
+            and response.status_code == 403
+            and "cf-mitigated" in response.headers
+        )
+
+    @classmethod
+    def circuit_open(cls, url: str) -> bool:
+        """Whether requests to url's host are being refused after repeated failures."""
+        provider_config = config.provider_config
+        host = host_of(url)
+        if host is None or provider_config.circuit_failure_threshold <= 0:
+            return False
+        return cls._breaker.is_open(host, provider_config.circuit_reset_seconds)
+
+    @classmethod
+    def _circuit_allows(cls, method: str, url: str) -> bool:
+        """Whether the next attempt may go out; logs when the host is cut off."""
+        provider_config = config.provider_config
+        host = host_of(url)
+        if host is None or provider_config.circuit_failure_threshold <= 0:
+            return True
+        if cls._breaker.allow(host, provider_config.circuit_reset_seconds):
+            return True
+        logger.warning(f"{method} {url} skipped: {host} is failing (circuit open)")
+        return False
+
+    @classmethod
+    def _observe(cls, url: str, response, error, latency: Optional[float]) -> None:
+        """Report one attempt to the host's circuit breaker and adaptive pacer."""
+        cls._record_attempt(url, response, error)
+        cls._pace_host(url, response, error, latency)
+
+    @classmethod
+    def _record_attempt(cls, url: str, response, error) -> None:
+        """Count one attempt towards closing or opening url's host circuit."""
+        provider_config = config.provider_config
+        host = host_of(url)
+        if host is None or provider_config.circuit_failure_threshold <= 0:
             return
-        try:
-            parsed = urlparse(url)
-            host = parsed.netloc or parsed.path
-        except Exception:
+        failed = (
+            error is not None
+            or response.status_code in cls.RETRY_STATUSES
+            or cls._is_challenge(response)
+        )
+        if not failed:
+            cls._breaker.record_success(host)
+        elif cls._breaker.record_failure(
+            host, provider_config.circuit_failure_threshold
+        ):
+            logger.warning(
+                f"Circuit open for {host}: refusing requests for "
+                f"{provider_config.circuit_reset_seconds:.0f}s"
+            )
+
+    @classmethod
+    def _pace_host(cls, url: str, response, error, latency: Optional[float]) -> None:
+        """Feed one attempt's outcome to the adaptive per-host pacer.
+
+        Args:
+            url: Requested URL
+            response: Response received, if any
+            error: Transport error raised, if any
+            latency: Seconds the exchange took; None if it says nothing about
+                server load (e.g. a streamed transfer bounded by the sink)
+        """
+        provider_config = config.provider_config
+        if (
+            not provider_config.adaptive_throttle
+            or provider_config.request_delay_seconds <= 0
+        ):
             return
-        with cls._host_lock:
-            last = cls._last_request_by_host.get(host, 0)
-            elapsed = time.monotonic() - last
-            if elapsed < delay:
-                sleep_time = delay - elapsed
-                time.sleep(sleep_time)
-            cls._last_request_by_host[host] = time.monotonic()
+        host = host_of(url)
+        if host is None:
+            return
+        status = response.status_code if response is not None else None
+        retry_after = cls._retry_after(response)
+        backoff = (
+            (error is not None and response is None)
+            or status in cls.BACKOFF_STATUSES
+            or retry_after is not None
+            # Cloudflare answers a client it considers too eager with a challenge.
+            or cls._is_challenge(response)
+        )
+        fast = (
+            status is not None
+            and 200 <= status < 300
+            and latency is not None
+            and latency <= provider_config.adaptive_fast_latency_seconds
+        )
+        interval = cls._host_pacer().observe(
+            host,
+            initial=provider_config.request_delay_seconds,
+            floor=provider_config.min_request_delay_seconds,
+            ceiling=provider_config.max_request_delay_seconds,
+            step=provider_config.adaptive_step_seconds,
+            backoff=backoff,
+            fast=fast,
+            retry_after=retry_after,
+        )
+        if backoff:
+            logger.info(f"Slowing requests to {host} to one per {interval:.2f}s")
+        if retry_after:
+            cls._rate_limiter.defer(
+                host, min(retry_after, provider_config.max_request_delay_seconds)
+            )
+
+    @classmethod
+    def _throttle_host(cls, url: str) -> None:
+        """Wait if needed to respect minimum delay between requests to same host."""
+        wait = cls._throttle_wait(url)
+        if wait > 0:
+            time.sleep(wait)
 
     @classmethod
     def _merge_headers(cls, headers: Optional[dict]) -> dict:
         return {**cls.DEFAULT_HEADERS, **(headers or {})}
 
+    @staticmethod
+    def _retry_after(response) -> Optional[float]:
+        """Delay a failed response asks for via Retry-After, in seconds, if any."""
+        if response is None or response.ok:
+            return None
+        retry_after = response.headers.get("Retry-After")
+        if not retry_after:
+            return None
+        try:
+            # Retry-After is either delta-seconds or an HTTP-date; only the
+            # former is worth honouring precisely, dates fall back to backoff.
+            return max(0.0, float(retry_after))
+        except ValueError:
+            return None
+
     @classmethod
     def _retry_wait(cls, response, attempt: int) -> float:
         """Seconds to wait before retrying: server's Retry-After, else exponential backoff."""
-        retry_after = response.headers.get("Retry-After") if response is not None else None
-        if retry_after:
-            try:
-                # Retry-After is either delta-seconds or an HTTP-date; only the
-                # former is worth honouring precisely, dates fall back to backoff.
-                return min(float(retry_after), cls.MAX_RETRY_WAIT)
-            except ValueError:
-                pass
+        retry_after = cls._retry_after(response)
+        if retry_after is not None:
+            return min(retry_after, cls.MAX_RETRY_WAIT)
         return min(2.0**attempt, cls.MAX_RETRY_WAIT)
 
+    @classmethod
+    def _attempt_outcome(
+        cls,
+        method: str,
+        url: str,
+        response,
+        error: Optional[Exception],
+        attempt: int,
+        attempts: int,
+        streamed: bool = False,
+    ) -> Tuple[Optional["requests.Response"], Optional[float]]:
+        """Classify one attempt as success, retry or final failure.
+
+        Shared by the blocking and async managers so both follow one retry policy.
+        Streamed bodies went to a sink, so only their metadata is logged.
+
+        Returns:
+            (response, None) on success, (None, wait) to retry after `wait`
+            seconds, (None, None) when the request has failed for good
+        """
+        last = attempt == attempts - 1
+        if error is not None:
+            if not last:
+                wait = cls._retry_wait(response, attempt)
+                logger.warning(
+                    f"{method} {url} failed ({error}), "
+                    f"retrying in {wait:.1f}s ({attempt + 1}/{attempts})"
+                )
+                return None, wait
+            TestDataLogger.log_response(response, error=str(error), body=not streamed)
+            logger.error(f"{method} request failed for {url}: {str(error)}")
+            return None, None
+        if not response.ok:
+            # Only rate limits and transient faults are worth a retry;
+            # a 404 or 403 will not become a 200 on the next attempt.
+            if response.status_code in cls.RETRY_STATUSES and not last:
+                wait = cls._retry_wait(response, attempt)
+                logger.warning(
+                    f"{method} {url} returned {response.status_code}, "
+                    f"retrying in {wait:.1f}s ({attempt + 1}/{attempts})"
+                )
+                return None, wait
+            error = f"HTTP {response.status_code}"
+            TestDataLogger.log_response(response, error=error, body=not streamed)
+            logger.error(f"{method} request failed for {url}: {error}")
+            return None, None
+        TestDataLogger.log_response(response, body=not streamed)
+        return response, None
+
+    @classmethod
+    def _stream_outcome(
+        cls,
+        method: str,
+        url: str,
+        body: "_StreamBody",
+        result,
+        wait: Optional[float],
+    ) -> Tuple[Optional["requests.Response"], Optional[float]]:
+        """Finish a streamed attempt: flush the tail, or refuse to retry a torn body."""
+        if body.error is not None:
+            raise body.error
+        if wait is not None and body.delivered:
+            # The sink already holds part of the body; a retry would duplicate it.
+            logger.error(
+                f"{method} {url} failed after streaming {body.delivered} bytes"
+            )
+            return None, None
+        if result is not None:
+            body.finish()
+        return result, wait
+
     @classmethod
     def _request(
-        cls, method: str, url: str, headers: Optional[dict] = None, **kwargs
+        cls,
+        method: str,
+        url: str,
+        headers: Optional[dict] = None,
+        sink: Optional[Callable[[bytes], object]] = None,
+        chunk_size: int = STREAM_CHUNK_SIZE,
+        throttle: bool = True,
+        fresh: bool = False,
+        cache_post: bool = False,
+        **kwargs,
     ) -> Optional["requests.Response"]:
         """Perform an HTTP request, retrying rate limits and transient failures.
 
@@ -91,64 +426,462 @@ class RequestManager:
             method: HTTP verb
             url: Target URL
             headers: Optional custom headers, merged over the browser defaults
+            sink: Receives the body in chunks instead of buffering it on the response
+            chunk_size: Largest chunk handed to sink
+            throttle: Wait for the host's pacing slot before each attempt; the
+                per-host connection limit and circuit breaker apply either way
+            fresh: Bypass the response cache for this request and store its
+                answer in place of the cached one
+            cache_post: Let the response cache serve and store this POST,
+                keyed on its form data
             **kwargs: Passed through to the session (params, data)
 
         Returns:
             Response object if successful, None otherwise
         """
+        if sink is not None:
+            return cls._stream_request(
+                method, url, headers, sink, chunk_size, throttle, kwargs
+            )
+        cache_key, entry = cls._cache_lookup(
+            method,
+            url,
+            kwargs.get("params"),
+            kwargs.get("data") if cache_post else None,
+            fresh,
+        )
+        if entry is not None and entry.fresh:
+            return entry.response
+        if entry is not None:
+            headers = {**(headers or {}), **entry.validators()}
+        merged_headers = cls._merge_headers(headers)
+        attempts = max(1, config.provider_config.max_retries)
+        host = host_of(url) or ""
+        session = cls._session_for(url)
+        for attempt in range(attempts):
+            if not cls._circuit_allows(method, url):
+                return None
+            if throttle:
+                cls._throttle_host(url)
+            error = None
+            try:
+                with cls._session_pool().slot(host):
+                    started = time.monotonic()
+                    response = session.request(
+                        method,
+                        url,
+                        headers=merged_headers,
+                        timeout=config.provider_config.timeout,
+                        **kwargs,
+                    )
+            except requests.exceptions.RequestException as e:
+                response, error = getattr(e, "response", None), e
+            cls._observe(url, response, error, time.monotonic() - started)
+            result, wait = cls._attempt_outcome(
+                method, url, response, error, attempt, attempts
+            )
+            if wait is None:
+                return cls._cache_update(url, cache_key, entry, result)
+            time.sleep(wait)
+        return None
+
+    @classmethod
+    def _stream_request(
+        cls,
+        method: str,
+        url: str,
+        headers: Optional[dict],
+        sink: Callable[[bytes], object],
+        chunk_size: int,
+        throttle: bool,
+        kwargs: dict,
+    ) -> Optional["requests.Response"]:
+        """_request for streamed bodies: no cache, no overall transfer deadline."""
+        merged_headers = cls._merge_headers(headers)
+        attempts = max(1, config.provider_config.max_retries)
+        host = host_of(url) or ""
+        session = cls._session_for(url)
+        for attempt in range(attempts):
+            if not cls._circuit_allows(method, url):
+                return None
+            if throttle:
+                cls._throttle_host(url)
+            body = _StreamBody(sink, chunk_size)
+            error = None
+            try:
+                with cls._session_pool().slot(host):
+                    response = session.request(
+                        method,
+                        url,
+                        headers=merged_headers,
+                        timeout=None,
+                        content_callback=body.write,
+                        **kwargs,
+                    )
+            except requests.exceptions.RequestException as e:
+                response, error = getattr(e, "response", None), e
+            if body.error is None:
+                cls._observe(url, response, error, None)
+            result, wait = cls._attempt_outcome(
+                method, url, response, error, attempt, attempts, streamed=True
+            )
+            result, wait = cls._stream_outcome(method, url, body, result, wait)
+            if wait is None:
+                return result
+            time.sleep(wait)
+        return None
+
+    @staticmethod
+    def _flight_key(method: str, url: str, params: Optional[dict]) -> tuple:
+        return method, url, tuple(sorted((params or {}).items()))
+
+    @classmethod
+    def get(
+        cls,
+        url: str,
+        params: Optional[dict] = None,
+        headers: Optional[dict] = None,
+        fresh: bool = False,
+    ) -> Optional["requests.Response"]:
+        """Perform a GET request. See _request.
+
+        Concurrent GETs for the same URL and params share one network call and
+        receive the same response object. Pass fresh=True when a cached copy
+        is known to be outdated (e.g. to rescrape an expired token).
+        """
+        return cls._flights.do(
+            cls._flight_key("GET", url, params) + (fresh,),
+            lambda: cls._request(
+                "GET", url, headers=headers, fresh=fresh, params=params
+            ),
+        )
+
+    @classmethod
+    def post(
+        cls,
+        url: str,
+        data: Optional[dict] = None,
+        headers: Optional[dict] = None,
+        cache: bool = False,
+    ) -> Optional["requests.Response"]:
+        """Perform a POST request. See _request.
+
+        Pass cache=True for idempotent forms such as site searches: the
+        response cache then answers a repeat of the same form data without a
+        request (and without waiting for the host's pacing slot).
+        """
+        return cls._request("POST", url, headers=headers, cache_post=cache, data=data)
+
+    @classmethod
+    def head(
+        cls, url: str, headers: Optional[dict] = None
+    ) -> Optional["requests.Response"]:
+        """Perform a HEAD request (size and range support probes). See _request."""
+        return cls._request("HEAD", url, headers=headers)
+
+    @classmethod
+    def stream(
+        cls,
+        url: str,
+        sink: Callable[[bytes], object],
+        params: Optional[dict] = None,
+        headers: Optional[dict] = None,
+        chunk_size: int = STREAM_CHUNK_SIZE,
+        throttle: bool = True,
+    ) -> Optional["requests.Response"]:
+        """GET url, handing the body to sink in chunks of at most chunk_size bytes.
+
+        The body is never held on the response, so large media stays out of
+        memory. Retries and throttling match get(); an attempt that fails after
+        bytes reached the sink is not retried. When None is returned the sink
+        may hold a partial body and should be discarded. Pass throttle=False for
+        media CDNs, where the per-host connection limit is pacing enough.
+
+        Returns:
+            The response (with empty content) if successful, None otherwise
+        """
+        return cls._request(
+            "GET",
+            url,
+            headers=headers,
+            sink=sink,
+            chunk_size=chunk_size,
+            throttle=throttle,
+            params=params,
+        )
+
+
+class _StreamBody:
+    """Re-chunks a curl write stream into bounded sink writes.
+
+    curl calls `write` from inside the transfer, so a slow sink slows the
+    download instead of letting data pile up in memory. Up to one chunk is held
+    back before the status is known, which keeps small error pages (e.g. a 503
+    that will be retried) out of the sink.
+    """
+
+    def __init__(self, sink: Callable[[bytes], object], chunk_size: int):
+        self._sink = sink
+        self._chunk_size = max(1, chunk_size)
+        self._buffer = bytearray()
+        self.delivered = 0
+        self.error: Optional[BaseException] = None
+
+    def write(self, data: bytes) -> int:
+        self._buffer += data
+        try:
+            while len(self._buffer) >= self._chunk_size:
+                self._flush(self._chunk_size)
+        except Exception as e:
+            # Abort the transfer; the caller re-raises once curl returns.
+            self.error = e
+            return CURL_WRITEFUNC_ERROR
+        return len(data)
+
+    def finish(self) -> None:
+        if self._buffer:
+            self._flush(len(self._buffer))
+
+    def _flush(self, size: int) -> None:
+        chunk = bytes(self._buffer[:size])
+        del self._buffer[:size]
+        self._sink(chunk)
+        self.delivered += len(chunk)
+
+
+class AsyncRequestManager(RequestManager):
+    """Awaitable counterpart of RequestManager built on curl_cffi's AsyncSession.
+
+    Uses the same Chrome impersonation, headers, retry statuses, Retry-After
+    handling and per-host throttle, so one event loop can keep many provider
+    requests in flight instead of parking an OS thread on each.
+    """
+
+    # An AsyncSession is bound to the loop it first runs on; keep a pool per loop
+    # so asyncio.run() callers and test loops never share a dead session.
+    _async_pools: "weakref.WeakKeyDictionary" = weakref.WeakKeyDictionary()
+    _async_flights: "weakref.WeakKeyDictionary" = weakref.WeakKeyDictionary()
+
+    @classmethod
+    def _session_for(cls, url: str) -> "requests.AsyncSession":
+        loop = asyncio.get_running_loop()
+        pool = cls._async_pools.get(loop)
+        if pool is None:
+            # AsyncSession's max_clients already caps in-flight requests per host.
+            max_clients = config.provider_config.max_connections_per_host or 64
+            pool = HostSessionPool(
+                lambda: requests.AsyncSession(
+                    max_clients=max_clients, **cls._session_options()
+                )
+            )
+            cls._async_pools[loop] = pool
+        return pool.session(host_of(url) or "")
+
+    @classmethod
+    def reset_sessions(cls) -> None:
+        """Drop pooled sessions so the next request picks up changed ProviderConfig.
+
+        Sessions already bound to a running loop are left to that loop.
+        """
+        cls._async_pools = weakref.WeakKeyDictionary()
+
+    @staticmethod
+    def _pacer_uses_disk() -> bool:
+        """Whether the adaptive pacer may read or write its JSON state file."""
+        provider_config = config.provider_config
+        return (
+            provider_config.adaptive_throttle
+            and provider_config.pacing_state_path is not None
+        )
+
+    @classmethod
+    async def _athrottle_host(cls, url: str) -> None:
+        """Await the per-host throttle shared with blocking callers."""
+        if cls._pacer_uses_disk():
+            # The pacer loads its state file on first use; keep it off the loop.
+            wait = await asyncio.to_thread(cls._throttle_wait, url)
+        else:
+            wait = cls._throttle_wait(url)
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+    @classmethod
+    async def _aobserve(
+        cls, url: str, response, error, latency: Optional[float]
+    ) -> None:
+        """Awaitable _observe; pacer state is saved on a thread."""
+        if cls._pacer_uses_disk():
+            await asyncio.to_thread(cls._observe, url, response, error, latency)
+        else:
+            cls._observe(url, response, error, latency)
+
+    @classmethod
+    async def _request(
+        cls,
+        method: str,
+        url: str,
+        headers: Optional[dict] = None,
+        sink: Optional[Callable[[bytes], object]] = None,
+        chunk_size: int = RequestManager.STREAM_CHUNK_SIZE,
+        throttle: bool = True,
+        fresh: bool = False,
+        cache_post: bool = False,
+        **kwargs,
+    ) -> Optional["requests.Response"]:
+        """Perform an HTTP request without blocking the event loop. See RequestManager._request."""
+        if sink is not None:
+            return await cls._stream_request(
+                method, url, headers, sink, chunk_size, throttle, kwargs
+            )
+        cache_key, entry = None, None
+        if config.http_cache.path is not None:
+            # SQLite is blocking; keep it off the event loop.
+            cache_key, entry = await asyncio.to_thread(
+                cls._cache_lookup,
+                method,
+                url,
+                kwargs.get("params"),
+                kwargs.get("data") if cache_post else None,
+                fresh,
+            )
+        if entry is not None and entry.fresh:
+            return entry.response
+        if entry is not None:
+            headers = {**(headers or {}), **entry.validators()}
         merged_headers = cls._merge_headers(headers)
         attempts = max(1, config.provider_config.max_retries)
+        session = cls._session_for(url)
         for attempt in range(attempts):
-            cls._throttle_host(url)
-            last = attempt == attempts - 1
+            if not cls._circuit_allows(method, url):
+                return None
+            if throttle:
+                await cls._athrottle_host(url)
+            error = None
+            started = time.monotonic()
             try:
-                response = cls._session.request(
+                response = await session.request(
                     method,
                     url,
                     headers=merged_headers,
                     timeout=config.provider_config.timeout,
                     **kwargs,
                 )
-                if not response.ok:
-                    # Only rate limits and transient faults are worth a retry;
-                    # a 404 or 403 will not become a 200 on the next attempt.
-                    if response.status_code in cls.RETRY_STATUSES and not last:
-                        wait = cls._retry_wait(response, attempt)
-                        logger.warning(
-                            f"{method} {url} returned {response.status_code}, "
-                            f"retrying in {wait:.1f}s ({attempt + 1}/{attempts})"
-                        )
-                        time.sleep(wait)
-                        continue
-                    error = f"HTTP {response.status_code}"
-                    TestDataLogger.log_response(response, error=error)
-                    logger.error(f"{method} request failed for {url}: {error}")
-                    return None
-                TestDataLogger.log_response(response)
-                return response
             except requests.exceptions.RequestException as e:
-                if not last:
-                    wait = cls._retry_wait(getattr(e, "response", None), attempt)
-                    logger.warning(
-                        f"{method} {url} failed ({e}), "
-                        f"retrying in {wait:.1f}s ({attempt + 1}/{attempts})"
-                    )
-                    time.sleep(wait)
-                    continue
-                TestDataLogger.log_response(getattr(e, "response", None), error=str(e))
-                logger.error(f"{method} request failed for {url}: {str(e)}")
+                response, error = getattr(e, "response", None), e
+            await cls._aobserve(url, response, error, time.monotonic() - started)
+            result, wait = cls._attempt_outcome(
+                method, url, response, error, attempt, attempts
+            )
+            if wait is None:
+                if cache_key is None:
+                    return result
+                return await asyncio.to_thread(
+                    cls._cache_update, url, cache_key, entry, result
+                )
+            await asyncio.sleep(wait)
         return None
 
     @classmethod
-    def get(
-        cls, url: str, params: Optional[dict] = None, headers: Optional[dict] = None
+    async def _stream_request(
+        cls,
+        method: str,
+        url: str,
+        headers: Optional[dict],
+        sink: Callable[[bytes], object],
+        chunk_size: int,
+        throttle: bool,
+        kwargs: dict,
     ) -> Optional["requests.Response"]:
-        """Perform a GET request. See _request."""
-        return cls._request("GET", url, headers=headers, params=params)
+        """Awaitable RequestManager._stream_request."""
+        merged_headers = cls._merge_headers(headers)
+        attempts = max(1, config.provider_config.max_retries)
+        session = cls._session_for(url)
+        for attempt in range(attempts):
+            if not cls._circuit_allows(method, url):
+                return None
+            if throttle:
+                await cls._athrottle_host(url)
+            body = _StreamBody(sink, chunk_size)
+            error = None
+            try:
+                response = await session.request(
+                    method,
+                    url,
+                    headers=merged_headers,
+                    timeout=None,
+                    content_callback=body.write,
+                    **kwargs,
+                )
+            except requests.exceptions.RequestException as e:
+                response, error = getattr(e, "response", None), e
+            if body.error is None:
+                await cls._aobserve(url, response, error, None)
+            result, wait = cls._attempt_outcome(
+                method, url, response, error, attempt, attempts, streamed=True
+            )
+            result, wait = cls._stream_outcome(method, url, body, result, wait)
+            if wait is None:
+                return result
+            await asyncio.sleep(wait)
+        return None
 
     @classmethod
-    def post(
-        cls, url: str, data: Optional[dict] = None, headers: Optional[dict] = None
+    async def get(
+        cls,
+        url: str,
+        params: Optional[dict] = None,
+        headers: Optional[dict] = None,
+        fresh: bool = False,
+    ) -> Optional["requests.Response"]:
+        """Perform a GET request, sharing identical in-flight GETs. See _request."""
+        loop = asyncio.get_running_loop()
+        flights = cls._async_flights.get(loop)
+        if flights is None:
+            flights = cls._async_flights[loop] = AsyncSingleFlight()
+        return await flights.do(
+            cls._flight_key("GET", url, params) + (fresh,),
+            lambda: cls._request(
+                "GET", url, headers=headers, fresh=fresh, params=params
+            ),
+        )
+
+    @classmethod
+    async def post(
+        cls,
+        url: str,
+        data: Optional[dict] = None,
+        headers: Optional[dict] = None,
+        cache: bool = False,
+    ) -> Optional["requests.Response"]:
+        """Perform a POST request. See RequestManager.post."""
+        return await cls._request(
+            "POST", url, headers=headers, cache_post=cache, data=data
+        )
+
+    @classmethod
+    async def head(
+        cls, url: str, headers: Optional[dict] = None
+    ) -> Optional["requests.Response"]:
+        """Perform a HEAD request. See _request."""
+        return await cls._request("HEAD", url, headers=headers)
+
+    @classmethod
+    async def stream(
+        cls,
+        url: str,
+        sink: Callable[[bytes], object],
+        params: Optional[dict] = None,
+        headers: Optional[dict] = None,
+        chunk_size: int = RequestManager.STREAM_CHUNK_SIZE,
+        throttle: bool = True,
     ) -> Optional["requests.Response"]:
-        """Perform a POST request. See _request."""
-        return cls._request("POST", url, headers=headers, data=data)
+        """Awaitable RequestManager.stream; sink is called on the event loop."""
+        return await cls._request(
+            "GET",
+            url,
+            headers=headers,
+            sink=sink,
+            chunk_size=chunk_size,
+            throttle=throttle,
+            params=params,
+        )
@@ -0,0 +1,237 @@
+"""Persistent HTTP response cache."""
+
+import contextlib
+import json
+import re
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
+from urllib.parse import urlencode
+
+from curl_cffi.requests import Headers
+
+
+class CachedResponse:
+    """Read-only stand-in for a curl_cffi Response rebuilt from the cache."""
+
+    def __init__(
+        self, url: str, status_code: int, headers: Dict[str, str], content: bytes
+    ):
+        self.url = url
+        self.status_code = status_code
+        self.headers = Headers(headers)
+        self.content = content
+        self.ok = status_code < 400
+        self.from_cache = True
+
+    @property
+    def encoding(self) -> str:
+        match = re.search(r"charset=([\w-]+)", self.headers.get("Content-Type", ""))
+        return match.group(1) if match else "utf-8"
+
+    @property
+    def text(self) -> str:
+        return self.content.decode(self.encoding, errors="replace")
+
+    def json(self):
+        return json.loads(self.text)
+
+
+class CacheEntry:
+    """A stored response plus the validators needed to revalidate it."""
+
+    def __init__(
+        self,
+        response: CachedResponse,
+        expires_at: float,
+        etag: Optional[str],
+        last_modified: Optional[str],
+    ):
+        self.response = response
+        self.expires_at = expires_at
+        self.etag = etag
+        self.last_modified = last_modified
+
+    @property
+    def fresh(self) -> bool:
+        return time.time() < self.expires_at
+
+    def validators(self) -> Dict[str, str]:
+        """Conditional-GET headers for revalidating this entry."""
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+class ResponseCache:
+    """SQLite-backed HTTP response cache with per-URL TTLs and LRU eviction.
+
+    Fresh entries are served without touching the network. Stale entries that
+    carry an ETag or Last-Modified are revalidated with a conditional GET, and a
+    304 renews them without re-downloading the body. Once the stored bodies exceed
+    `max_bytes`, the least recently used entries are evicted.
+    """
+
+    _SCHEMA = """
+        CREATE TABLE IF NOT EXISTS responses (
+            key TEXT PRIMARY KEY,
+            url TEXT NOT NULL,
+            status_code INTEGER NOT NULL,
+            headers TEXT NOT NULL,
+            body BLOB NOT NULL,
+            size INTEGER NOT NULL,
+            etag TEXT,
+            last_modified TEXT,
+            expires_at REAL NOT NULL,
+            last_access REAL NOT NULL
+        )
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        max_bytes: int,
+        ttl_rules: Sequence[Tuple[str, float]] = (),
+        default_ttl: float = 0.0,
+    ):
+        """Initialize the cache, creating the database if needed.
+
+        Args:
+            path: SQLite database file
+            max_bytes: Upper bound on the total size of stored bodies
+            ttl_rules: (url regex, seconds) pairs; the first match wins, 0 disables caching
+            default_ttl: TTL for URLs no rule matches
+        """
+        self.path = Path(path)
+        self.max_bytes = max_bytes
+        self.default_ttl = default_ttl
+        self._ttl_rules: List[Tuple[re.Pattern, float]] = [
+            (re.compile(pattern), ttl) for pattern, ttl in ttl_rules
+        ]
+        self._lock = threading.Lock()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with self._connect() as conn:
+            conn.execute(self._SCHEMA)
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS responses_lru ON responses (last_access)"
+            )
+
+    @contextlib.contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        conn = sqlite3.connect(str(self.path), timeout=10)
+        try:
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    @staticmethod
+    def key(
+        url: str, params: Optional[dict] = None, data: Optional[dict] = None
+    ) -> str:
+        """Cache key for a GET of url with params, or a POST of form data.
+
+        Both are order-insensitive; POST keys never collide with GET keys.
+        """
+        if params:
+            url = f"{url}?{urlencode(sorted(params.items()))}"
+        if data is None:
+            return url
+        return f"POST {url}\n{urlencode(sorted(data.items()))}"
+
+    @staticmethod
+    def storable(response) -> bool:
+        """False if Cache-Control forbids storing the response (no-store, private)."""
+        directives = Headers(response.headers).get("Cache-Control") or ""
+        tokens = {d.strip().split("=")[0].lower() for d in directives.split(",")}
+        return not tokens & {"no-store", "private"}
+
+    def ttl_for(self, url: str) -> float:
+        """Seconds a response for url stays fresh; 0 means do not cache."""
+        for pattern, ttl in self._ttl_rules:
+            if pattern.search(url):
+                return ttl
+        return self.default_ttl
+
+    def lookup(self, key: str) -> Optional[CacheEntry]:
+        """Return the entry for key (fresh or stale), marking it recently used."""
+        with self._lock, self._connect() as conn:
+            row = conn.execute(
+                "SELECT url, status_code, headers, body, etag, last_modified, expires_at "
+                "FROM responses WHERE key = ?",
+                (key,),
+            ).fetchone()
+            if row is None:
+                return None
+            conn.execute(
+                "UPDATE responses SET last_access = ? WHERE key = ?", (time.time(), key)
+            )
+        url, status_code, headers, body, etag, last_modified, expires_at = row
+        response = CachedResponse(url, status_code, json.loads(headers), bytes(body))
+        return CacheEntry(response, expires_at, etag, last_modified)
+
+    def store(self, key: str, response, ttl: float) -> None:
+        """Store a successful response for ttl seconds and enforce the size bound.
+
+        A response marked no-store or private is not stored, and replaces
+        (removes) any entry already under key.
+        """
+        if not self.storable(response):
+            with self._lock, self._connect() as conn:
+                conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+            return
+        content = response.content or b""
+        headers = Headers(response.headers)
+        now = time.time()
+        with self._lock, self._connect() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    key,
+                    str(response.url),
+                    response.status_code,
+                    json.dumps(dict(headers)),
+                    content,
+                    len(content),
+                    headers.get("ETag"),
+                    headers.get("Last-Modified"),
+                    now + ttl,
+                    now,
+                ),
+            )
+            self._evict(conn)
+
+    def refresh(self, key: str, ttl: float) -> None:
+        """Extend an entry's freshness after a 304 Not Modified."""
+        now = time.time()
+        with self._lock, self._connect() as conn:
+            conn.execute(
+                "UPDATE responses SET expires_at = ?, last_access = ? WHERE key = ?",
+                (now + ttl, now, key),
+            )
+
+    def clear(self) -> None:
+        with self._lock, self._connect() as conn:
+            conn.execute("DELETE FROM responses")
+
+    def _evict(self, conn: sqlite3.Connection) -> None:
+        (total,) = conn.execute(
+            "SELECT COALESCE(SUM(size), 0) FROM responses"
+        ).fetchone()
+        if total <= self.max_bytes:
+            return
+        rows = conn.execute(
+            "SELECT key, size FROM responses ORDER BY last_access ASC"
+        ).fetchall()
+        evicted = []
+        for key, size in rows:
+            if total <= self.max_bytes:
+                break
+            evicted.append((key,))
+            total -= size
+        conn.executemany("DELETE FROM responses WHERE key = ?", evicted)
@@ -0,0 +1,104 @@
+"""Merging of search results that different providers return for the same work."""
+
+import re
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from ..models.search_result import MergedSearchResult, SearchResult
+from .title_matcher import SEARCH_STOPWORDS, tokenize
+
+_YEAR = re.compile(r"\b(?:19|20)\d{2}\b")
+
+
+class ResultMerger:
+    """Clusters SearchResults across providers into one entry per work.
+
+    Each result is keyed by its normalized titles (Ukrainian and English):
+    tokens from the search tokenizer without stopwords, so case, punctuation
+    and "Season"/"сезон" wording do not matter but a season number does.
+    Results sharing a (title key, year) pair are the same work, and the
+    relation is transitive, so a Ukrainian-only title joins through a result
+    that carries both. A result without a year joins the one dated work with
+    its title; if several works share the title, it stays apart rather than
+    guessing. Keys are looked up in dicts and clusters joined with
+    union-find, so merging is linear in the number of results, with no
+    pairwise comparison.
+    """
+
+    @staticmethod
+    def merge(results: Iterable[SearchResult]) -> List[MergedSearchResult]:
+        """Merge results into works, in order of each work's first result.
+
+        Args:
+            results: Results from any number of providers
+
+        Returns:
+            One MergedSearchResult per work
+        """
+        results = list(results)
+        parent = list(range(len(results)))
+
+        def find(i: int) -> int:
+            while parent[i] != i:
+                parent[i] = parent[parent[i]]
+                i = parent[i]
+            return i
+
+        def join(i: int, into: int) -> None:
+            root, target = find(i), find(into)
+            if root != target:
+                parent[root] = target
+
+        keys = [ResultMerger.title_keys(r) for r in results]
+        years = [ResultMerger.year(r.year) for r in results]
+
+        owners: Dict[Tuple[str, Optional[int]], int] = {}
+        for i, year in enumerate(years):
+            if year is None:
+                continue
+            for key in keys[i]:
+                join(i, owners.setdefault((key, year), i))
+
+        dated: Dict[str, Set[int]] = {}
+        for (key, _), i in owners.items():
+            dated.setdefault(key, set()).add(find(i))
+        undated = []
+        for i, year in enumerate(years):
+            if year is not None:
+                continue
+            works = set().union(*(dated.get(key, ()) for key in keys[i]))
+            if len(works) == 1:
+                join(i, works.pop())
+            else:
+                undated.append(i)
+        # Undated results matching no single dated work still merge with
+        # each other.
+        for i in undated:
+            for key in keys[i]:
+                join(i, owners.setdefault((key, None), i))
+
+        clusters: Dict[int, List[int]] = {}
+        for i in range(len(results)):
+            clusters.setdefault(find(i), []).append(i)
+        return [
+            MergedSearchResult(
+                [results[i] for i in members],
+                year=next((years[i] for i in members if years[i] is not None), None),
+            )
+            for members in clusters.values()
+        ]
+
+    @staticmethod
+    def title_keys(result: SearchResult) -> Set[str]:
+        """Normalized forms of the result's titles; empty if it has none."""
+        keys = set()
+        for title in (result.title, result.title_eng):
+            tokens = [t for t in tokenize(title) if t not in SEARCH_STOPWORDS]
+            if tokens:
+                keys.add(" ".join(tokens))
+        return keys
+
+    @staticmethod
+    def year(value) -> Optional[int]:
+        """Release year from a provider's year field ("2021", "2013-04-07", 2021)."""
+        match = _YEAR.search(str(value)) if value else None
+        return int(match.group(0)) if match else None
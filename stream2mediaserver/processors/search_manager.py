@@ -2,31 +2,26 @@
 
 import html
 import re
-from difflib import SequenceMatcher
-from typing import List, Optional
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
 from urllib.parse import quote, unquote, urljoin, urlparse, urlunparse
 
-from bs4 import BeautifulSoup
-
+from ..config import config
 from ..models.search_result import SearchResult
 from ..models.series import Series, SeriesGroup, group_series_by_studio
+from ..parser.extraction import ExtractionSpec, Field
+from ..parser.html_backend import Strainer
 from ..utils.logger import logger
 from .request_manager import RequestManager
+from .title_matcher import TitleMatcher, tokenize
+from .token_cache import TokenCache
 
 
 _EMBEDDED_URL = re.compile(r"https?://\S+")
 _BARE_HOST = re.compile(r"^[a-z0-9.-]+\.[a-z]{2,}(/|$)", re.I)
 
-_TOKEN_RE = re.compile(r"[^\W_]+", re.UNICODE)
-# Words too common to carry relevance in either language.
-_SEARCH_STOPWORDS = {
-    "the", "a", "an", "and", "or", "of", "on", "in", "at", "to", "for", "is",
-    "my", "no", "not", "season", "part",
-    "та", "і", "й", "у", "в", "на", "з", "до", "не", "сезон", "частина",
-}
 _MIN_TITLE_MATCH = 0.6  # 2-token queries must match both; 3-token, two of three
-_FUZZY_MIN_TOKEN_LEN = 5
-_FUZZY_MIN_RATIO = 0.85
 
 # Anitube playlist navigation labels that name something other than a studio.
 _ANITUBE_SUBTITLE_LABELS = {"субтитри"}
@@ -41,7 +36,7 @@ class SearchManager:
     @staticmethod
     def _tokenize(text: Optional[str]) -> List[str]:
         """Split text into lowercase word tokens (Unicode-aware)."""
-        return [t.lower() for t in _TOKEN_RE.findall(text or "")]
+        return tokenize(text)
 
     @staticmethod
     def title_match_score(query: str, candidate_titles: List[Optional[str]]) -> float:
@@ -61,33 +56,8 @@ class SearchManager:
         Returns:
             0.0-1.0; 1.0 when the query carries no significant tokens to judge on
         """
-        query_tokens = [
-            t
-            for t in SearchManager._tokenize(query)
-            if len(t) > 1 and t not in _SEARCH_STOPWORDS
-        ]
-        if not query_tokens:
-            return 1.0  # e.g. a query of only stopwords: nothing to judge, don't filter
-
-        candidate_tokens = set()
-        for title in candidate_titles:
-            candidate_tokens.update(SearchManager._tokenize(title))
-        if not candidate_tokens:
-            return 0.0
-
-        matched = 0
-        for token in query_tokens:
-            if token in candidate_tokens:
-                matched += 1
-                continue
-            # Fuzzy only for longer tokens; short ones collide too easily
-            # ('dan' vs 'data' scores 0.86 and would match Red Data Girl).
-            if len(token) >= _FUZZY_MIN_TOKEN_LEN and any(
-                SequenceMatcher(None, token, other).ratio() >= _FUZZY_MIN_RATIO
-                for other in candidate_tokens
-            ):
-                matched += 1
-        return matched / len(query_tokens)
+        # Scoring many results for one query: reuse a TitleMatcher instead.
+        return TitleMatcher(query).score(candidate_titles)
 
     @staticmethod
     def normalize_media_url(raw: Optional[str]) -> Optional[str]:
@@ -119,21 +89,47 @@ class SearchManager:
             return f"https://{raw}"
         return None
 
+    _dle_tokens: Optional[TokenCache] = None
+
+    @staticmethod
+    def _token_cache() -> TokenCache:
+        """Process-wide DLE hash cache, rebuilt if the configured path changes."""
+        path = config.provider_config.token_cache_path
+        cache = SearchManager._dle_tokens
+        if cache is None or cache.path != (Path(path) if path is not None else None):
+            cache = TokenCache(path)
+            SearchManager._dle_tokens = cache
+        return cache
+
     @staticmethod
     def get_dle_login_hash(
-        provider: str, url: str, headers: Optional[dict] = None
+        provider: str, url: str, headers: Optional[dict] = None, refresh: bool = False
     ) -> Optional[str]:
         """Get DLE login hash from the provider's page.
 
+        The hash is cached per provider and base URL for
+        `dle_hash_ttl_seconds`, so repeated searches and detail loads skip the
+        homepage round-trip.
+
         Args:
             provider: Provider identifier
             url: Base URL of the provider
             headers: Optional request headers
+            refresh: Ignore the cached hash and refetch it; the homepage is
+                then fetched past the HTTP response cache too, so the site
+                issues a new hash and session cookies
 
         Returns:
             DLE login hash if found, None otherwise
         """
-        response = RequestManager.get(url, headers=headers)
+        tokens = SearchManager._token_cache()
+        if not refresh:
+            cached = tokens.get(
+                provider, url, config.provider_config.dle_hash_ttl_seconds
+            )
+            if cached:
+                return cached
+        response = RequestManager.get(url, headers=headers, fresh=refresh)
         if response and response.ok:
             # Tolerate either quote style and arbitrary spacing; providers differ,
             # and a strict pattern silently disables search for the whole provider.
@@ -141,7 +137,9 @@ class SearchManager:
                 r"var\s+dle_login_hash\s*=\s*['\"](\w+)['\"]", response.text
             )
             if match:
+                tokens.put(provider, url, match.group(1))
                 return match.group(1)
+        tokens.invalidate(provider, url)
         logger.warning(f"Failed to get DLE login hash for {provider}")
         return None
 
@@ -194,22 +192,16 @@ class SearchManager:
         results = []
 
         try:
-            if provider == "uakino":
-                results = SearchManager._search_uakino(
-                    encoded_query, dle_hash, search_url, headers, base_url
-                )
-            elif provider == "anitube":
-                results = SearchManager._search_anitube(
-                    encoded_query, dle_hash, search_url, headers, form_data
-                )
-            elif provider == "uaflix":
-                results = SearchManager._search_uaflix(
-                    encoded_query, search_url, headers
-                )
-            elif provider == "animeon":
+            if provider == "animeon":
                 results = SearchManager._search_animeon(
                     encoded_query, search_url, headers, base_url
                 )
+            elif provider in _HTML_SEARCHES:
+                results = SearchManager._search_html(
+                    provider, encoded_query, dle_hash, base_url, search_url, headers
+                )
+            else:
+                logger.error(f"No search spec for provider {provider}")
         except Exception as e:
             logger.error(f"Error searching {provider}: {str(e)}")
             return []
@@ -217,176 +209,58 @@ class SearchManager:
         return results
 
     @staticmethod
-    def _search_uakino(
+    def _search_html(
+        provider: str,
         query: str,
-        dle_hash: str,
+        dle_hash: Optional[str],
+        base_url: str,
         search_url: str,
         headers: Optional[dict],
-        base_url: str,
     ) -> List[SearchResult]:
-        """Search implementation for UAKino provider.
+        """Run the provider's HTML search (see _HTML_SEARCHES).
 
-        Search POSTs to ajax.php with story, dle_hash, thisUrl (referrer path).
-        Response is JSON with "content" = HTML fragment; each result is a.search-result-link.
+        For DLE sites a cached hash can outlive the site's session (403 or empty
+        body); then the homepage is refetched, which also reseeds cookies, and
+        the search retried once.
         """
-        parsed_base = urlparse(base_url)
-        scheme, netloc = parsed_base.scheme or "https", parsed_base.netloc
-        # story must be raw query so requests encodes as application/x-www-form-urlencoded (e.g. space -> +)
-        form_data = {
-            "story": unquote(query),
-            "dle_hash": dle_hash,
-            "thisUrl": "/index.php",
-        }
-        response = RequestManager.post(search_url, data=form_data, headers=headers)
-        results = []
-        if response and response.ok:
-            soup = BeautifulSoup(response.json()["content"], "html.parser")
-            for link in soup.find_all("a", class_="search-result-link"):
-                url = unquote(link.get("href", ""))
-                poster = unquote(link.img.get("src", "")) if link.img else ""
-                if poster:
-                    parsed_url = urlparse(poster)
-                    if not parsed_url.netloc:
-                        new_url = urlunparse(
-                            parsed_url._replace(scheme=scheme, netloc=netloc)
-                        )
-                        poster = new_url
-                name = link.find("span", class_="searchheading")
-                name = SearchManager.clean_text(name.get_text()) if name else ""
-                name_eng = link.find("span", class_="search-orig-title")
-                name_eng = (
-                    SearchManager.clean_text(name_eng.get_text()) if name_eng else ""
-                )
-                year = None
-                rating = None
-                extend_info = link.find("div", class_="search-extend-info")
-                if extend_info:
-                    spans = extend_info.find_all("span")
-                    if len(spans) >= 1:
-                        year = SearchManager.clean_text(spans[0].get_text()) or None
-                    if len(spans) >= 2:
-                        rating_text = SearchManager.clean_text(spans[1].get_text())
-                        if rating_text:
-                            match = re.search(r"[\d.]+", rating_text)
-                            if match:
-                                rating = match.group(0)
-                results.append(
-                    SearchResult(
-                        link=url,
-                        image_url=poster or None,
-                        title=name,
-                        title_eng=name_eng or None,
-                        year=year,
-                        rating=rating,
-                        provider="uakino",
-                    )
+        search = _HTML_SEARCHES[provider]
+        results = SearchManager._fetch_search_results(
+            search, query, dle_hash, base_url, search_url, headers
+        )
+        if results is None and search.refresh_hash:
+            fresh_hash = SearchManager.get_dle_login_hash(
+                provider, base_url, headers, refresh=True
+            )
+            if fresh_hash:
+                results = SearchManager._fetch_search_results(
+                    search, query, fresh_hash, base_url, search_url, headers
                 )
-        return results
+        return results or []
 
     @staticmethod
-    def _search_anitube(
+    def _fetch_search_results(
+        search: "HtmlSearch",
         query: str,
-        dle_hash: str,
+        dle_hash: Optional[str],
+        base_url: str,
         search_url: str,
         headers: Optional[dict],
-        form_data: Optional[dict],
-    ) -> List[SearchResult]:
-        """Search implementation for Anitube provider."""
-        # For Anitube, we need to use the original query (with spaces) and let requests handle the encoding
-        original_query = unquote(query)  # Convert back from %20 to spaces
-
-        form_data = {
-            "query": original_query,  # Will be properly encoded as + by requests
-            "user_hash": dle_hash,
-        }
-
-        response = RequestManager.post(search_url, data=form_data, headers=headers)
-        results = []
-        if response and response.ok:
-            soup = BeautifulSoup(response.text, "html.parser")
-            for link in soup.find_all("a", style="display: block;"):
-                url = unquote(link.get("href", ""))
-                poster = unquote(link.img.get("src", "")) if link.img else ""
-                name = link.find("b", class_="searchheading_title")
-                name = SearchManager.clean_text(name.get_text()) if name else ""
-                year = link.get("year")
-                if year is not None:
-                    year = str(year).strip() or None
-                rating = link.get("rating")
-                if rating is not None:
-                    rating = str(rating).strip() or None
-                description = None
-                series_info = None
-                img_fast = link.find("div", class_="img_fast_search")
-                if img_fast:
-                    span = img_fast.find("span")
-                    if span:
-                        text = span.get_text()
-                        if "Опис:" in text:
-                            desc_part = text.split("Опис:", 1)[-1].strip()
-                            if desc_part:
-                                description = SearchManager.clean_text(desc_part)
-                        # e.g. "Серій: 1169 з ХХ (24 хв.)"
-                        info_match = re.search(
-                            r"Серій:\s*(.+?)(?:\s*Рік:|\s*Опис:|$)", text, re.DOTALL
-                        )
-                        if info_match:
-                            series_info = SearchManager.clean_text(info_match.group(1))
-                results.append(
-                    SearchResult(
-                        link=url,
-                        image_url=poster or None,
-                        title=name,
-                        title_eng=None,
-                        description=description,
-                        series_info=series_info,
-                        year=year,
-                        rating=rating,
-                        provider="anitube",
-                    )
-                )
-        return results
-
-    @staticmethod
-    def _search_uaflix(
-        query: str, search_url: str, headers: Optional[dict]
-    ) -> List[SearchResult]:
-        """Search implementation for UAFlix provider."""
-        response = RequestManager.get(search_url + quote(query), headers=headers)
-        results = []
-        if response and response.ok:
-            soup = BeautifulSoup(response.text, "html.parser")
-            for link in soup.find_all("a", class_="sres-wrap clearfix"):
-                url = unquote(link.get("href", ""))
-                img_el = link.find("img")
-                poster = unquote(img_el.get("src", "")) if img_el else ""
-                if poster and not poster.startswith("http"):
-                    poster = "https://uafix.net" + poster
-                h2 = link.find("h2")
-                h2_text = h2.get_text().strip() if h2 else ""
-                name = h2_text.split("/")[0].strip() if h2_text else ""
-                name_eng = (
-                    h2_text.split("/")[1].strip()
-                    if "/" in h2_text
-                    else None
-                )
-                sres_desc = link.find("div", class_="sres-desc")
-                description = (
-                    SearchManager.clean_text(sres_desc.get_text())
-                    if sres_desc and sres_desc.get_text()
-                    else None
-                )
-                results.append(
-                    SearchResult(
-                        link=url,
-                        image_url=poster or None,
-                        title=name,
-                        title_eng=name_eng,
-                        description=description,
-                        provider="uaflix",
-                    )
-                )
-        return results
+    ) -> Optional[List[SearchResult]]:
+        """One search request; None when it fails or comes back empty."""
+        if search.form is None:
+            response = RequestManager.get(search_url + quote(query), headers=headers)
+        else:
+            # Raw query: the form encoding turns spaces into + as the sites expect.
+            form_data = search.form(unquote(query), dle_hash)
+            response = RequestManager.post(
+                search_url, data=form_data, headers=headers, cache=True
+            )
+        if not response or not response.ok or not response.text:
+            return None
+        page = (
+            response.json()[search.payload_key] if search.payload_key else response.text
+        )
+        return search.spec.extract(page, base_url=base_url).records
 
     @staticmethod
     def _search_animeon(
@@ -401,6 +275,7 @@ class SearchManager:
         results = []
         dropped = 0
         raw_query = unquote(query)
+        matcher = TitleMatcher(raw_query)  # one query, judged against every result
         if response and response.ok:
             try:
                 data = response.json()
@@ -411,9 +286,8 @@ class SearchManager:
                     synonyms = item.get("synonyms") or []
                     if isinstance(synonyms, str):
                         synonyms = [synonyms]
-                    score = SearchManager.title_match_score(
-                        raw_query,
-                        [item.get("titleUa"), item.get("titleEn"), *synonyms],
+                    score = matcher.score(
+                        [item.get("titleUa"), item.get("titleEn"), *synonyms]
                     )
                     if score < _MIN_TITLE_MATCH:
                         dropped += 1
@@ -478,14 +352,13 @@ class SearchManager:
             logger.error(f"Failed to get series page from {provider}")
             return []
 
+        # UAFlix does not use playlists.php; use parse_uaflix_series_page_html on series page HTML
+        parse = _SERIES_PARSERS.get(provider)
+        if parse is None:
+            logger.error(f"No series parser for provider {provider}")
+            return []
         try:
-            if provider == "uakino":
-                flat = SearchManager._parse_uakino_series(response, provider=provider)
-                return group_series_by_studio(flat)
-            elif provider == "anitube":
-                flat = SearchManager._parse_anitube_series(response, provider=provider)
-                return group_series_by_studio(flat)
-            # UAFlix does not use playlists.php; use parse_uaflix_series_page_html on series page HTML
+            return group_series_by_studio(parse(response, provider=provider))
         except Exception as e:
             logger.error(f"Error parsing series page from {provider}: {str(e)}")
 
@@ -494,29 +367,12 @@ class SearchManager:
     @staticmethod
     def _parse_uakino_series(response, provider: str = "uakino") -> List[Series]:
         """Parse series information from UAKino response."""
-        series_list = []
-        soup = BeautifulSoup(response.json()["response"], "html.parser")
-        skipped = 0
-        for ul in soup.find_all("ul"):
-            for li in ul.find_all("li", attrs={"data-id": True, "data-file": True}):
-                url = SearchManager.normalize_media_url(li["data-file"])
-                if not url:
-                    skipped += 1
-                    continue
-                series_list.append(
-                    Series(
-                        studio_id=li["data-id"],
-                        studio_name=li.get("data-voice") or "Unknown",
-                        series=SearchManager.clean_text(li.get_text()),
-                        url=url,
-                        provider=provider,
-                    )
-                )
-        if skipped:
+        extraction = _UAKINO_SERIES.extract(response.json()["response"])
+        if extraction.skipped:
             logger.warning(
-                f"UAKino: skipped {skipped} episode(s) with unusable player URLs"
+                f"UAKino: skipped {extraction.skipped} episode(s) with unusable player URLs"
             )
-        return series_list
+        return [Series(**r, provider=provider) for r in extraction.records]
 
     @staticmethod
     def _anitube_studio(episode_id: str, labels: dict) -> tuple:
@@ -562,36 +418,27 @@ class SearchManager:
     @staticmethod
     def _parse_anitube_series(response, provider: str = "anitube") -> List[Series]:
         """Parse series information from Anitube response."""
+        soup = _ANITUBE_SERIES.soup(response.json()["response"])
+        labels = {r["id"]: r["label"] for r in _ANITUBE_NAV_NODES.extract(soup).records}
+        extraction = _ANITUBE_SERIES.extract(soup)
+        if extraction.skipped:
+            logger.warning(
+                f"Anitube: skipped {extraction.skipped} episode(s) with unusable player URLs"
+            )
         series_list = []
-        soup = BeautifulSoup(response.json()["response"], "html.parser")
-        all_nodes = soup.find_all("li", attrs={"data-id": True})
-        labels = {
-            li["data-id"]: SearchManager.clean_text(li.get_text())
-            for li in all_nodes
-            if "data-file" not in li.attrs
-        }
-        skipped = 0
-        for item in soup.find_all("li", attrs={"data-file": True}):
-            url = SearchManager.normalize_media_url(item["data-file"])
-            if not url:
-                skipped += 1
-                continue
+        for record in extraction.records:
             studio_id, studio_name = SearchManager._anitube_studio(
-                item["data-id"], labels
+                record["episode_id"], labels
             )
             series_list.append(
                 Series(
                     studio_id=studio_id,
                     studio_name=studio_name,
-                    series=SearchManager.clean_text(item.get_text()),
-                    url=url,
+                    series=record["series"],
+                    url=record["url"],
                     provider=provider,
                 )
             )
-        if skipped:
-            logger.warning(
-                f"Anitube: skipped {skipped} episode(s) with unusable player URLs"
-            )
         return series_list
 
     @staticmethod
@@ -628,66 +475,60 @@ class SearchManager:
         Returns:
             List of Series (url = episode page, series = episode title)
         """
-        series_list: List[Series] = []
         if not response or not response.ok:
-            return series_list
-        soup = BeautifulSoup(response.text, "html.parser")
-        sers_wr = soup.find("div", id="sers-wr")
-        if not sers_wr:
-            sers_wr = soup.find("div", class_="frels2")
-        if not sers_wr:
-            return series_list
-        for idx, item in enumerate(sers_wr.find_all("div", class_="video-item")):
-            link = item.find("a", class_=lambda c: c and "vi-img" in c)
-            if not link or not link.get("href"):
-                continue
-            href = unquote(link.get("href", "").strip())
-            if (
-                not href
-                or "season" not in href.lower()
-                or "episode" not in href.lower()
-            ):
-                continue
-            episode_url = href if href.startswith("http") else urljoin(base_url, href)
-            vi_title = item.find("div", class_="vi-title")
-            vi_rate = item.find("div", class_="vi-rate")
-            title_parts = []
-            if vi_title:
-                title_parts.append(SearchManager.clean_text(vi_title.get_text()))
-            if vi_rate:
-                title_parts.append(SearchManager.clean_text(vi_rate.get_text()))
-            title = " ".join(title_parts) if title_parts else f"Episode {idx + 1}"
-            # Group by season: "Сезон 3 Серія 1 Execution" -> studio "UAFlix Сезон 3", series "Серія 1 Execution".
-            # Unaired episodes carry a prefix ("Прем'єра. 20.07.2026 Сезон 9 Серія 9 ..."),
-            # so search anywhere rather than anchoring, or they land outside their season.
-            season_match = re.search(
-                r"(?:Сезон|Season)\s+(\d+)\s*(.*)$",
-                title,
-                re.IGNORECASE | re.DOTALL,
+            return []
+        return _UAFLIX_EPISODES.extract(response.text, base_url=base_url).records
+
+    @staticmethod
+    def _uaflix_episode(record: dict, index: int, context: dict) -> Optional[dict]:
+        """Series fields for the index-th UAFlix episode card, None to skip it."""
+        href = record["href"]
+        if "season" not in href.lower() or "episode" not in href.lower():
+            return None
+        base_url = context.get("base_url", "https://uafix.net")
+        episode_url = href if href.startswith("http") else urljoin(base_url, href)
+        title_parts = [part for part in (record["title"], record["rate"]) if part]
+        title = " ".join(title_parts) if title_parts else f"Episode {index + 1}"
+        # Group by season: "Сезон 3 Серія 1 Execution" -> studio "UAFlix Сезон 3", series "Серія 1 Execution".
+        # Unaired episodes carry a prefix ("Прем'єра. 20.07.2026 Сезон 9 Серія 9 ..."),
+        # so search anywhere rather than anchoring, or they land outside their season.
+        season_match = re.search(
+            r"(?:Сезон|Season)\s+(\d+)\s*(.*)$",
+            title,
+            re.IGNORECASE | re.DOTALL,
+        )
+        if season_match:
+            season_num = season_match.group(1)
+            prefix = title[: season_match.start()].strip()
+            episode_label = " ".join(
+                part for part in (prefix, season_match.group(2).strip()) if part
             )
-            if season_match:
-                season_num = season_match.group(1)
-                prefix = title[: season_match.start()].strip()
-                episode_label = " ".join(
-                    part for part in (prefix, season_match.group(2).strip()) if part
-                )
-                studio_id = f"season_{season_num}"
-                studio_name = f"UAFlix Сезон {season_num}"
-                series_label = episode_label if episode_label else title
-            else:
-                studio_id = f"ep_{idx}"
-                studio_name = "UAFlix"
-                series_label = title
-            series_list.append(
-                Series(
-                    studio_id=studio_id,
-                    studio_name=studio_name,
-                    series=series_label,
-                    url=episode_url,
-                    provider="uaflix",
+            studio_id = f"season_{season_num}"
+            studio_name = f"UAFlix Сезон {season_num}"
+            series_label = episode_label if episode_label else title
+        else:
+            studio_id = f"ep_{index}"
+            studio_name = "UAFlix"
+            series_label = title
+        return {
+            "studio_id": studio_id,
+            "studio_name": studio_name,
+            "series": series_label,
+            "url": episode_url,
+        }
+
+    @staticmethod
+    def _uakino_poster(record: dict, index: int, context: dict) -> dict:
+        """Resolve a host-relative UAKino poster against the site's base URL."""
+        poster = record["image_url"]
+        if poster and not urlparse(poster).netloc:
+            parsed_base = urlparse(context["base_url"])
+            record["image_url"] = urlunparse(
+                urlparse(poster)._replace(
+                    scheme=parsed_base.scheme or "https", netloc=parsed_base.netloc
                 )
             )
-        return series_list
+        return record
 
     @staticmethod
     def get_news_id_from_uaflix_slug_page(
@@ -719,3 +560,180 @@ class SearchManager:
         if match:
             return match.group(1)
         return None
+
+
+# Provider extraction specs. Each is compiled once at import; supporting another
+# DLE-style site means adding entries here rather than another parser.
+
+
+def _clean(text: str) -> str:
+    return SearchManager.clean_text(text)
+
+
+def _uaflix_poster(src: str) -> str:
+    if not src:
+        return src
+    return src if src.startswith("http") else "https://uafix.net" + src
+
+
+_LINK = Field(attr="href", transforms=(unquote,), default="")
+_POSTER = Field("img", attr="src", transforms=(unquote,))
+
+
+@dataclass(frozen=True)
+class HtmlSearch:
+    """How a provider's HTML search is requested and read."""
+
+    spec: ExtractionSpec
+    # (raw query, DLE hash) -> POST form; None GETs search_url + query instead
+    form: Optional[Callable[[str, Optional[str]], dict]] = None
+    # JSON key holding the result HTML; None when the body is the HTML
+    payload_key: Optional[str] = None
+    # Retry once with a fresh DLE hash when the search comes back empty
+    refresh_hash: bool = False
+
+
+_HTML_SEARCHES: Dict[str, HtmlSearch] = {
+    # ajax.php answers JSON whose "content" holds a.search-result-link cards.
+    "uakino": HtmlSearch(
+        spec=ExtractionSpec(
+            items="a.search-result-link",
+            parse_only=Strainer("a.search-result-link"),
+            fields={
+                "link": _LINK,
+                "image_url": _POSTER,
+                "title": Field("span.searchheading", transforms=(_clean,), default=""),
+                "title_eng": Field("span.search-orig-title", transforms=(_clean,)),
+                "year": Field("div.search-extend-info span", transforms=(_clean,)),
+                "rating": Field(
+                    "div.search-extend-info span:nth-of-type(2)",
+                    pattern=r"[\d.]+",
+                ),
+            },
+            model=SearchResult,
+            constants={"provider": "uakino"},
+            finalize=SearchManager._uakino_poster,
+        ),
+        form=lambda query, dle_hash: {
+            "story": query,
+            "dle_hash": dle_hash,
+            "thisUrl": "/index.php",
+        },
+        payload_key="content",
+        refresh_hash=True,
+    ),
+    "anitube": HtmlSearch(
+        spec=ExtractionSpec(
+            items='a[style="display: block;"]',
+            parse_only=Strainer('a[style="display: block;"]'),
+            fields={
+                "link": _LINK,
+                "image_url": _POSTER,
+                "title": Field(
+                    "b.searchheading_title", transforms=(_clean,), default=""
+                ),
+                "year": Field(attr="year", transforms=(str.strip,)),
+                "rating": Field(attr="rating", transforms=(str.strip,)),
+                "description": Field(
+                    "div.img_fast_search span",
+                    pattern=r"Опис:(.*)",
+                    transforms=(_clean,),
+                ),
+                # e.g. "Серій: 1169 з ХХ (24 хв.)"
+                "series_info": Field(
+                    "div.img_fast_search span",
+                    pattern=r"Серій:\s*(.+?)(?:\s*Рік:|\s*Опис:|$)",
+                    transforms=(_clean,),
+                ),
+            },
+            model=SearchResult,
+            constants={"provider": "anitube"},
+        ),
+        form=lambda query, dle_hash: {"query": query, "user_hash": dle_hash},
+        refresh_hash=True,
+    ),
+    "uaflix": HtmlSearch(
+        spec=ExtractionSpec(
+            items="a.sres-wrap.clearfix",
+            parse_only=Strainer("a.sres-wrap.clearfix"),
+            fields={
+                "link": _LINK,
+                "image_url": Field(
+                    "img", attr="src", transforms=(unquote, _uaflix_poster)
+                ),
+                # "Назва / Original title"
+                "title": Field(
+                    "h2", pattern=r"^([^/]*)", transforms=(str.strip,), default=""
+                ),
+                "title_eng": Field("h2", pattern=r"/([^/]*)", transforms=(str.strip,)),
+                "description": Field("div.sres-desc", transforms=(_clean,)),
+            },
+            model=SearchResult,
+            constants={"provider": "uaflix"},
+        ),
+    ),
+}
+
+_UAKINO_SERIES = ExtractionSpec(
+    items="ul li[data-id][data-file]",
+    parse_only=Strainer("ul"),
+    fields={
+        "studio_id": Field(attr="data-id"),
+        "studio_name": Field(attr="data-voice", default="Unknown"),
+        "series": Field(transforms=(_clean,)),
+        "url": Field(
+            attr="data-file",
+            transforms=(SearchManager.normalize_media_url,),
+            required=True,
+        ),
+    },
+)
+
+# Anitube's playlist tree: navigation nodes (dub type, studio, player, range)
+# label the ids that episode nodes hang under.
+_ANITUBE_NAV_NODES = ExtractionSpec(
+    items="li[data-id]:not([data-file])",
+    fields={
+        "id": Field(attr="data-id"),
+        "label": Field(transforms=(_clean,), default=""),
+    },
+)
+
+_ANITUBE_SERIES = ExtractionSpec(
+    items="li[data-id][data-file]",
+    # Also builds the navigation nodes: both specs read the same soup.
+    parse_only=Strainer("li[data-id]"),
+    fields={
+        "episode_id": Field(attr="data-id"),
+        "series": Field(transforms=(_clean,)),
+        "url": Field(
+            attr="data-file",
+            transforms=(SearchManager.normalize_media_url,),
+            required=True,
+        ),
+    },
+)
+
+_UAFLIX_EPISODES = ExtractionSpec(
+    scope=("div#sers-wr", "div.frels2"),
+    items="div.video-item",
+    parse_only=Strainer("div#sers-wr", "div.frels2"),
+    fields={
+        "href": Field(
+            'a[class*="vi-img"]',
+            attr="href",
+            transforms=(str.strip, unquote),
+            required=True,
+        ),
+        "title": Field("div.vi-title", transforms=(_clean,)),
+        "rate": Field("div.vi-rate", transforms=(_clean,)),
+    },
+    model=Series,
+    constants={"provider": "uaflix"},
+    finalize=SearchManager._uaflix_episode,
+)
+
+_SERIES_PARSERS: Dict[str, Callable[..., List[Series]]] = {
+    "uakino": SearchManager._parse_uakino_series,
+    "anitube": SearchManager._parse_anitube_series,
+}
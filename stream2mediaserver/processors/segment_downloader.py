@@ -0,0 +1,205 @@
+"""Concurrent HLS segment fetching."""
+
+import hashlib
+import os
+import time
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from itertools import islice
+from typing import Callable, Deque, Iterator, List, Optional, Sequence, Tuple
+
+from ..config import config
+from ..utils.logger import logger
+from .download_manifest import DownloadManifest
+from .download_workspace import DownloadWorkspace
+from .request_manager import RequestManager
+
+
+class SegmentDownloader:
+    """Downloads media segments to files on a bounded pool of worker threads.
+
+    Segments are streamed straight to their files and skip the per-host pacing
+    throttle, so the pool size (and ProviderConfig.max_connections_per_host)
+    is what bounds the load on the CDN. Whatever order they complete in, the
+    returned paths follow the playlist order.
+
+    Each segment is written to a `.part` file and renamed into place only once
+    it is complete, so a file under its final name is never truncated. With a
+    manifest, finished segments are recorded there and segments it already
+    verifies are skipped, which makes an interrupted download resumable.
+    """
+
+    def __init__(
+        self,
+        workers: Optional[int] = None,
+        retries: Optional[int] = None,
+        manifest: Optional[DownloadManifest] = None,
+        workspace: Optional[DownloadWorkspace] = None,
+    ):
+        """Initialize the downloader.
+
+        Args:
+            workers: Concurrent segment fetches; defaults to DownloadConfig.segment_workers
+            retries: Extra attempts per segment; defaults to DownloadConfig.segment_retries
+            manifest: Records finished segments and lets verified ones be skipped
+            workspace: Work directory whose disk budget each segment waits for
+        """
+        self.manifest = manifest
+        self.workspace = workspace
+        download_config = config.download
+        self.workers = max(
+            1, download_config.segment_workers if workers is None else workers
+        )
+        self.retries = max(
+            0, download_config.segment_retries if retries is None else retries
+        )
+
+    def download(self, segments: Sequence[Tuple[str, str]]) -> List[str]:
+        """Fetch every (url, path) pair.
+
+        Returns:
+            The paths, in the order the segments were given
+
+        Raises:
+            Exception: If a segment still fails after its retries; segments not
+                started yet are cancelled
+        """
+        with ThreadPoolExecutor(
+            max_workers=self.workers, thread_name_prefix="segment"
+        ) as executor:
+            futures = [
+                executor.submit(self._fetch, url, path) for url, path in segments
+            ]
+            try:
+                for future, (url, _) in zip(futures, segments):
+                    if not future.result():
+                        raise Exception(f"Failed to download segment: {url}")
+            except BaseException:
+                for future in futures:
+                    future.cancel()
+                raise
+        return [path for _, path in segments]
+
+    def iter_bodies(self, urls: Sequence[str]) -> Iterator[bytes]:
+        """Yield each segment's body in playlist order, fetching ahead concurrently.
+
+        At most `workers` bodies are held in memory at a time (fetched or in
+        flight), so a consumer such as an ffmpeg pipe keeps memory bounded.
+
+        Raises:
+            Exception: If a segment still fails after its retries
+        """
+        remaining = iter(urls)
+        pending: Deque[Tuple[str, Future]] = deque()
+        with ThreadPoolExecutor(
+            max_workers=self.workers, thread_name_prefix="segment"
+        ) as executor:
+            try:
+                for url in islice(remaining, self.workers):
+                    pending.append((url, executor.submit(self._fetch_body, url)))
+                while pending:
+                    url, future = pending.popleft()
+                    body = future.result()
+                    if body is None:
+                        raise Exception(f"Failed to download segment: {url}")
+                    for next_url in islice(remaining, 1):
+                        pending.append(
+                            (next_url, executor.submit(self._fetch_body, next_url))
+                        )
+                    yield body
+            finally:
+                for _, future in pending:
+                    future.cancel()
+
+    def _fetch(self, url: str, path: str) -> bool:
+        if self.manifest is not None and self.manifest.verified(url, path):
+            logger.info("Keeping verified segment %s", path)
+            return True
+        part_path = f"{path}.part"
+
+        def attempt() -> bool:
+            if self.workspace is not None:
+                self.workspace.ensure_room()
+            logger.info("Downloading %s to %s", url, path)
+            digest = hashlib.sha256()
+            with open(part_path, "wb") as f:
+
+                def sink(chunk: bytes) -> None:
+                    f.write(chunk)
+                    digest.update(chunk)
+
+                sizes = self._transfer(url, sink)
+            if sizes is None:
+                os.remove(part_path)
+                return False
+            size, expected_size = sizes
+            replaced = os.path.getsize(path) if os.path.exists(path) else 0
+            os.replace(part_path, path)
+            if self.workspace is not None:
+                self.workspace.charge(size, replaced)
+            if self.manifest is not None:
+                self.manifest.record(url, path, size, digest.hexdigest(), expected_size)
+            return True
+
+        return self._retrying(url, attempt)
+
+    def _fetch_body(self, url: str) -> Optional[bytes]:
+        body = bytearray()
+
+        def attempt() -> bool:
+            del body[:]
+            return self._transfer(url, body.extend) is not None
+
+        return bytes(body) if self._retrying(url, attempt) else None
+
+    def _transfer(
+        self, url: str, sink: Callable[[bytes], object]
+    ) -> Optional[Tuple[int, Optional[int]]]:
+        """Stream url into sink once.
+
+        Returns:
+            (body size, size the server announced or None), or None on failure
+        """
+        size = 0
+
+        def counting_sink(chunk: bytes) -> None:
+            nonlocal size
+            sink(chunk)
+            size += len(chunk)
+
+        response = RequestManager.stream(url, counting_sink, throttle=False)
+        if not response:
+            return None
+        expected_size = self._expected_size(response)
+        if expected_size not in (None, size):
+            logger.warning(
+                "Segment %s is %d bytes, expected %d", url, size, expected_size
+            )
+            return None
+        return size, expected_size
+
+    def _retrying(self, url: str, attempt: Callable[[], bool]) -> bool:
+        for attempt_number in range(self.retries + 1):
+            if attempt():
+                return True
+            if attempt_number < self.retries:
+                wait = min(2.0**attempt_number, RequestManager.MAX_RETRY_WAIT)
+                logger.warning(
+                    "Segment %s failed, retrying in %.0fs (%d/%d)",
+                    url,
+                    wait,
+                    attempt_number + 1,
+                    self.retries,
+                )
+                time.sleep(wait)
+        return False
+
+    @staticmethod
+    def _expected_size(response) -> Optional[int]:
+        """Body length the server announced, unless a content coding hides it."""
+        if not response or response.headers.get("Content-Encoding"):
+            return None
+        try:
+            return int(response.headers.get("Content-Length"))
+        except (TypeError, ValueError):
+            return None
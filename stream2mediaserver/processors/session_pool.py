@@ -0,0 +1,64 @@
+"""Per-host HTTP session pooling."""
+
+import contextlib
+import threading
+from typing import Any, Callable, Dict, Iterator
+
+
+class HostSessionPool:
+    """Keeps one HTTP session per host and caps concurrent requests to each host.
+
+    Sessions are created lazily by `session_factory`, so every host keeps its own
+    connection cache (TLS sessions are reused across segment downloads and page
+    scrapes to that host) and a burst against one host cannot occupy connections
+    another host needs.
+    """
+
+    def __init__(
+        self, session_factory: Callable[[], Any], max_connections: int = 0
+    ) -> None:
+        """Initialize the pool.
+
+        Args:
+            session_factory: Builds a new session for a host
+            max_connections: Concurrent requests allowed per host; 0 for no limit
+        """
+        self._session_factory = session_factory
+        self._max_connections = max_connections
+        self._sessions: Dict[str, Any] = {}
+        self._slots: Dict[str, threading.BoundedSemaphore] = {}
+        self._lock = threading.Lock()
+
+    def session(self, host: str) -> Any:
+        """Return the session for host, creating it on first use."""
+        with self._lock:
+            session = self._sessions.get(host)
+            if session is None:
+                session = self._session_factory()
+                self._sessions[host] = session
+            return session
+
+    @contextlib.contextmanager
+    def slot(self, host: str) -> Iterator[None]:
+        """Hold one of host's connection slots for the duration of a request."""
+        if self._max_connections <= 0:
+            yield
+            return
+        with self._lock:
+            semaphore = self._slots.get(host)
+            if semaphore is None:
+                semaphore = threading.BoundedSemaphore(self._max_connections)
+                self._slots[host] = semaphore
+        with semaphore:
+            yield
+
+    def close(self) -> None:
+        """Close and forget every session."""
+        with self._lock:
+            sessions = list(self._sessions.values())
+            self._sessions.clear()
+            self._slots.clear()
+        for session in sessions:
+            close = getattr(session, "close", None)
+            if close is not None:
+                close()
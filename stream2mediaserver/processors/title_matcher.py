@@ -0,0 +1,110 @@
+"""Relevance of search results to a query, judged on their titles."""
+
+import re
+from difflib import SequenceMatcher
+from typing import Dict, FrozenSet, Iterable, List, Optional, Tuple
+
+try:
+    from rapidfuzz.distance import Indel
+except ImportError:  # optional speedup, see TitleMatcher
+    Indel = None
+
+_TOKEN_RE = re.compile(r"[^\W_]+", re.UNICODE)
+# Words too common to carry relevance in either language; shared with the
+# other title comparisons (ResultMerger) so both agree on what is noise.
+SEARCH_STOPWORDS = frozenset({
+    "the", "a", "an", "and", "or", "of", "on", "in", "at", "to", "for", "is",
+    "my", "no", "not", "season", "part",
+    "та", "і", "й", "у", "в", "на", "з", "до", "не", "сезон", "частина",
+})  # fmt: skip
+_FUZZY_MIN_TOKEN_LEN = 5
+_FUZZY_MIN_RATIO = 0.85
+
+
+def tokenize(text: Optional[str]) -> List[str]:
+    """Split text into lowercase word tokens (Unicode-aware)."""
+    return [t.lower() for t in _TOKEN_RE.findall(text or "")]
+
+
+def _bigrams(token: str) -> FrozenSet[str]:
+    return frozenset(token[i : i + 2] for i in range(len(token) - 1))
+
+
+class TitleMatcher:
+    """Scores results' titles against one query.
+
+    The query is tokenized once, so a response's results are all judged
+    against the same prepared tokens. A query token matches a result if one
+    of its title tokens equals it or, for tokens of 5+ characters, is within
+    difflib ratio 0.85 of it. Before difflib runs, bounds that can only
+    reject rule out most pairs cheaply: the length ratio, a shared character
+    bigram (two tokens that close always share one), and, when rapidfuzz is
+    installed, the Indel (LCS) ratio, which is never below difflib's. Each
+    pair is decided once per matcher, so title words repeated across results
+    cost a dict lookup. The decisions are therefore exactly difflib's.
+    """
+
+    def __init__(self, query: str):
+        """Prepare the query.
+
+        Args:
+            query: The user's search query
+        """
+        self.query_tokens = [
+            t for t in tokenize(query) if len(t) > 1 and t not in SEARCH_STOPWORDS
+        ]
+        self._bigrams = {
+            t: _bigrams(t) for t in self.query_tokens if len(t) >= _FUZZY_MIN_TOKEN_LEN
+        }
+        self._close: Dict[Tuple[str, str], bool] = {}
+
+    def score(self, candidate_titles: Iterable[Optional[str]]) -> float:
+        """Fraction of significant query tokens present in a result's titles.
+
+        Args:
+            candidate_titles: Titles/synonyms for one result
+
+        Returns:
+            0.0-1.0; 1.0 when the query carries no significant tokens to judge on
+        """
+        if not self.query_tokens:
+            return 1.0  # e.g. a query of only stopwords: nothing to judge, don't filter
+
+        candidate_tokens = set()
+        for title in candidate_titles:
+            candidate_tokens.update(tokenize(title))
+        if not candidate_tokens:
+            return 0.0
+
+        matched = 0
+        for token in self.query_tokens:
+            if token in candidate_tokens:
+                matched += 1
+            # Fuzzy only for longer tokens; short ones collide too easily
+            # ('dan' vs 'data' scores 0.86 and would match Red Data Girl).
+            elif token in self._bigrams and any(
+                self._is_close(token, other) for other in candidate_tokens
+            ):
+                matched += 1
+        return matched / len(self.query_tokens)
+
+    def _is_close(self, token: str, other: str) -> bool:
+        key = (token, other)
+        close = self._close.get(key)
+        if close is None:
+            close = self._close[key] = self._compare(token, other)
+        return close
+
+    def _compare(self, token: str, other: str) -> bool:
+        # Bounds use difflib's own arithmetic (2.0 * matches / total) so that
+        # a pair at exactly the threshold is never rejected by rounding.
+        total = len(token) + len(other)
+        if 2.0 * min(len(token), len(other)) / total < _FUZZY_MIN_RATIO:
+            return False
+        if self._bigrams[token].isdisjoint(_bigrams(other)):
+            return False
+        if Indel is not None:
+            longest_common = (total - Indel.distance(token, other)) // 2
+            if 2.0 * longest_common / total < _FUZZY_MIN_RATIO:
+                return False
+        return SequenceMatcher(None, token, other).ratio() >= _FUZZY_MIN_RATIO
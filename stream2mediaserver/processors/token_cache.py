@@ -0,0 +1,75 @@
+"""Provider session token cache."""
+
+import json
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Dict, Optional
+
+from ..utils.logger import logger
+
+
+class TokenCache:
+    """Per-provider session tokens (e.g. DLE login hashes) with a TTL.
+
+    Tokens are keyed by provider and base URL, shared by every provider instance
+    in the process and, when `path` is set, mirrored to a JSON file so they
+    survive restarts.
+    """
+
+    def __init__(self, path: Optional[Path] = None):
+        self.path = Path(path) if path is not None else None
+        self._tokens: Dict[str, dict] = {}
+        self._lock = threading.Lock()
+        self._loaded = False
+
+    @staticmethod
+    def _key(provider: str, base_url: str) -> str:
+        return f"{provider}|{base_url.rstrip('/')}"
+
+    def get(self, provider: str, base_url: str, ttl: float) -> Optional[str]:
+        """Cached token if it was stored less than ttl seconds ago."""
+        with self._lock:
+            self._load()
+            entry = self._tokens.get(self._key(provider, base_url))
+        if entry is None or time.time() - entry["stored_at"] >= ttl:
+            return None
+        return entry["token"]
+
+    def put(self, provider: str, base_url: str, token: str) -> None:
+        with self._lock:
+            self._load()
+            self._tokens[self._key(provider, base_url)] = {
+                "token": token,
+                "stored_at": time.time(),
+            }
+            self._save()
+
+    def invalidate(self, provider: str, base_url: str) -> None:
+        with self._lock:
+            self._load()
+            if self._tokens.pop(self._key(provider, base_url), None) is not None:
+                self._save()
+
+    def _load(self) -> None:
+        if self._loaded:
+            return
+        self._loaded = True
+        if self.path is None or not self.path.exists():
+            return
+        try:
+            self._tokens = json.loads(self.path.read_text(encoding="utf-8"))
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable token cache {self.path}: {e}")
+
+    def _save(self) -> None:
+        if self.path is None:
+            return
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.path.with_suffix(f"{self.path.suffix}.tmp")
+            tmp_path.write_text(json.dumps(self._tokens), encoding="utf-8")
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            logger.warning(f"Failed to persist token cache {self.path}: {e}")
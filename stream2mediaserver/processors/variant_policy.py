@@ -0,0 +1,140 @@
+"""Choice of stream variant (rendition) for a download."""
+
+import re
+from typing import Optional, Sequence, Tuple
+
+from ..config import config
+
+# MP4 player ladders label each URL like "[720p]https://...".
+_LADDER_LABEL = re.compile(r"^\[(\d+)p\](.+)$")
+
+
+class VariantPolicy:
+    """Picks the variant to download from an HLS master playlist or MP4 ladder.
+
+    Variants above `max_height` or `max_bandwidth` are ruled out. Among the
+    rest, those whose CODECS start with the earliest-listed entry of
+    `preferred_codecs` win. With `target_seconds`, a measured throughput and
+    the stream duration, only variants expected to download within that
+    wall-clock time are kept. The highest bandwidth of what remains is chosen;
+    if every variant is ruled out, the lightest one is used instead of none.
+    """
+
+    def __init__(
+        self,
+        max_height: Optional[int] = None,
+        max_bandwidth: Optional[int] = None,
+        preferred_codecs: Sequence[str] = (),
+        target_seconds: Optional[float] = None,
+    ):
+        """Initialize the policy.
+
+        Args:
+            max_height: Highest vertical resolution allowed, e.g. 720
+            max_bandwidth: Highest advertised bandwidth allowed, in bits/s
+            preferred_codecs: CODECS prefixes in order of preference, e.g. ["avc1"]
+            target_seconds: Wall-clock time a download should fit in
+        """
+        self.max_height = max_height
+        self.max_bandwidth = max_bandwidth
+        self.preferred_codecs = [c.lower() for c in preferred_codecs]
+        self.target_seconds = target_seconds
+
+    @classmethod
+    def from_config(cls) -> "VariantPolicy":
+        download_config = config.download
+        return cls(
+            max_height=download_config.max_height,
+            max_bandwidth=download_config.max_bandwidth,
+            preferred_codecs=download_config.preferred_codecs,
+            target_seconds=download_config.target_download_seconds,
+        )
+
+    @property
+    def measures_throughput(self) -> bool:
+        return self.target_seconds is not None
+
+    def select(
+        self,
+        playlists: Sequence,
+        duration: Optional[float] = None,
+        throughput: Optional[float] = None,
+    ):
+        """Choose among m3u8 variant playlists.
+
+        Args:
+            playlists: Variants of a master playlist (m3u8 Playlist objects)
+            duration: Stream length in seconds, for the throughput mode
+            throughput: Measured download speed in bytes/s, for the throughput mode
+
+        Returns:
+            The chosen playlist, or None if there are none
+        """
+        if not playlists:
+            return None
+        candidates = [
+            p
+            for p in playlists
+            if self._fits_caps(self._height(p), p.stream_info.bandwidth)
+        ]
+        candidates = self._prefer_codecs(candidates)
+        if self.target_seconds and duration and throughput:
+            budget = throughput * self.target_seconds
+            candidates = [
+                p
+                for p in candidates
+                if (p.stream_info.bandwidth or 0) / 8 * duration <= budget
+            ]
+        if not candidates:
+            return min(playlists, key=lambda p: p.stream_info.bandwidth or 0)
+        return max(
+            candidates,
+            key=lambda p: (p.stream_info.bandwidth or 0, self._height(p) or 0),
+        )
+
+    def select_ladder(self, urls: Sequence[str]) -> str:
+        """Choose among "[720p]url" MP4 entries; returns "" if none are labelled."""
+        ladder = []
+        for url in urls:
+            match = _LADDER_LABEL.match(url.strip())
+            if match:
+                ladder.append((int(match.group(1)), match.group(2)))
+        if not ladder:
+            return ""
+        allowed = [entry for entry in ladder if self._fits_caps(entry[0], None)]
+        height, url = max(allowed) if allowed else min(ladder)
+        return url
+
+    def _fits_caps(self, height: Optional[int], bandwidth: Optional[int]) -> bool:
+        if self.max_height is not None and height and height > self.max_height:
+            return False
+        if (
+            self.max_bandwidth is not None
+            and bandwidth
+            and bandwidth > self.max_bandwidth
+        ):
+            return False
+        return True
+
+    def _prefer_codecs(self, candidates: list) -> list:
+        for preferred in self.preferred_codecs:
+            matching = [
+                p
+                for p in candidates
+                if any(
+                    codec.strip().lower().startswith(preferred)
+                    for codec in (getattr(p.stream_info, "codecs", None) or "").split(
+                        ","
+                    )
+                )
+            ]
+            if matching:
+                return matching
+        return candidates
+
+    @staticmethod
+    def _height(playlist) -> Optional[int]:
+        resolution: Optional[Tuple[int, int]] = getattr(
+            playlist.stream_info, "resolution", None
+        )
+        return resolution[1] if resolution else None
@@ -7,6 +7,7 @@ player https://animeon.club/anime/{id}
 
 from ..models.series import Series, group_series_by_studio
 from ..processors.covertor_manager import ConvertorManager
+from ..processors.download_workspace import DownloadWorkspace
 from ..processors.m3u8_manager import M3U8Manager
 from ..processors.request_manager import RequestManager
 from ..processors.search_manager import SearchManager
@@ -139,16 +140,21 @@ class AnimeonProvider(ProviderBase):
             logger.error(f"Error loading details for {query}: {str(e)}")
             return []
 
-    def load_player_page(self, query):
+    def find_master_playlist(self, url):
         """Resolve to animeon.club/anime/{id} then fetch m3u8 from page."""
+        aid = _animeon_extract_id(url)
+        player_url = f"{self.base_url}/anime/{aid}" if aid else url
+        return M3U8Manager.get_master_playlist(player_url, headers=self.headers)
+
+    def load_player_page(self, query):
         try:
-            aid = _animeon_extract_id(query)
-            player_url = f"{self.base_url}/anime/{aid}" if aid else query
-            m3u8_url = M3U8Manager.get_master_playlist(player_url, headers=self.headers)
+            m3u8_url = self.find_master_playlist(query)
             if m3u8_url:
-                segment_files = M3U8Manager.download_series_content(m3u8_url)
+                segment_files = M3U8Manager.download_series_content(
+                    m3u8_url, workspace=DownloadWorkspace.for_url(query, self.provider)
+                )
                 return segment_files
-            logger.warning(f"No m3u8 URL found for {player_url}")
+            logger.warning(f"No m3u8 URL found for {query}")
             return None
         except Exception as e:
             logger.error(f"Error loading player page for {query}: {str(e)}")
@@ -1,6 +1,7 @@
 """Anitube provider implementation."""
 
 from ..processors.covertor_manager import ConvertorManager
+from ..processors.download_workspace import DownloadWorkspace
 from ..processors.m3u8_manager import M3U8Manager
 from ..processors.search_manager import SearchManager
 from ..providers.provider_base import ProviderBase
@@ -79,7 +80,6 @@ class AnitubeProvider(ProviderBase):
                 logger.error(f"Failed to get dle_hash for details page: {query}")
                 return []
 
-            series_url = f"{self.playlist_url_template}?news_id={news_id}&xfield=playlist&user_hash={dle_hash}"
             # Playlist endpoint expects same-origin XHR: Referer = series page, X-Requested-With
             ajax_headers = {
                 **self.headers,
@@ -89,20 +89,41 @@ class AnitubeProvider(ProviderBase):
                 "Sec-Fetch-Dest": "empty",
                 "Sec-Fetch-Mode": "cors",
             }
+            groups = SearchManager.get_series_page(
+                self.provider,
+                self._playlist_url(news_id, dle_hash),
+                headers=ajax_headers,
+            )
+            if groups:
+                return groups
+            # The hash may be a cached one the site no longer accepts; retry once
+            # with a freshly scraped hash.
+            dle_hash = SearchManager.get_dle_login_hash(
+                self.provider, self.base_url, self.headers, refresh=True
+            )
+            if not dle_hash:
+                return []
             return SearchManager.get_series_page(
-                self.provider, series_url, headers=ajax_headers
+                self.provider,
+                self._playlist_url(news_id, dle_hash),
+                headers=ajax_headers,
             )
 
         except Exception as e:
             logger.error(f"Error loading details for {query}: {str(e)}")
             return []
 
+    def _playlist_url(self, news_id, dle_hash):
+        return f"{self.playlist_url_template}?news_id={news_id}&xfield=playlist&user_hash={dle_hash}"
+
     def load_player_page(self, query):
         try:
             # Load the master playlist for a series
             m3u8_url = M3U8Manager.get_master_playlist(query, headers=self.headers)
             if m3u8_url:
-                segment_files = M3U8Manager.download_series_content(m3u8_url)
+                segment_files = M3U8Manager.download_series_content(
+                    m3u8_url, workspace=DownloadWorkspace.for_url(query, self.provider)
+                )
                 return segment_files
             logger.warning(f"No m3u8 URL found for {query}")
             return None
@@ -6,7 +6,11 @@ from urllib.parse import urljoin
 
 from ..config import AppConfig
 from ..models.search_result import SearchResult
-from ..models.series import SeriesGroup
+from ..models.series import Series, SeriesGroup
+from ..processors.download_workspace import DownloadWorkspace
+from ..processors.m3u8_manager import M3U8Manager
+from ..processors.mirror_selector import MirrorSelector
+from ..utils.logger import logger
 
 
 class ProviderBase(ABC):
@@ -117,3 +121,41 @@ class ProviderBase(ABC):
             NotImplementedError: If the provider hasn't implemented this method
         """
         raise NotImplementedError("Providers must implement load_player_page")
+
+    def find_master_playlist(self, url: str) -> Optional[str]:
+        """Extract the HLS master playlist URL from a player page.
+
+        Args:
+            url: URL of the player page
+
+        Returns:
+            The m3u8 URL if found, None otherwise
+        """
+        return M3U8Manager.get_master_playlist(
+            url, headers=getattr(self, "headers", None)
+        )
+
+    def download_series(self, series: Series) -> Optional[List[str]]:
+        """Download an episode from the fastest of its player URLs.
+
+        Every URL in series.urls is resolved to its playlist, the mirrors are
+        raced and the download fails over between them (see MirrorSelector).
+
+        Args:
+            series: Episode whose urls are mirrors of each other
+
+        Returns:
+            Segment file paths in playlist order if successful, None otherwise
+        """
+        m3u8_urls = [u for u in map(self.find_master_playlist, series.urls) if u]
+        if not m3u8_urls:
+            logger.warning(f"No m3u8 URL found for {series}")
+            return None
+        workspace = DownloadWorkspace.for_series(
+            series, getattr(self, "provider", None)
+        )
+        try:
+            return MirrorSelector.download(m3u8_urls, workspace=workspace)
+        except Exception as e:
+            logger.error(f"Error downloading {series}: {str(e)}")
+            return None
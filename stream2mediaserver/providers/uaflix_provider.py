@@ -2,6 +2,7 @@
 
 from ..models.series import Series, SeriesGroup, group_series_by_studio
 from ..processors.covertor_manager import ConvertorManager
+from ..processors.download_workspace import DownloadWorkspace
 from ..processors.m3u8_manager import M3U8Manager
 from ..processors.request_manager import RequestManager
 from ..processors.search_manager import SearchManager
@@ -79,7 +80,9 @@ class UaflixProvider(ProviderBase):
             # Load the master playlist for a series
             m3u8_url = M3U8Manager.get_master_playlist(query, headers=self.headers)
             if m3u8_url:
-                segment_files = M3U8Manager.download_series_content(m3u8_url)
+                segment_files = M3U8Manager.download_series_content(
+                    m3u8_url, workspace=DownloadWorkspace.for_url(query, self.provider)
+                )
                 return segment_files
             logger.warning(f"No m3u8 URL found for {query}")
             return None
@@ -1,5 +1,6 @@
 import time
 from ..processors.covertor_manager import ConvertorManager
+from ..processors.download_workspace import DownloadWorkspace
 from ..processors.m3u8_manager import M3U8Manager
 from ..processors.search_manager import SearchManager
 from ..providers.provider_base import ProviderBase
@@ -96,7 +97,9 @@ class UakinoProvider(ProviderBase):
         # Load the master playlist for a series
         m3u8_url = M3U8Manager.get_master_playlist(query)
         if m3u8_url:
-            segment_files = M3U8Manager.download_series_content(m3u8_url)
+            segment_files = M3U8Manager.download_series_content(
+                m3u8_url, workspace=DownloadWorkspace.for_url(query, self.provider)
+            )
             return segment_files
         return None
 
@@ -50,8 +50,12 @@ class TestDataLogger:
 
     @classmethod
     def log_response(
-        cls, response: Optional[requests.Response], error: Optional[str] = None
+        cls,
+        response: Optional[requests.Response],
+        error: Optional[str] = None,
+        body: bool = True,
     ) -> None:
+        """Dump a response and its metadata; body=False skips the body (streamed)."""
         if not cls.enabled or response is None:
             return
         cls.base_dir.mkdir(parents=True, exist_ok=True)
@@ -62,10 +66,11 @@ class TestDataLogger:
         extension = cls._extension_for_response(response)
         filename = f"{provider}_{test_case}_{action}.{timestamp}.{extension}"
         target_path = cls.base_dir / filename
-        try:
-            target_path.write_bytes(response.content or b"")
-        except OSError:
-            return
+        if body:
+            try:
+                target_path.write_bytes(response.content or b"")
+            except OSError:
+                return
         meta_path = target_path.with_suffix(f"{target_path.suffix}.meta.json")
         metadata = {
             "url": response.url,
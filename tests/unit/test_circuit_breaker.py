@@ -0,0 +1,131 @@
+import unittest
+from types import SimpleNamespace
+from unittest.mock import patch
+
+from stream2mediaserver.config import AppConfig, config
+from stream2mediaserver.main_logic import MainLogic
+from stream2mediaserver.processors.circuit_breaker import CircuitBreaker
+from stream2mediaserver.processors.request_manager import RequestManager
+
+
+class CircuitBreakerTests(unittest.TestCase):
+    def test_opens_after_threshold_consecutive_failures(self):
+        breaker = CircuitBreaker()
+        self.assertFalse(breaker.record_failure("a.test", 2))
+        self.assertTrue(breaker.allow("a.test", 60))
+        self.assertTrue(breaker.record_failure("a.test", 2))
+        self.assertFalse(breaker.allow("a.test", 60))
+        self.assertTrue(breaker.is_open("a.test", 60))
+        self.assertTrue(breaker.allow("b.test", 60))
+
+    def test_success_resets_failure_count(self):
+        breaker = CircuitBreaker()
+        breaker.record_failure("a.test", 2)
+        breaker.record_success("a.test")
+        self.assertFalse(breaker.record_failure("a.test", 2))
+
+    def test_half_open_lets_one_probe_through(self):
+        breaker = CircuitBreaker()
+        breaker.record_failure("a.test", 1)
+        self.assertTrue(breaker.allow("a.test", 0))
+        self.assertTrue(breaker.is_open("a.test", 1))
+        self.assertFalse(breaker.allow("a.test", 1))
+
+    def test_probe_outcome_closes_or_reopens(self):
+        breaker = CircuitBreaker()
+        breaker.record_failure("a.test", 1)
+        breaker.allow("a.test", 0)
+        self.assertTrue(breaker.record_failure("a.test", 1))
+        self.assertFalse(breaker.allow("a.test", 60))
+
+        breaker.allow("a.test", 0)
+        breaker.record_success("a.test")
+        self.assertFalse(breaker.is_open("a.test", 60))
+
+
+class FakeResponse:
+    def __init__(self, status_code=200):
+        self.status_code = status_code
+        self.ok = status_code < 400
+        self.headers = {}
+        self.content = b""
+        self.url = "https://dead.test/"
+
+
+class RequestManagerCircuitTests(unittest.TestCase):
+    def setUp(self):
+        provider_config = config.provider_config
+        self._saved = (
+            provider_config.request_delay_seconds,
+            provider_config.max_retries,
+            provider_config.circuit_failure_threshold,
+        )
+        provider_config.request_delay_seconds = 0
+        provider_config.max_retries = 3
+        provider_config.circuit_failure_threshold = 2
+
+    def tearDown(self):
+        provider_config = config.provider_config
+        (
+            provider_config.request_delay_seconds,
+            provider_config.max_retries,
+            provider_config.circuit_failure_threshold,
+        ) = self._saved
+        RequestManager._breaker.reset()
+
+    def _get(self, url="https://dead.test/page"):
+        calls = []
+
+        def fake_request(method, url, **kwargs):
+            calls.append(url)
+            return FakeResponse(503)
+
+        session = SimpleNamespace(request=fake_request)
+        with patch.object(RequestManager, "_session_for", return_value=session), patch(
+            "stream2mediaserver.processors.request_manager.time.sleep"
+        ):
+            response = RequestManager.get(url)
+        return response, calls
+
+    def test_open_circuit_stops_retries_and_short_circuits(self):
+        response, calls = self._get()
+        self.assertIsNone(response)
+        self.assertEqual(len(calls), 2)
+        self.assertTrue(RequestManager.circuit_open("https://dead.test/other"))
+
+        response, calls = self._get()
+        self.assertIsNone(response)
+        self.assertEqual(calls, [])
+
+    def test_client_errors_do_not_trip(self):
+        session = SimpleNamespace(request=lambda method, url, **kw: FakeResponse(404))
+        with patch.object(RequestManager, "_session_for", return_value=session):
+            for _ in range(3):
+                RequestManager.get("https://dead.test/missing")
+        self.assertFalse(RequestManager.circuit_open("https://dead.test/"))
+
+
+class FakeProvider:
+    def __init__(self, config):
+        self.base_url = "https://dead.test"
+
+    def search_title(self, query):
+        raise AssertionError("provider with an open circuit was queried")
+
+
+class MainLogicCircuitTests(unittest.IsolatedAsyncioTestCase):
+    def tearDown(self):
+        RequestManager._breaker.reset()
+
+    async def test_search_skips_providers_with_open_circuit(self):
+        RequestManager._breaker.record_failure("dead.test", 1)
+        logic = MainLogic(AppConfig(providers={"fake_provider": True}))
+
+        with patch.object(MainLogic, "get_provider_class", return_value=FakeProvider):
+            results = await logic.search("query")
+
+        self.assertEqual(results, [])
+
+
+if __name__ == "__main__":
+    unittest.main()
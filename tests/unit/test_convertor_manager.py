@@ -0,0 +1,79 @@
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from stream2mediaserver.processors.covertor_manager import ConvertorManager
+
+# Stands in for ffmpeg: copies stdin to the output path given as last argument.
+COPY_STDIN = [
+    sys.executable,
+    "-c",
+    "import shutil, sys; shutil.copyfileobj(sys.stdin.buffer, open(sys.argv[1], 'wb'))",
+]
+
+
+class RemuxStreamTests(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmp.cleanup)
+        self.output = Path(self._tmp.name) / "out" / "episode.mkv"
+        patcher = patch.object(
+            ConvertorManager,
+            "_build_pipe_command",
+            side_effect=lambda output: [*COPY_STDIN, output],
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_pipes_chunks_in_order(self):
+        ok = ConvertorManager.remux_stream(
+            iter([b"one", b"two", b"three"]), str(self.output)
+        )
+        self.assertTrue(ok)
+        self.assertEqual(self.output.read_bytes(), b"onetwothree")
+
+    def test_failed_source_kills_remux_and_removes_output(self):
+        def chunks():
+            yield b"one"
+            raise RuntimeError("segment lost")
+
+        with self.assertRaises(RuntimeError):
+            ConvertorManager.remux_stream(chunks(), str(self.output))
+        self.assertFalse(self.output.exists())
+
+    def _failing_remux(self, script, chunks):
+        command = [sys.executable, "-c", script]
+        with patch.object(
+            ConvertorManager,
+            "_build_pipe_command",
+            side_effect=lambda output: [*command, output],
+        ):
+            return ConvertorManager.remux_stream(chunks, str(self.output))
+
+    def test_failed_remux_removes_output(self):
+        script = (
+            "import sys; sys.stdin.buffer.read(); "
+            "open(sys.argv[1], 'wb').write(b'partial'); sys.exit(1)"
+        )
+        self.assertFalse(self._failing_remux(script, iter([b"one"])))
+        self.assertFalse(self.output.exists())
+
+    def test_remux_exiting_early_removes_output(self):
+        # Exits without reading stdin: the writer hits a broken pipe.
+        script = "import sys; open(sys.argv[1], 'wb').write(b'partial'); sys.exit(1)"
+        chunks = (b"x" * 65536 for _ in range(64))
+        self.assertFalse(self._failing_remux(script, chunks))
+        self.assertFalse(self.output.exists())
+
+
+class PipeCommandTests(unittest.TestCase):
+    def test_pipe_command_copies_streams(self):
+        command = ConvertorManager._build_pipe_command("out.mkv")
+        self.assertEqual(command[command.index("-i") + 1], "pipe:0")
+        self.assertEqual(command[command.index("-c") + 1], "copy")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,120 @@
+import os
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from stream2mediaserver.config import AppConfig, config
+from stream2mediaserver.models.series import Series
+from stream2mediaserver.processors.download_workspace import DownloadWorkspace
+from stream2mediaserver.processors.mirror_selector import MirrorSelector
+from stream2mediaserver.providers.uakino_provider import UakinoProvider
+
+
+class DownloadWorkspaceTests(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        download_config = config.download
+        self._saved = (
+            download_config.work_root,
+            download_config.disk_budget_bytes,
+            download_config.min_free_bytes,
+            download_config.disk_wait_seconds,
+        )
+        download_config.work_root = Path(self._tmp.name) / "work"
+        download_config.min_free_bytes = 0
+
+    def tearDown(self):
+        download_config = config.download
+        (
+            download_config.work_root,
+            download_config.disk_budget_bytes,
+            download_config.min_free_bytes,
+            download_config.disk_wait_seconds,
+        ) = self._saved
+        DownloadWorkspace._used.clear()
+        self._tmp.cleanup()
+
+    def test_episodes_get_separate_directories(self):
+        first = DownloadWorkspace("uakino", "Title", "Studio", "1 серія")
+        second = DownloadWorkspace("uakino", "Title", "Studio", "2 серія")
+        self.assertNotEqual(first.file("seg-1-v1-a1.ts"), second.file("seg-1-v1-a1.ts"))
+        self.assertTrue(first.path.is_relative_to(config.download.work_root.resolve()))
+
+    def test_series_workspace_is_keyed_by_show_studio_and_episode(self):
+        def path(page, label):
+            series = Series("1", "Studio", label, url=page, provider="uakino")
+            return DownloadWorkspace.for_series(series).path
+
+        first = path("https://a.test/show", "1 серія")
+        self.assertEqual(first, path("https://a.test/show", "1 серія"))
+        self.assertNotEqual(first, path("https://a.test/show", "2 серія"))
+        # Same studio and episode label in another show.
+        self.assertNotEqual(first, path("https://a.test/other", "1 серія"))
+        self.assertEqual(first.parent.name, "Studio")
+
+    def test_download_series_uses_the_episode_workspace(self):
+        series = Series("1", "Studio", "1 серія", url="https://a.test/show")
+        provider = UakinoProvider(AppConfig())
+        with (
+            patch.object(
+                provider, "find_master_playlist", return_value="https://cdn.test/m.m3u8"
+            ),
+            patch.object(MirrorSelector, "download", return_value=[]) as download,
+        ):
+            provider.download_series(series)
+        workspace = download.call_args.kwargs["workspace"]
+        self.assertEqual(
+            workspace.path,
+            DownloadWorkspace("uakino", series.url, "Studio", "1 серія").path,
+        )
+
+    def test_unsafe_names_stay_inside_work_root(self):
+        workspace = DownloadWorkspace.for_url("https://cdn.test/../../x/index.m3u8")
+        self.assertEqual(workspace.path.parent, config.download.work_root.resolve())
+
+    def test_discard_removes_workspace_and_releases_budget(self):
+        workspace = DownloadWorkspace("p", episode="1")
+        segment = workspace.file("00000.ts")
+        with open(segment, "wb") as f:
+            f.write(b"x" * 10)
+        workspace.charge(10)
+        self.assertEqual(DownloadWorkspace.used_bytes(), 10)
+
+        DownloadWorkspace.discard([segment])
+
+        self.assertFalse(os.path.exists(workspace.path))
+        self.assertEqual(DownloadWorkspace.used_bytes(), 0)
+
+    def test_discard_ignores_files_outside_work_root(self):
+        outside = Path(self._tmp.name) / "keep.ts"
+        outside.write_bytes(b"x")
+        DownloadWorkspace.discard([str(outside)])
+        self.assertTrue(outside.exists())
+
+    def test_exhausted_budget_raises_after_wait(self):
+        config.download.disk_budget_bytes = 10
+        config.download.disk_wait_seconds = 0
+        workspace = DownloadWorkspace("p", episode="1")
+        workspace.ensure_room()
+        workspace.charge(10)
+        with self.assertRaises(Exception):
+            DownloadWorkspace("p", episode="2").ensure_room()
+
+    def test_rewritten_file_is_charged_only_for_its_growth(self):
+        workspace = DownloadWorkspace("p", episode="1")
+        workspace.charge(10)
+        workspace.charge(10, replaced=10)  # same segment fetched again
+        workspace.charge(12, replaced=10)
+        self.assertEqual(DownloadWorkspace.used_bytes(), 12)
+
+    def test_reopened_workspace_counts_existing_segments(self):
+        workspace = DownloadWorkspace("p", episode="1")
+        Path(workspace.file("00000.ts")).write_bytes(b"x" * 7)
+        DownloadWorkspace._used.clear()
+        DownloadWorkspace("p", episode="1")
+        self.assertEqual(DownloadWorkspace.used_bytes(), 7)
+
+
+if __name__ == "__main__":
+    unittest.main()
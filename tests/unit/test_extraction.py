@@ -0,0 +1,136 @@
+import unittest
+from importlib.util import find_spec
+from unittest.mock import patch
+
+from stream2mediaserver.config import config
+from stream2mediaserver.parser.extraction import ExtractionSpec, Field
+from stream2mediaserver.parser.html_backend import Strainer
+from stream2mediaserver.processors.request_manager import RequestManager
+from stream2mediaserver.processors.search_manager import SearchManager
+
+CARDS = """
+<div class="nav"><div class="card"><b>Outside scope</b></div></div>
+<div id="list">
+  <div class="card" data-id="1"><b> First </b><i>Rating: 7.5</i></div>
+  <div class="card" data-id="2"><b>Second</b></div>
+  <div class="card"><b>No id</b></div>
+</div>
+"""
+
+
+class ExtractionSpecTests(unittest.TestCase):
+    def test_fields_defaults_required_and_scope(self):
+        spec = ExtractionSpec(
+            scope=("#missing", "#list"),
+            items="div.card",
+            fields={
+                "id": Field(attr="data-id", required=True),
+                "name": Field("b", transforms=(str.strip,)),
+                "rating": Field("i", pattern=r"([\d.]+)", default="n/a"),
+            },
+        )
+        extraction = spec.extract(CARDS)
+        self.assertEqual(
+            extraction.records,
+            [
+                {"id": "1", "name": "First", "rating": "7.5"},
+                {"id": "2", "name": "Second", "rating": "n/a"},
+            ],
+        )
+        self.assertEqual(extraction.skipped, 1)
+
+    def test_model_constants_and_finalize(self):
+        spec = ExtractionSpec(
+            items="div.card[data-id]",
+            fields={"name": Field("b", transforms=(str.strip,))},
+            model=dict,
+            constants={"provider": "test"},
+            finalize=lambda record, index, context: (
+                None if index else {**record, "base": context["base_url"]}
+            ),
+        )
+        extraction = spec.extract(CARDS, base_url="https://x.test")
+        self.assertEqual(
+            extraction.records,
+            [{"name": "First", "base": "https://x.test", "provider": "test"}],
+        )
+
+    def test_scope_without_match_yields_nothing(self):
+        spec = ExtractionSpec(scope=("#missing",), items="div.card", fields={})
+        self.assertEqual(spec.extract(CARDS).records, [])
+
+
+class UakinoSearchSpecTests(unittest.TestCase):
+    HTML = """
+    <a class="search-result-link" href="https://uakino.me/filmy/1-x.html">
+      <img src="/uploads/x.jpg"/>
+      <span class="searchheading">Назва</span>
+      <span class="search-orig-title">Title</span>
+      <div class="search-extend-info"><span>2021</span><span>IMDb 7.9</span></div>
+    </a>
+    """
+
+    class Response:
+        ok = True
+        text = "{}"
+
+        def json(self):
+            return {"content": UakinoSearchSpecTests.HTML}
+
+    def test_search_result_fields(self):
+        with patch.object(RequestManager, "post", return_value=self.Response()):
+            results = SearchManager._search_html(
+                "uakino", "x", "hash", "https://uakino.me", "https://uakino.me/s", None
+            )
+        self.assertEqual(len(results), 1)
+        r = results[0]
+        self.assertEqual(r.image_url, "https://uakino.me/uploads/x.jpg")
+        self.assertEqual((r.title, r.title_eng), ("Назва", "Title"))
+        self.assertEqual((r.year, r.rating), ("2021", "7.9"))
+        self.assertEqual(r.provider, "uakino")
+
+
+class StrainerTests(unittest.TestCase):
+    PAGE = (
+        "<script>var ads = 1;</script><nav><ul><li>Menu</li></ul></nav>"
+        '<div class="content frels2"><div class="video-item"><b>One</b></div></div>'
+        '<a class="sres-wrap clearfix" href="/1">Card</a><a href="/2">Other</a>'
+    )
+
+    def builders(self):
+        return ["html.parser"] + (["lxml"] if find_spec("lxml") else [])
+
+    def test_builds_only_matching_subtrees(self):
+        strainer = Strainer("div#sers-wr", "div.frels2", "a.sres-wrap.clearfix")
+        for builder in self.builders():
+            with self.subTest(builder=builder), patch.object(
+                config.provider_config, "html_parser", builder
+            ):
+                spec = ExtractionSpec(
+                    items="div.video-item", fields={}, parse_only=strainer
+                )
+                soup = spec.soup(self.PAGE)
+                self.assertEqual(
+                    [tag.name for tag in soup.find_all(recursive=False)], ["div", "a"]
+                )
+                self.assertIsNone(soup.find("script"))
+                self.assertEqual(soup.select_one("div.video-item b").text, "One")
+
+    def test_partial_parse_extracts_the_same_records(self):
+        fields = {"name": Field("b"), "id": Field(attr="data-id")}
+        full = ExtractionSpec(scope=("#list",), items="div.card", fields=fields)
+        partial = ExtractionSpec(
+            scope=("#list",),
+            items="div.card",
+            fields=fields,
+            parse_only=Strainer("div#list"),
+        )
+        self.assertEqual(partial.extract(CARDS), full.extract(CARDS))
+
+    def test_rejects_unsupported_rules(self):
+        with self.assertRaises(ValueError):
+            Strainer("div > a")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,216 @@
+import errno
+import re
+import tempfile
+import threading
+import unittest
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import patch
+
+from stream2mediaserver.config import config
+from stream2mediaserver.processors.covertor_manager import ConvertorManager
+from stream2mediaserver.processors.file_manager import TS_PACKET_SIZE, FileManager
+from stream2mediaserver.processors.request_manager import RequestManager
+
+
+def ts_packets(count, fill):
+    return (b"\x47" + bytes([fill]) * (TS_PACKET_SIZE - 1)) * count
+
+
+class ConcatenateFilesTests(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmp.cleanup)
+        self.dir = Path(self._tmp.name)
+        self.segments = []
+        for i in range(3):
+            path = self.dir / f"{i}.ts"
+            path.write_bytes(ts_packets(i + 1, i))
+            self.segments.append(str(path))
+        self.expected = b"".join(Path(p).read_bytes() for p in self.segments)
+        self.output = self.dir / "out.ts"
+
+    def test_joins_segments_in_order(self):
+        FileManager.concatenate_files(self.segments, str(self.output))
+        self.assertEqual(self.output.read_bytes(), self.expected)
+
+    def test_falls_back_when_kernel_copy_is_unsupported(self):
+        with patch.object(
+            FileManager,
+            "_kernel_copy",
+            side_effect=OSError(errno.EXDEV, "cross-device"),
+        ):
+            FileManager.concatenate_files(self.segments, str(self.output))
+        self.assertEqual(self.output.read_bytes(), self.expected)
+
+    def test_finishes_a_partial_kernel_copy(self):
+        real_copy = FileManager._kernel_copy
+
+        def half_copy(in_fd, out_fd, size):
+            return real_copy(in_fd, out_fd, size // 2)
+
+        with patch.object(FileManager, "_kernel_copy", side_effect=half_copy):
+            FileManager.concatenate_files(self.segments, str(self.output))
+        self.assertEqual(self.output.read_bytes(), self.expected)
+
+    def test_kernel_copy_failing_partway_is_not_duplicated(self):
+        real_copy = FileManager._kernel_copy
+
+        def failing_copy(in_fd, out_fd, size):
+            real_copy(in_fd, out_fd, size // 2)
+            raise OSError(errno.EINVAL, "invalid argument")
+
+        with patch.object(FileManager, "_kernel_copy", side_effect=failing_copy):
+            FileManager.concatenate_files(self.segments, str(self.output))
+        self.assertEqual(self.output.read_bytes(), self.expected)
+
+    def test_ts_alignment_check(self):
+        self.assertTrue(FileManager.is_ts_aligned(self.segments[0]))
+        odd = self.dir / "odd.ts"
+        odd.write_bytes(ts_packets(1, 0) + b"\x47")
+        self.assertFalse(FileManager.is_ts_aligned(str(odd)))
+        fmp4 = self.dir / "seg.m4s"
+        fmp4.write_bytes(b"\x00" * TS_PACKET_SIZE)
+        self.assertFalse(FileManager.is_ts_aligned(str(fmp4)))
+
+    def test_ts_output_skips_ffmpeg_for_aligned_segments(self):
+        with patch.object(ConvertorManager, "concatenate_to_mkv") as ffmpeg:
+            output = ConvertorManager.concatenate_segments_ts(
+                self.segments, str(self.dir / "final"), "episode"
+            )
+        ffmpeg.assert_not_called()
+        self.assertEqual(Path(output).read_bytes(), self.expected)
+
+
+class FakeFileServer:
+    """Serves `body` to RequestManager.stream, honouring Range if `ranges`."""
+
+    def __init__(self, body, ranges=True, break_after=None):
+        self.body = body
+        self.ranges = ranges
+        self.break_after = break_after
+        self.requests = []
+        self._lock = threading.Lock()
+
+    def head(self, url, headers=None):
+        accept = {"Accept-Ranges": "bytes"} if self.ranges else {}
+        return SimpleNamespace(
+            status_code=200, headers={"Content-Length": str(len(self.body)), **accept}
+        )
+
+    def stream(self, url, sink, headers=None, **kwargs):
+        range_header = (headers or {}).get("Range")
+        with self._lock:
+            self.requests.append(range_header)
+            broken = self.break_after is not None
+            cut, self.break_after = self.break_after, None
+        status, data = 200, self.body
+        headers = {"Content-Length": str(len(self.body))}
+        if range_header and self.ranges:
+            start, end = re.match(r"bytes=(\d+)-(\d*)", range_header).groups()
+            data = self.body[int(start) : int(end) + 1 if end else None]
+            status = 206
+            last = int(start) + len(data) - 1
+            headers = {"Content-Range": f"bytes {start}-{last}/{len(self.body)}"}
+        if broken:
+            sink(data[:cut])
+            return None
+        sink(data)
+        return SimpleNamespace(status_code=status, headers=headers)
+
+
+class DownloadFileTests(unittest.TestCase):
+    BODY = bytes(range(256)) * 40
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmp.cleanup)
+        self.dir = Path(self._tmp.name)
+        download_config = config.download
+        self._saved = download_config.min_part_bytes
+        download_config.min_part_bytes = 1024
+        self.addCleanup(setattr, download_config, "min_part_bytes", self._saved)
+        sleep = patch("stream2mediaserver.processors.file_manager.time.sleep")
+        sleep.start()
+        self.addCleanup(sleep.stop)
+
+    def _download(self, server, **kwargs):
+        with (
+            patch.object(RequestManager, "head", side_effect=server.head),
+            patch.object(RequestManager, "stream", side_effect=server.stream),
+        ):
+            return FileManager.download_file(
+                "https://cdn.test/ep.mp4", str(self.dir), "ep.mp4", **kwargs
+            )
+
+    def test_single_stream_download_reports_progress(self):
+        seen = []
+        path = self._download(
+            FakeFileServer(self.BODY, ranges=False),
+            progress=lambda done, total: seen.append((done, total)),
+        )
+        self.assertEqual(Path(path).read_bytes(), self.BODY)
+        self.assertEqual(seen[-1], (len(self.BODY), len(self.BODY)))
+        self.assertFalse((self.dir / "ep.mp4.part").exists())
+
+    def test_resumes_existing_part_file_with_range(self):
+        (self.dir / "ep.mp4.part").write_bytes(self.BODY[:1000])
+        server = FakeFileServer(self.BODY)
+        path = self._download(server, parts=1)
+        self.assertEqual(server.requests, ["bytes=1000-"])
+        self.assertEqual(Path(path).read_bytes(), self.BODY)
+
+    def test_broken_transfer_is_resumed(self):
+        server = FakeFileServer(self.BODY, break_after=700)
+        path = self._download(server, parts=1)
+        self.assertEqual(server.requests, [None, "bytes=700-"])
+        self.assertEqual(Path(path).read_bytes(), self.BODY)
+
+    def test_parallel_parts_are_joined_in_order(self):
+        server = FakeFileServer(self.BODY)
+        path = self._download(server, parts=4)
+        self.assertEqual(len(server.requests), 4)
+        self.assertEqual(Path(path).read_bytes(), self.BODY)
+        self.assertEqual(sorted(p.name for p in self.dir.iterdir()), ["ep.mp4"])
+
+    def test_ignored_range_restarts_from_scratch(self):
+        (self.dir / "ep.mp4.part").write_bytes(b"stale")
+        server = FakeFileServer(self.BODY)
+        server.ranges = False
+        server.head = FakeFileServer(self.BODY).head  # advertises ranges anyway
+        path = self._download(server, parts=1)
+        self.assertEqual(Path(path).read_bytes(), self.BODY)
+        # The 200 answer is kept as the download, not fetched a second time.
+        self.assertEqual(server.requests, ["bytes=5-"])
+
+    def test_resumes_and_checks_length_without_head(self):
+        server = FakeFileServer(self.BODY, break_after=700)
+        server.head = lambda url, headers=None: None
+        progress = []
+        path = self._download(
+            server, parts=4, progress=lambda done, total: progress.append(total)
+        )
+        self.assertEqual(server.requests, [None, "bytes=700-"])
+        self.assertEqual(Path(path).read_bytes(), self.BODY)
+        self.assertEqual(progress[-1], len(self.BODY))
+
+    def test_short_body_is_rejected_without_head(self):
+        server = FakeFileServer(self.BODY)
+        server.head = lambda url, headers=None: None
+        server.stream = lambda url, sink, headers=None, **kwargs: (
+            sink(self.BODY[:100]),
+            SimpleNamespace(status_code=200, headers={"Content-Length": "10240"}),
+        )[1]
+        self.assertIsNone(self._download(server))
+
+    def test_length_mismatch_is_rejected(self):
+        server = FakeFileServer(self.BODY, ranges=False)
+        server.head = lambda url, headers=None: SimpleNamespace(
+            status_code=200, headers={"Content-Length": "1"}
+        )
+        self.assertIsNone(self._download(server))
+        self.assertEqual(list(self.dir.iterdir()), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,118 @@
+import itertools
+import os
+import tempfile
+import unittest
+from types import SimpleNamespace
+from unittest.mock import patch
+
+from stream2mediaserver.config import config
+from stream2mediaserver.processors.live_follower import LiveFollower
+from stream2mediaserver.processors.m3u8_manager import M3U8Manager
+from stream2mediaserver.processors.request_manager import RequestManager
+
+OK = SimpleNamespace(headers={})
+
+
+def live_playlist(first, count, ended=False):
+    return SimpleNamespace(
+        media_sequence=first,
+        target_duration=4,
+        is_endlist=ended,
+        segments=[
+            SimpleNamespace(absolute_uri=f"https://cdn.test/{n}.ts")
+            for n in range(first, first + count)
+        ],
+    )
+
+
+class LiveFollowerTests(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmp.cleanup)
+        self.output = os.path.join(self._tmp.name, "live.ts")
+        self.fetched = []
+
+        def fake_stream(url, sink, **kwargs):
+            self.fetched.append(url)
+            sink(url.rsplit("/", 1)[1].encode())
+            return OK
+
+        stream = patch.object(RequestManager, "stream", side_effect=fake_stream)
+        stream.start()
+        self.addCleanup(stream.stop)
+
+    def _follow(self, polls):
+        follower = LiveFollower("https://cdn.test/index.m3u8", self.output)
+        waits = []
+        with patch.object(M3U8Manager, "load_m3u8", side_effect=polls), patch.object(
+            follower.stop, "wait", side_effect=lambda t: waits.append(t) or False
+        ):
+            written = follower.run()
+        return written, waits
+
+    def test_fetches_only_new_sequence_numbers_until_endlist(self):
+        written, waits = self._follow(
+            [
+                live_playlist(0, 3),
+                live_playlist(0, 3),
+                live_playlist(1, 4),
+                live_playlist(2, 4, ended=True),
+            ]
+        )
+        self.assertEqual(written, 6)
+        self.assertEqual(self.fetched, [f"https://cdn.test/{n}.ts" for n in range(6)])
+        with open(self.output, "rb") as f:
+            self.assertEqual(f.read(), b"0.ts1.ts2.ts3.ts4.ts5.ts")
+        # Full target duration after growth, half when unchanged.
+        self.assertEqual(waits, [4, 2, 4])
+
+    def test_skips_segments_that_expired_before_a_poll(self):
+        written, _ = self._follow(
+            [live_playlist(0, 2), live_playlist(5, 2, ended=True)]
+        )
+        self.assertEqual(written, 4)
+        self.assertEqual(
+            self.fetched[2:], ["https://cdn.test/5.ts", "https://cdn.test/6.ts"]
+        )
+
+    def test_failed_poll_is_retried(self):
+        written, waits = self._follow(
+            [
+                live_playlist(0, 2),
+                Exception("Failed to load playlist"),
+                live_playlist(0, 3, ended=True),
+            ]
+        )
+        self.assertEqual(written, 3)
+        self.assertEqual(waits, [4, 2])
+
+    def test_gives_up_when_polls_keep_failing(self):
+        # Every clock reading is 50s after the previous one.
+        clock = patch(
+            "stream2mediaserver.processors.live_follower.time.monotonic",
+            side_effect=itertools.count(0, 50),
+        )
+        with clock, patch.object(config.download, "live_idle_seconds", 120):
+            written, waits = self._follow(
+                [live_playlist(0, 1), Exception("timeout"), Exception("timeout")]
+            )
+        self.assertEqual(written, 1)
+        self.assertEqual(waits, [4, 2])
+
+    def test_polls_bypass_the_http_cache(self):
+        responses = [
+            SimpleNamespace(
+                ok=True,
+                url="https://cdn.test/live",
+                text="#EXTM3U\n#EXT-X-TARGETDURATION:4\n#EXTINF:4,\n0.ts\n"
+                "#EXT-X-ENDLIST\n",
+            )
+        ]
+        follower = LiveFollower("https://cdn.test/live", self.output)
+        with patch.object(RequestManager, "get", side_effect=responses) as get:
+            self.assertEqual(follower.run(), 1)
+        self.assertTrue(get.call_args.kwargs["fresh"])
+
+
+if __name__ == "__main__":
+    unittest.main()
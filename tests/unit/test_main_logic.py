@@ -1,10 +1,16 @@
+import asyncio
+import threading
+import time
 import unittest
 from types import SimpleNamespace
 from unittest.mock import patch
 
 from stream2mediaserver.config import AppConfig
 from stream2mediaserver.main_logic import MainLogic
-from stream2mediaserver.models.search_result import SearchResult
+from stream2mediaserver.models.search_result import (
+    ProviderSearchStatus,
+    SearchResult,
+)
 from stream2mediaserver.models.series import Series
 
 
@@ -27,6 +33,26 @@ class FakeProvider:
         return Series(studio_id="1", studio_name="Studio", series="Episode 1", url=url)
 
 
+class SlowProvider(FakeProvider):
+    release = threading.Event()
+
+    def search_title(self, query):
+        self.release.wait(5)
+        return super().search_title(query)
+
+
+class FailingProvider(FakeProvider):
+    def search_title(self, query):
+        raise RuntimeError("boom")
+
+
+PROVIDER_CLASSES = {
+    "fast_provider": FakeProvider,
+    "slow_provider": SlowProvider,
+    "failing_provider": FailingProvider,
+}
+
+
 class FakeConvertor:
     def __init__(self, config):
         self.config = config
@@ -45,6 +71,10 @@ class MainLogicUnitTests(unittest.IsolatedAsyncioTestCase):
 
         self.assertEqual(len(results), 1)
         self.assertEqual(results[0].title, "Test")
+        self.assertEqual(
+            [work.links for work in results.works],
+            [{"fake": ["http://example.com/item"]}],
+        )
 
     async def test_process_item_with_search_result_loads_details(self):
         config = AppConfig(providers={"fake_provider": True})
@@ -99,5 +129,66 @@ class MainLogicUnitTests(unittest.IsolatedAsyncioTestCase):
             await logic.process_item(SimpleNamespace())
 
 
+class MainLogicDeadlineTests(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        SlowProvider.release.clear()
+        self.logic = MainLogic(
+            AppConfig(providers={name: True for name in PROVIDER_CLASSES})
+        )
+        patcher = patch.object(
+            MainLogic, "get_provider_class", side_effect=PROVIDER_CLASSES.get
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    async def asyncTearDown(self):
+        # Let the abandoned worker thread finish before the loop shuts down.
+        SlowProvider.release.set()
+
+    async def test_budget_returns_finished_providers_with_statuses(self):
+        results = await self.logic.search("query", timeout_budget=0.3)
+
+        self.assertEqual(len(results), 1)
+        self.assertFalse(results.complete)
+        states = {name: s.state for name, s in results.statuses.items()}
+        self.assertEqual(
+            states,
+            {
+                "fast_provider": ProviderSearchStatus.OK,
+                "slow_provider": ProviderSearchStatus.TIMEOUT,
+                "failing_provider": ProviderSearchStatus.ERROR,
+            },
+        )
+
+    async def test_search_iter_yields_providers_as_they_finish(self):
+        order = []
+        async for status, results in self.logic.search_iter("query"):
+            order.append(status.provider)
+            if status.provider == "fast_provider":
+                self.assertEqual(len(results), 1)
+                SlowProvider.release.set()
+
+        self.assertEqual(order[-1], "slow_provider")
+        self.assertCountEqual(order, PROVIDER_CLASSES)
+
+
+class MainLogicShutdownTests(unittest.TestCase):
+    def test_event_loop_exit_does_not_wait_for_timed_out_providers(self):
+        SlowProvider.release.clear()
+        self.addCleanup(SlowProvider.release.set)
+        logic = MainLogic(AppConfig(providers={"slow_provider": True}))
+
+        started = time.monotonic()
+        with patch.object(
+            MainLogic, "get_provider_class", side_effect=PROVIDER_CLASSES.get
+        ):
+            results = asyncio.run(logic.search("query", timeout_budget=0.1))
+
+        self.assertLess(time.monotonic() - started, 2)
+        self.assertEqual(
+            results.statuses["slow_provider"].state, ProviderSearchStatus.TIMEOUT
+        )
+
+
 if __name__ == "__main__":
     unittest.main()
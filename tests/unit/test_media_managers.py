@@ -1,8 +1,37 @@
+import tempfile
 import unittest
+from pathlib import Path
 from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
 
-from stream2mediaserver.processors.m3u8_manager import M3U8Manager
+from stream2mediaserver.processors.covertor_manager import ConvertorManager
+from stream2mediaserver.processors.m3u8_manager import AsyncM3U8Manager, M3U8Manager
 from stream2mediaserver.processors.mp4_manager import MP4Manager
+from stream2mediaserver.processors.request_manager import (
+    AsyncRequestManager,
+    RequestManager,
+)
+from stream2mediaserver.processors.segment_downloader import SegmentDownloader
+
+MASTER = """#EXTM3U
+#EXT-X-STREAM-INF:BANDWIDTH=800000,RESOLUTION=640x360
+360/index.m3u8
+#EXT-X-STREAM-INF:BANDWIDTH=2500000,RESOLUTION=1280x720
+720/index.m3u8
+"""
+MEDIA = """#EXTM3U
+#EXT-X-TARGETDURATION:4
+#EXTINF:4.0,
+seg-0.ts
+#EXTINF:4.0,
+seg-1.ts
+#EXT-X-ENDLIST
+"""
+
+
+def playlist_response(url):
+    text = MASTER if url.endswith("master.m3u8") else MEDIA
+    return SimpleNamespace(ok=True, text=text, url=url)
 
 
 class MediaManagerUnitTests(unittest.TestCase):
@@ -34,5 +63,92 @@ class MediaManagerUnitTests(unittest.TestCase):
         self.assertEqual(best, "http://example.com/720.mp4")
 
 
+class PlaylistLoadingTests(unittest.TestCase):
+    def test_media_playlist_is_fetched_through_request_manager(self):
+        with patch.object(
+            RequestManager,
+            "get",
+            side_effect=lambda url, **kwargs: playlist_response(url),
+        ) as get:
+            media = M3U8Manager.load_media_playlist("https://cdn.test/ep1/master.m3u8")
+
+        self.assertEqual(get.call_args.args[0], "https://cdn.test/ep1/720/index.m3u8")
+        self.assertEqual(
+            [s.absolute_uri for s in media.segments],
+            [
+                "https://cdn.test/ep1/720/seg-0.ts",
+                "https://cdn.test/ep1/720/seg-1.ts",
+            ],
+        )
+
+    def test_failed_fetch_raises(self):
+        with patch.object(RequestManager, "get", return_value=None):
+            with self.assertRaises(Exception):
+                M3U8Manager.load_m3u8("https://cdn.test/master.m3u8")
+
+
+class RemuxSeriesContentTests(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmp.cleanup)
+        self.output = Path(self._tmp.name) / "ep1.mkv"
+        self.bodies = MagicMock()
+        playlist = SimpleNamespace(
+            segments=[
+                SimpleNamespace(absolute_uri=f"https://cdn.test/{n}.ts")
+                for n in range(2)
+            ]
+        )
+        for patcher in (
+            patch.object(M3U8Manager, "load_media_playlist", return_value=playlist),
+            patch.object(SegmentDownloader, "iter_bodies", return_value=self.bodies),
+        ):
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def test_pipes_segment_bodies_into_the_output(self):
+        with patch.object(ConvertorManager, "remux_stream", return_value=True) as remux:
+            output = M3U8Manager.remux_series_content(
+                "https://cdn.test/master.m3u8", str(self.output)
+            )
+        self.assertEqual(output, str(self.output))
+        remux.assert_called_once_with(self.bodies, str(self.output))
+        SegmentDownloader.iter_bodies.assert_called_once_with(
+            ["https://cdn.test/0.ts", "https://cdn.test/1.ts"]
+        )
+        self.bodies.close.assert_called_once_with()
+
+    def test_failed_remux_discards_partial_output(self):
+        def failing_remux(bodies, output_file):
+            Path(output_file).write_bytes(b"partial")
+            raise Exception("Failed to download segment")
+
+        with patch.object(ConvertorManager, "remux_stream", side_effect=failing_remux):
+            with self.assertRaises(Exception):
+                M3U8Manager.remux_series_content(
+                    "https://cdn.test/master.m3u8", str(self.output)
+                )
+        self.bodies.close.assert_called_once_with()
+        self.assertFalse(self.output.exists())
+
+
+class AsyncPlaylistLoadingTests(unittest.IsolatedAsyncioTestCase):
+    async def test_resolves_many_episodes_concurrently(self):
+        async def fake_get(url, headers=None):
+            if "/ep3/" in url:
+                return None
+            return playlist_response(url)
+
+        urls = [f"https://cdn.test/ep{i}/master.m3u8" for i in (1, 2, 3)]
+        with patch.object(AsyncRequestManager, "get", side_effect=fake_get):
+            playlists = await AsyncM3U8Manager.resolve_media_playlists(urls)
+
+        self.assertEqual(len(playlists[0].segments), 2)
+        self.assertEqual(
+            playlists[1].segments[0].absolute_uri, "https://cdn.test/ep2/720/seg-0.ts"
+        )
+        self.assertIsNone(playlists[2])
+
+
 if __name__ == "__main__":
     unittest.main()
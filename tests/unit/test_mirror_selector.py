@@ -0,0 +1,101 @@
+import tempfile
+import unittest
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import patch
+
+from stream2mediaserver.config import config
+from stream2mediaserver.processors.download_workspace import DownloadWorkspace
+from stream2mediaserver.processors.m3u8_manager import M3U8Manager
+from stream2mediaserver.processors.mirror_selector import MirrorSelector
+from stream2mediaserver.processors.request_manager import RequestManager
+
+OK = SimpleNamespace(headers={})
+
+
+def playlist(host, count=3):
+    return SimpleNamespace(
+        segments=[
+            SimpleNamespace(absolute_uri=f"https://{host}/seg-{i}.ts", duration=4.0)
+            for i in range(count)
+        ]
+    )
+
+
+class MirrorSelectorTests(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmp.cleanup)
+        download_config = config.download
+        saved = download_config.work_root, download_config.segment_retries
+        download_config.work_root = Path(self._tmp.name)
+        download_config.segment_retries = 0
+
+        def restore():
+            download_config.work_root, download_config.segment_retries = saved
+            DownloadWorkspace._used.clear()
+
+        self.addCleanup(restore)
+        load = patch.object(
+            M3U8Manager,
+            "load_media_playlist",
+            side_effect=lambda url: playlist(url.split("/")[2]),
+        )
+        load.start()
+        self.addCleanup(load.stop)
+
+    def _timings(self, table):
+        return patch.object(
+            M3U8Manager,
+            "time_segment",
+            side_effect=lambda url: table[url.split("/")[2]],
+        )
+
+    def test_rank_orders_by_expected_segment_time_and_drops_dead_mirrors(self):
+        timings = {
+            "slow.test": (0.1, 1000, 100.0),
+            "fast.test": (0.5, 1000, 10_000.0),
+            "dead.test": None,
+        }
+        urls = [f"https://{host}/index.m3u8" for host in timings]
+        with self._timings(timings):
+            probes = MirrorSelector.rank(urls)
+        self.assertEqual(
+            [p.url for p in probes],
+            ["https://fast.test/index.m3u8", "https://slow.test/index.m3u8"],
+        )
+
+    def test_fails_over_and_keeps_segments_of_the_same_encode(self):
+        timings = {"a.test": (0.1, 3, 1000.0), "b.test": (0.2, 3, 100.0)}
+        fetched = []
+
+        def fake_stream(url, sink, **kwargs):
+            fetched.append(url)
+            if url == "https://a.test/seg-2.ts":
+                return None
+            sink(b"seg")
+            return OK
+
+        with self._timings(timings), patch.object(
+            RequestManager, "stream", side_effect=fake_stream
+        ):
+            paths = MirrorSelector.download(
+                ["https://a.test/index.m3u8", "https://b.test/index.m3u8"]
+            )
+
+        self.assertEqual(len(paths), 3)
+        self.assertTrue(all(Path(p).read_bytes() == b"seg" for p in paths))
+        self.assertIn("https://b.test/seg-2.ts", fetched)
+        self.assertNotIn("https://b.test/seg-0.ts", fetched)
+
+    def test_raises_when_every_mirror_fails(self):
+        timings = {"a.test": (0.1, 3, 1000.0)}
+        with self._timings(timings), patch.object(
+            RequestManager, "stream", return_value=None
+        ):
+            with self.assertRaises(Exception):
+                MirrorSelector.download(["https://a.test/index.m3u8"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,9 +1,12 @@
 """Parsing rules derived from real provider markup (see anitube/uaflix structures)."""
 
 import unittest
+from importlib.util import find_spec
 from unittest.mock import patch
 
+from stream2mediaserver.config import config
 from stream2mediaserver.models.series import group_series_by_studio
+from stream2mediaserver.parser.html_backend import tree_builder
 from stream2mediaserver.processors.request_manager import RequestManager
 from stream2mediaserver.processors.search_manager import SearchManager
 
@@ -109,8 +112,10 @@ class AnitubeStudioResolutionTests(unittest.TestCase):
         # Same episode under two players merges into one entry with both URLs.
         merged = group_series_by_studio(series)
         self.assertEqual(len(merged), 1)
-        self.assertEqual(merged[0].episodes[0].urls,
-                         ["https://ashdi.vip/vod/1", "https://moonanime.art/iframe/a"])
+        self.assertEqual(
+            merged[0].episodes[0].urls,
+            ["https://ashdi.vip/vod/1", "https://moonanime.art/iframe/a"],
+        )
 
 
 class TitleRelevanceTests(unittest.TestCase):
@@ -121,11 +126,15 @@ class TitleRelevanceTests(unittest.TestCase):
 
     def test_full_match_scores_one(self):
         self.assertEqual(
-            self.score("Attack on Titan", "Атака титанів", "Attack on Titan"), 1.0)
+            self.score("Attack on Titan", "Атака титанів", "Attack on Titan"), 1.0
+        )
         # 'Season 3' suffix must not dilute the score.
         self.assertEqual(
-            self.score("Attack on Titan", "Атака титанів - 3 сезон",
-                       "Attack on Titan Season 3"), 1.0)
+            self.score(
+                "Attack on Titan", "Атака титанів - 3 сезон", "Attack on Titan Season 3"
+            ),
+            1.0,
+        )
 
     def test_matches_across_languages(self):
         self.assertEqual(self.score("Наруто", "Наруто", "Naruto"), 1.0)
@@ -139,15 +148,19 @@ class TitleRelevanceTests(unittest.TestCase):
     def test_unrelated_scores_zero(self):
         self.assertEqual(
             self.score("Rick and Morty", "Небо на березі Червоної річки", "Red River"),
-            0.0)
+            0.0,
+        )
 
     def test_fuzzy_matches_long_token_spelling_variants(self):
         self.assertEqual(
-            self.score("Naruto Shippuden", "Наруто", "Naruto Shippuuden"), 1.0)
+            self.score("Naruto Shippuden", "Наруто", "Naruto Shippuuden"), 1.0
+        )
 
     def test_short_tokens_do_not_fuzzy_collide(self):
         # 'dan' vs 'data' scores 0.86 — close enough to match if fuzz were allowed.
-        self.assertEqual(self.score("Dan Da Dan", "Red Data Girl", "Red Data Girl"), 0.0)
+        self.assertEqual(
+            self.score("Dan Da Dan", "Red Data Girl", "Red Data Girl"), 0.0
+        )
 
     def test_stopword_only_query_is_not_filtered(self):
         # Nothing significant to judge on; better to pass results through than
@@ -161,38 +174,56 @@ class TitleRelevanceTests(unittest.TestCase):
 class AnimeonSearchFilterTests(unittest.TestCase):
     @staticmethod
     def _payload(*titles):
-        return {"result": [{"id": i, "titleUa": ua, "titleEn": en}
-                           for i, (ua, en) in enumerate(titles, 1)]}
+        return {
+            "result": [
+                {"id": i, "titleUa": ua, "titleEn": en}
+                for i, (ua, en) in enumerate(titles, 1)
+            ]
+        }
 
     def _search(self, query, payload):
-        with patch.object(RequestManager, "get",
-                          return_value=FakeResponse(payload)):
+        with patch.object(RequestManager, "get", return_value=FakeResponse(payload)):
             return SearchManager._search_animeon(
-                query, "https://animeon.club/api/anime/search", None,
-                "https://animeon.club")
+                query,
+                "https://animeon.club/api/anime/search",
+                None,
+                "https://animeon.club",
+            )
 
     def test_drops_unrelated_filler(self):
-        results = self._search("Rick and Morty", self._payload(
-            ("Мої мачуха та сестри зовсім не лихі", "My Stepmother and Stepsisters"),
-            ("Небо на березі Червоної річки", "Red River"),
-        ))
+        results = self._search(
+            "Rick and Morty",
+            self._payload(
+                (
+                    "Мої мачуха та сестри зовсім не лихі",
+                    "My Stepmother and Stepsisters",
+                ),
+                ("Небо на березі Червоної річки", "Red River"),
+            ),
+        )
         self.assertEqual(results, [])
 
     def test_keeps_genuine_hits(self):
-        results = self._search("Dan Da Dan", self._payload(
-            ("Дандадан", "Dan Da Dan"),
-            ("Дандадан - 2 сезон", "Dan Da Dan Season 2"),
-            ("Замальовки Хідамарі", "Hidamari Sketch"),
-        ))
+        results = self._search(
+            "Dan Da Dan",
+            self._payload(
+                ("Дандадан", "Dan Da Dan"),
+                ("Дандадан - 2 сезон", "Dan Da Dan Season 2"),
+                ("Замальовки Хідамарі", "Hidamari Sketch"),
+            ),
+        )
         self.assertEqual([r.title for r in results], ["Дандадан", "Дандадан - 2 сезон"])
         self.assertEqual(results[0].provider, "animeon")
 
     def test_url_encoded_query_is_decoded_before_matching(self):
         # search_movies passes a %-encoded query through to the parser.
-        results = self._search("Attack%20on%20Titan", self._payload(
-            ("Атака титанів", "Attack on Titan"),
-            ("Замальовки Хідамарі", "Hidamari Sketch"),
-        ))
+        results = self._search(
+            "Attack%20on%20Titan",
+            self._payload(
+                ("Атака титанів", "Attack on Titan"),
+                ("Замальовки Хідамарі", "Hidamari Sketch"),
+            ),
+        )
         self.assertEqual([r.title for r in results], ["Атака титанів"])
 
 
@@ -220,10 +251,12 @@ class UaflixSeasonGroupingTests(unittest.TestCase):
 
     def test_premiere_prefixed_episode_stays_in_its_season(self):
         series = SearchManager.parse_uaflix_series_page_html(
-            self._page([
-                "Сезон 9 Серія 1 Щось є в Морті",
-                "Прем'єра. 20.07.2026 Сезон 9 Серія 9 Вітайте своїх смертних",
-            ])
+            self._page(
+                [
+                    "Сезон 9 Серія 1 Щось є в Морті",
+                    "Прем'єра. 20.07.2026 Сезон 9 Серія 9 Вітайте своїх смертних",
+                ]
+            )
         )
         self.assertEqual(len(series), 2)
         self.assertEqual({s.studio_id for s in series}, {"season_9"})
@@ -256,7 +289,9 @@ class AnitubeSearchFieldTests(unittest.TestCase):
         with patch.object(
             RequestManager, "post", return_value=FakeResponse(text=self.HTML)
         ):
-            results = SearchManager._search_anitube("Ван Піс", "hash", "url", None, None)
+            results = SearchManager._search_html(
+                "anitube", "Ван Піс", "hash", "https://anitube.in.ua", "url", None
+            )
         self.assertEqual(len(results), 1)
         r = results[0]
         self.assertEqual(r.title, "Ван Піс")
@@ -266,5 +301,63 @@ class AnitubeSearchFieldTests(unittest.TestCase):
         self.assertIn("король піратів", r.description)
 
 
+class UaflixSearchFieldTests(unittest.TestCase):
+    @staticmethod
+    def _search(src):
+        html = (
+            f'<a class="sres-wrap clearfix" href="/serials/rick/">'
+            f'<img src="{src}"/><h2>Рік і Морті / Rick and Morty</h2></a>'
+        )
+        response = FakeResponse(text=html)
+        with (
+            patch.object(RequestManager, "get", return_value=response),
+            patch.object(RequestManager, "post", return_value=response),
+        ):
+            return SearchManager._search_html(
+                "uaflix", "Rick", "hash", "https://uafix.net", "url", None
+            )
+
+    def test_relative_poster_is_made_absolute(self):
+        (result,) = self._search("/posters/rick.jpg")
+        self.assertEqual(result.image_url, "https://uafix.net/posters/rick.jpg")
+        self.assertEqual(result.title_eng, "Rick and Morty")
+
+    def test_empty_poster_stays_empty(self):
+        (result,) = self._search("")
+        self.assertIsNone(result.image_url)
+
+
+class TreeBuilderTests(unittest.TestCase):
+    def test_configured_builder_wins(self):
+        with patch.object(config.provider_config, "html_parser", "html.parser"):
+            self.assertEqual(tree_builder(), "html.parser")
+
+    @unittest.skipUnless(find_spec("lxml"), "lxml not installed")
+    def test_lxml_and_html_parser_extract_the_same_fields(self):
+        page = UaflixSeasonGroupingTests._page(
+            ["Сезон 9 Серія 1 Щось є в Морті", "Сезон 9 Серія 2 Інше"]
+        )
+        extracted = {}
+        for builder in ("html.parser", "lxml"):
+            with (
+                patch.object(config.provider_config, "html_parser", builder),
+                patch.object(
+                    RequestManager,
+                    "post",
+                    return_value=FakeResponse(text=AnitubeSearchFieldTests.HTML),
+                ),
+            ):
+                results = SearchManager._search_html(
+                    "anitube", "q", "hash", "https://anitube.in.ua", "url", None
+                )
+                series = SearchManager.parse_uaflix_series_page_html(page)
+            extracted[builder] = (
+                [vars(r) for r in results],
+                [(s.studio_id, s.series, s.url) for s in series],
+            )
+        self.assertEqual(extracted["lxml"], extracted["html.parser"])
+        self.assertEqual(len(extracted["lxml"][1]), 2)
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,160 @@
+import tempfile
+import threading
+import time
+import unittest
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import patch
+
+from stream2mediaserver.config import config
+from stream2mediaserver.processors.rate_limiter import (
+    AdaptivePacer,
+    HostRateLimiter,
+    host_of,
+)
+from stream2mediaserver.processors.request_manager import RequestManager
+
+
+class HostRateLimiterTests(unittest.TestCase):
+    def test_first_request_to_host_is_not_delayed(self):
+        limiter = HostRateLimiter()
+        self.assertEqual(limiter.reserve("a.test", 2.0), 0.0)
+
+    def test_consecutive_reservations_are_spaced_by_interval(self):
+        limiter = HostRateLimiter()
+        limiter.reserve("a.test", 2.0)
+        second = limiter.reserve("a.test", 2.0)
+        third = limiter.reserve("a.test", 2.0)
+        self.assertAlmostEqual(second, 2.0, delta=0.05)
+        self.assertAlmostEqual(third, 4.0, delta=0.05)
+
+    def test_hosts_are_scheduled_independently(self):
+        limiter = HostRateLimiter()
+        limiter.reserve("a.test", 2.0)
+        limiter.reserve("a.test", 2.0)
+        self.assertEqual(limiter.reserve("b.test", 2.0), 0.0)
+
+    def test_waiting_on_one_host_does_not_block_another(self):
+        limiter = HostRateLimiter()
+        limiter.reserve("slow.test", 0.5)
+        waiter = threading.Thread(
+            target=lambda: time.sleep(limiter.reserve("slow.test", 0.5))
+        )
+        waiter.start()
+        started = time.monotonic()
+        limiter.reserve("fast.test", 0.5)
+        self.assertLess(time.monotonic() - started, 0.1)
+        waiter.join()
+
+    def test_defer_pushes_next_slot_back(self):
+        limiter = HostRateLimiter()
+        limiter.defer("a.test", 5.0)
+        self.assertAlmostEqual(limiter.reserve("a.test", 1.0), 5.0, delta=0.05)
+
+    def test_host_of(self):
+        self.assertEqual(host_of("https://uakino.best/index.php"), "uakino.best")
+        self.assertEqual(host_of("uakino.best"), "uakino.best")
+
+
+class AdaptivePacerTests(unittest.TestCase):
+    LIMITS = dict(initial=2.0, floor=0.25, ceiling=30.0, step=0.5)
+
+    def _observe(self, pacer, **kwargs):
+        return pacer.observe(
+            "a.test", **self.LIMITS, **{"backoff": False, "fast": False, **kwargs}
+        )
+
+    def test_unseen_host_uses_initial_interval(self):
+        self.assertEqual(AdaptivePacer().interval("a.test", 2.0), 2.0)
+
+    def test_fast_successes_speed_up_to_floor(self):
+        pacer = AdaptivePacer()
+        self.assertEqual(self._observe(pacer, fast=True), 1.5)
+        for _ in range(10):
+            self._observe(pacer, fast=True)
+        self.assertEqual(pacer.interval("a.test", 2.0), 0.25)
+
+    def test_slow_success_leaves_interval_alone(self):
+        self.assertEqual(self._observe(AdaptivePacer()), 2.0)
+
+    def test_backoff_doubles_up_to_ceiling(self):
+        pacer = AdaptivePacer()
+        self.assertEqual(self._observe(pacer, backoff=True), 4.0)
+        for _ in range(10):
+            self._observe(pacer, backoff=True)
+        self.assertEqual(pacer.interval("a.test", 2.0), 30.0)
+
+    def test_retry_after_sets_minimum_interval(self):
+        pacer = AdaptivePacer()
+        self.assertEqual(self._observe(pacer, backoff=True, retry_after=12), 12.0)
+
+    def test_state_persists_across_instances(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "pacing.json"
+            self._observe(AdaptivePacer(path), backoff=True)
+            self.assertEqual(AdaptivePacer(path).interval("a.test", 2.0), 4.0)
+
+
+class FakeResponse:
+    def __init__(self, status_code=200, headers=None):
+        self.status_code = status_code
+        self.ok = status_code < 400
+        self.headers = headers or {}
+        self.content = b""
+        self.url = "https://example.test/"
+
+
+class RequestManagerPacingTests(unittest.TestCase):
+    def setUp(self):
+        provider_config = config.provider_config
+        self._saved = (
+            provider_config.request_delay_seconds,
+            provider_config.pacing_state_path,
+            provider_config.max_retries,
+        )
+        provider_config.request_delay_seconds = 2.0
+        provider_config.pacing_state_path = None
+        provider_config.max_retries = 1
+        RequestManager._pacer = None
+        RequestManager._rate_limiter.reset()
+
+    def tearDown(self):
+        provider_config = config.provider_config
+        (
+            provider_config.request_delay_seconds,
+            provider_config.pacing_state_path,
+            provider_config.max_retries,
+        ) = self._saved
+        RequestManager._pacer = None
+        RequestManager._rate_limiter.reset()
+
+    def _get(self, response):
+        session = SimpleNamespace(request=lambda method, url, **kwargs: response)
+        with patch.object(RequestManager, "_session_for", return_value=session):
+            RequestManager.get("https://example.test/page")
+
+    def _interval(self):
+        return RequestManager._host_pacer().interval("example.test", 2.0)
+
+    def test_fast_success_shortens_interval(self):
+        self._get(FakeResponse(200))
+        self.assertLess(self._interval(), 2.0)
+
+    def test_rate_limit_lengthens_interval_and_defers_host(self):
+        with patch("time.sleep"):
+            self._get(FakeResponse(429, {"Retry-After": "7"}))
+        self.assertEqual(self._interval(), 7.0)
+        wait = RequestManager._rate_limiter.reserve("example.test", 0)
+        self.assertAlmostEqual(wait, 7.0, delta=0.1)
+
+    def test_cloudflare_challenge_backs_off(self):
+        self._get(FakeResponse(403, {"cf-mitigated": "challenge"}))
+        self.assertEqual(self._interval(), 4.0)
+
+    def test_not_found_does_not_change_pace(self):
+        self._get(FakeResponse(404))
+        self.assertEqual(self._interval(), 2.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,10 +1,18 @@
+import tempfile
+import threading
 import unittest
+from pathlib import Path
+from types import SimpleNamespace
 from unittest.mock import patch
 
+from curl_cffi import CurlHttpVersion
 from curl_cffi.requests.exceptions import HTTPError
 
 from stream2mediaserver.config import config
-from stream2mediaserver.processors.request_manager import RequestManager
+from stream2mediaserver.processors.request_manager import (
+    AsyncRequestManager,
+    RequestManager,
+)
 
 
 class FakeResponse:
@@ -30,6 +38,7 @@ class RequestManagerRetryTests(unittest.TestCase):
     def tearDown(self):
         config.provider_config.request_delay_seconds = self._delay
         config.provider_config.max_retries = self._retries
+        RequestManager._breaker.reset()
 
     def _run(self, responses):
         """Drive RequestManager.get over a scripted list of responses/exceptions."""
@@ -43,7 +52,8 @@ class RequestManagerRetryTests(unittest.TestCase):
                 raise result
             return result
 
-        with patch.object(RequestManager._session, "request", fake_request), patch(
+        session = SimpleNamespace(request=fake_request)
+        with patch.object(RequestManager, "_session_for", return_value=session), patch(
             "stream2mediaserver.processors.request_manager.time.sleep", waits.append
         ):
             response = RequestManager.get("https://example.test")
@@ -83,5 +93,188 @@ class RequestManagerRetryTests(unittest.TestCase):
         self.assertEqual(len(calls), 1)
 
 
+class AsyncRequestManagerRetryTests(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        self._delay = config.provider_config.request_delay_seconds
+        self._retries = config.provider_config.max_retries
+        config.provider_config.request_delay_seconds = 0
+
+    def tearDown(self):
+        config.provider_config.request_delay_seconds = self._delay
+        config.provider_config.max_retries = self._retries
+        RequestManager._breaker.reset()
+
+    async def _run(self, responses):
+        """Drive AsyncRequestManager.get over a scripted list of responses/exceptions."""
+        calls = []
+        waits = []
+
+        async def fake_request(method, url, **kwargs):
+            calls.append(kwargs.get("headers", {}))
+            result = responses[len(calls) - 1]
+            if isinstance(result, Exception):
+                raise result
+            return result
+
+        async def fake_sleep(seconds):
+            waits.append(seconds)
+
+        session = SimpleNamespace(request=fake_request)
+        with patch.object(
+            AsyncRequestManager, "_session_for", return_value=session
+        ), patch(
+            "stream2mediaserver.processors.request_manager.asyncio.sleep", fake_sleep
+        ):
+            response = await AsyncRequestManager.get("https://example.test")
+        return response, calls, waits
+
+    async def test_retries_429_honouring_retry_after(self):
+        ok = FakeResponse(200)
+        response, calls, waits = await self._run(
+            [FakeResponse(429, {"Retry-After": "7"}), ok]
+        )
+        self.assertIs(response, ok)
+        self.assertEqual(len(calls), 2)
+        self.assertEqual(waits, [7.0])
+
+    async def test_retries_transport_errors_then_gives_up(self):
+        config.provider_config.max_retries = 2
+        response, calls, _ = await self._run([HTTPError("boom"), HTTPError("boom")])
+        self.assertIsNone(response)
+        self.assertEqual(len(calls), 2)
+
+    async def test_does_not_retry_client_errors(self):
+        response, calls, _ = await self._run([FakeResponse(404)])
+        self.assertIsNone(response)
+        self.assertEqual(len(calls), 1)
+        self.assertIn("Chrome", calls[0]["User-Agent"])
+
+    async def test_sessions_are_pooled_per_host(self):
+        first = AsyncRequestManager._session_for("https://a.test/x")
+        self.assertIs(first, AsyncRequestManager._session_for("https://a.test/y"))
+        self.assertIsNot(first, AsyncRequestManager._session_for("https://b.test/"))
+        self.assertIsNot(first, RequestManager._session_for("https://a.test/x"))
+
+    async def test_pacer_state_file_is_handled_off_the_event_loop(self):
+        threads = {}
+
+        def record(name, real):
+            def wrapper(*args):
+                threads[name] = threading.get_ident()
+                return real(*args)
+
+            return wrapper
+
+        with tempfile.TemporaryDirectory() as tmp, patch.multiple(
+            config.provider_config,
+            pacing_state_path=Path(tmp) / "pacing.json",
+            adaptive_throttle=True,
+        ), patch.multiple(
+            AsyncRequestManager,
+            _throttle_wait=record("throttle", RequestManager._throttle_wait),
+            _observe=record("observe", RequestManager._observe),
+        ):
+            response, _, _ = await self._run([FakeResponse(200)])
+
+        self.assertIsNotNone(response)
+        self.assertEqual(set(threads), {"throttle", "observe"})
+        self.assertNotIn(threading.get_ident(), threads.values())
+
+
+class RequestManagerSessionPoolTests(unittest.TestCase):
+    def tearDown(self):
+        config.provider_config.http2 = None
+        RequestManager.reset_sessions()
+
+    def test_sessions_are_pooled_per_host(self):
+        first = RequestManager._session_for("https://a.test/x")
+        self.assertIs(first, RequestManager._session_for("https://a.test/y"))
+        self.assertIsNot(first, RequestManager._session_for("https://b.test/"))
+
+    def test_http2_is_opt_in(self):
+        self.assertNotIn("http_version", RequestManager._session_options())
+        config.provider_config.http2 = True
+        self.assertEqual(
+            RequestManager._session_options()["http_version"], CurlHttpVersion.V2TLS
+        )
+
+    def test_reset_sessions_rebuilds_pool(self):
+        first = RequestManager._session_for("https://a.test/")
+        RequestManager.reset_sessions()
+        self.assertIsNot(first, RequestManager._session_for("https://a.test/"))
+
+
+class RequestManagerStreamTests(unittest.TestCase):
+    def setUp(self):
+        self._delay = config.provider_config.request_delay_seconds
+        self._retries = config.provider_config.max_retries
+        config.provider_config.request_delay_seconds = 0
+
+    def tearDown(self):
+        config.provider_config.request_delay_seconds = self._delay
+        config.provider_config.max_retries = self._retries
+        RequestManager._breaker.reset()
+
+    def _stream(self, scripted, chunk_size=4):
+        """scripted: list of (status, [body pieces]) or exceptions, one per attempt."""
+        calls = []
+        received = []
+
+        def fake_request(method, url, **kwargs):
+            calls.append(kwargs)
+            step = scripted[len(calls) - 1]
+            if isinstance(step, Exception):
+                raise step
+            status, pieces = step
+            for piece in pieces:
+                kwargs["content_callback"](piece)
+            return FakeResponse(status)
+
+        session = SimpleNamespace(request=fake_request)
+        with patch.object(RequestManager, "_session_for", return_value=session), patch(
+            "stream2mediaserver.processors.request_manager.time.sleep"
+        ):
+            response = RequestManager.stream(
+                "https://example.test/seg.ts", received.append, chunk_size=chunk_size
+            )
+        return response, calls, received
+
+    def test_body_reaches_sink_in_bounded_chunks(self):
+        response, calls, received = self._stream([(200, [b"abcdef", b"ghij"])])
+        self.assertIsNotNone(response)
+        self.assertEqual(received, [b"abcd", b"efgh", b"ij"])
+        self.assertIsNone(calls[0]["timeout"])
+
+    def test_small_error_body_is_kept_out_of_sink_and_retried(self):
+        response, calls, received = self._stream(
+            [(503, [b"no"]), (200, [b"data"])], chunk_size=8
+        )
+        self.assertIsNotNone(response)
+        self.assertEqual(received, [b"data"])
+        self.assertEqual(len(calls), 2)
+
+    def test_torn_body_is_not_retried(self):
+        response, calls, received = self._stream(
+            [(503, [b"partial-body"]), (200, [b"data"])]
+        )
+        self.assertIsNone(response)
+        self.assertEqual(len(calls), 1)
+
+    def test_sink_errors_propagate(self):
+        def failing_sink(chunk):
+            raise OSError("disk full")
+
+        def fake_request(method, url, **kwargs):
+            kwargs["content_callback"](b"abcdefgh")
+            return FakeResponse(200)
+
+        session = SimpleNamespace(request=fake_request)
+        with patch.object(RequestManager, "_session_for", return_value=session):
+            with self.assertRaises(OSError):
+                RequestManager.stream(
+                    "https://example.test/", failing_sink, chunk_size=4
+                )
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,168 @@
+import tempfile
+import unittest
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import patch
+
+from stream2mediaserver.config import config
+from stream2mediaserver.processors.request_manager import RequestManager
+from stream2mediaserver.processors.response_cache import ResponseCache
+
+
+class FakeResponse:
+    def __init__(self, status_code=200, content=b"", headers=None):
+        self.status_code = status_code
+        self.ok = status_code < 400
+        self.content = content
+        self.headers = headers or {}
+        self.url = "https://example.test/"
+
+
+class ResponseCacheTests(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.path = Path(self._tmp.name) / "cache.sqlite"
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def test_round_trips_body_and_headers(self):
+        cache = ResponseCache(self.path, max_bytes=1024, default_ttl=60)
+        cache.store(
+            "k",
+            FakeResponse(
+                content='{"a": "є"}'.encode(),
+                headers={
+                    "content-type": "application/json; charset=utf-8",
+                    "ETag": '"v1"',
+                },
+            ),
+            ttl=60,
+        )
+        entry = cache.lookup("k")
+        self.assertTrue(entry.fresh)
+        self.assertEqual(entry.response.json(), {"a": "є"})
+        self.assertEqual(entry.validators(), {"If-None-Match": '"v1"'})
+
+    def test_ttl_rules_first_match_wins(self):
+        cache = ResponseCache(
+            self.path,
+            max_bytes=1024,
+            ttl_rules=[(r"\.ts$", 0), (r"/api/", 30)],
+            default_ttl=5,
+        )
+        self.assertEqual(cache.ttl_for("https://h/seg.ts"), 0)
+        self.assertEqual(cache.ttl_for("https://h/api/x"), 30)
+        self.assertEqual(cache.ttl_for("https://h/page"), 5)
+
+    def test_evicts_least_recently_used_over_budget(self):
+        cache = ResponseCache(self.path, max_bytes=10)
+        cache.store("old", FakeResponse(content=b"12345"), ttl=60)
+        cache.store("new", FakeResponse(content=b"12345"), ttl=60)
+        cache.lookup("old")  # touch: "new" is now least recently used
+        cache.store("newest", FakeResponse(content=b"12345"), ttl=60)
+        self.assertIsNotNone(cache.lookup("old"))
+        self.assertIsNone(cache.lookup("new"))
+        self.assertIsNotNone(cache.lookup("newest"))
+
+    def test_key_ignores_param_order(self):
+        self.assertEqual(
+            ResponseCache.key("https://h/", {"a": 1, "b": 2}),
+            ResponseCache.key("https://h/", {"b": 2, "a": 1}),
+        )
+
+
+class RequestManagerCacheTests(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self._delay = config.provider_config.request_delay_seconds
+        config.provider_config.request_delay_seconds = 0
+        config.http_cache.path = Path(self._tmp.name) / "cache.sqlite"
+
+    def tearDown(self):
+        config.http_cache.path = None
+        config.provider_config.request_delay_seconds = self._delay
+        RequestManager._cache = None
+        self._tmp.cleanup()
+
+    def _get(self, responses):
+        calls = []
+
+        def fake_request(method, url, **kwargs):
+            calls.append(kwargs.get("headers", {}))
+            return responses[len(calls) - 1]
+
+        session = SimpleNamespace(request=fake_request)
+        with patch.object(RequestManager, "_session_for", return_value=session):
+            response = RequestManager.get("https://example.test/page")
+        return response, calls
+
+    def test_warm_cache_skips_network(self):
+        self._get([FakeResponse(content=b"page")])
+        response, calls = self._get([])
+        self.assertEqual(response.content, b"page")
+        self.assertEqual(calls, [])
+
+    def test_stale_entry_is_revalidated_with_validators(self):
+        self._get(
+            [
+                FakeResponse(
+                    content=b"page", headers={"Last-Modified": "Mon, 01 Jan 2024"}
+                )
+            ]
+        )
+        cache = RequestManager._response_cache()
+        cache.refresh(cache.key("https://example.test/page"), ttl=-1)
+
+        response, calls = self._get([FakeResponse(304)])
+
+        self.assertEqual(calls[0]["If-Modified-Since"], "Mon, 01 Jan 2024")
+        self.assertEqual(response.content, b"page")
+        self.assertTrue(cache.lookup(cache.key("https://example.test/page")).fresh)
+
+    def _posts(self, *forms, cache=True, headers=None):
+        calls = []
+
+        def fake_request(method, url, **kwargs):
+            calls.append(kwargs["data"])
+            return FakeResponse(content=b"results", headers=headers)
+
+        session = SimpleNamespace(request=fake_request)
+        with patch.object(RequestManager, "_session_for", return_value=session):
+            responses = [
+                RequestManager.post("https://example.test/search", data=f, cache=cache)
+                for f in forms
+            ]
+        return responses, calls
+
+    def test_post_is_not_cached(self):
+        _, calls = self._posts({}, {}, cache=False)
+        self.assertEqual(len(calls), 2)
+
+    def test_search_post_is_cached_by_form_data(self):
+        responses, calls = self._posts(
+            {"story": "x", "hash": "h"},
+            {"hash": "h", "story": "x"},
+            {"story": "y", "hash": "h"},
+        )
+        self.assertEqual(
+            calls, [{"story": "x", "hash": "h"}, {"story": "y", "hash": "h"}]
+        )
+        self.assertEqual(responses[1].content, b"results")
+        self.assertIsNone(
+            RequestManager._response_cache().lookup("https://example.test/search")
+        )
+
+    def test_no_store_and_private_responses_are_not_stored(self):
+        for directive in ("no-store", "private, max-age=60"):
+            with self.subTest(directive=directive):
+                _, calls = self._posts(
+                    {"q": directive},
+                    {"q": directive},
+                    headers={"Cache-Control": directive},
+                )
+                self.assertEqual(len(calls), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
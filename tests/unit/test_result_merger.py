@@ -0,0 +1,83 @@
+import unittest
+
+from stream2mediaserver.models.search_result import SearchResult
+from stream2mediaserver.processors.result_merger import ResultMerger
+
+
+def result(provider, title, title_eng=None, year=None, link=None):
+    return SearchResult(
+        title=title,
+        link=link or f"https://{provider}.test/{title}",
+        title_eng=title_eng,
+        year=year,
+        provider=provider,
+    )
+
+
+class ResultMergerTests(unittest.TestCase):
+    def test_merges_across_providers_and_languages(self):
+        works = ResultMerger.merge(
+            [
+                result("uakino", "Атака титанів", "Attack on Titan", "2013"),
+                result("animeon", "Атака Титанів!", "Attack on Titan", "2013-04-07"),
+                result("anitube", "атака титанів", year=2013),
+                result("uaflix", "Attack on titan", year="2013"),
+            ]
+        )
+        self.assertEqual(len(works), 1)
+        work = works[0]
+        self.assertEqual(
+            (work.title, work.title_eng, work.year),
+            ("Атака титанів", "Attack on Titan", 2013),
+        )
+        self.assertEqual(work.providers, ["uakino", "animeon", "anitube", "uaflix"])
+        self.assertEqual(work.links["anitube"], ["https://anitube.test/атака титанів"])
+
+    def test_year_and_season_number_keep_works_apart(self):
+        works = ResultMerger.merge(
+            [
+                result("uakino", "Дюна", "Dune", "1984"),
+                result("uaflix", "Дюна", "Dune", "2021"),
+                result("uakino", "Атака титанів 3 сезон", year="2018"),
+                result("animeon", "Атака титанів", "Attack on Titan Season 3", "2018"),
+                result("anitube", "Атака титанів", year="2018"),
+            ]
+        )
+        self.assertEqual(
+            [(w.title, w.year, w.providers) for w in works],
+            [
+                ("Дюна", 1984, ["uakino"]),
+                ("Дюна", 2021, ["uaflix"]),
+                ("Атака титанів 3 сезон", 2018, ["uakino"]),
+                ("Атака титанів", 2018, ["animeon", "anitube"]),
+            ],
+        )
+
+    def test_undated_result_joins_only_an_unambiguous_work(self):
+        works = ResultMerger.merge(
+            [
+                result("uakino", "Наруто", "Naruto", "2002"),
+                result("anitube", "Наруто"),
+                result("uakino", "Дюна", year="1984"),
+                result("uaflix", "Дюна", year="2021"),
+                result("animeon", "Дюна"),
+                result("anitube", "Дюна"),
+            ]
+        )
+        self.assertEqual(
+            [(w.title, w.year, w.providers) for w in works],
+            [
+                ("Наруто", 2002, ["uakino", "anitube"]),
+                ("Дюна", 1984, ["uakino"]),
+                ("Дюна", 2021, ["uaflix"]),
+                ("Дюна", None, ["animeon", "anitube"]),
+            ],
+        )
+
+    def test_results_without_titles_stay_separate(self):
+        works = ResultMerger.merge([result("a", ""), result("b", "", year="2020")])
+        self.assertEqual(len(works), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,148 @@
+import os
+import tempfile
+import threading
+import unittest
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import Mock, patch
+
+from stream2mediaserver.processors.download_manifest import DownloadManifest
+from stream2mediaserver.processors.request_manager import RequestManager
+from stream2mediaserver.processors.segment_downloader import SegmentDownloader
+
+OK = SimpleNamespace(headers={})
+
+
+class SegmentDownloaderTests(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmp.cleanup)
+        sleep = patch("stream2mediaserver.processors.segment_downloader.time.sleep")
+        sleep.start()
+        self.addCleanup(sleep.stop)
+
+    def _segments(self, count):
+        return [
+            (f"https://cdn.test/seg-{i}.ts", os.path.join(self._tmp.name, f"{i}.ts"))
+            for i in range(count)
+        ]
+
+    def test_returns_paths_in_playlist_order_whatever_completes_first(self):
+        segments = self._segments(4)
+        active = []
+        peak = []
+        lock = threading.Lock()
+
+        def fake_stream(url, sink, **kwargs):
+            with lock:
+                active.append(url)
+                peak.append(len(active))
+            # Later segments finish first.
+            threading.Event().wait(0.05 * (4 - int(url[-4])))
+            sink(url.encode())
+            with lock:
+                active.remove(url)
+            return OK
+
+        with patch.object(RequestManager, "stream", side_effect=fake_stream):
+            paths = SegmentDownloader(workers=4).download(segments)
+
+        self.assertEqual(paths, [path for _, path in segments])
+        with open(paths[2], "rb") as f:
+            self.assertEqual(f.read(), b"https://cdn.test/seg-2.ts")
+        self.assertGreater(max(peak), 1)
+
+    def test_broken_segment_is_retried_from_scratch(self):
+        segments = self._segments(1)
+        outcomes = iter([None, OK])
+
+        def fake_stream(url, sink, **kwargs):
+            sink(b"partial")
+            return next(outcomes)
+
+        with patch.object(RequestManager, "stream", side_effect=fake_stream) as stream:
+            SegmentDownloader(retries=1).download(segments)
+
+        self.assertEqual(stream.call_count, 2)
+        self.assertFalse(stream.call_args.kwargs["throttle"])
+        with open(segments[0][1], "rb") as f:
+            self.assertEqual(f.read(), b"partial")
+
+    def test_raises_when_a_segment_keeps_failing(self):
+        with patch.object(RequestManager, "stream", return_value=None):
+            with self.assertRaises(Exception):
+                SegmentDownloader(workers=2, retries=1).download(self._segments(3))
+
+    def test_short_body_is_rejected(self):
+        short = SimpleNamespace(headers={"Content-Length": "10"})
+
+        def fake_stream(url, sink, **kwargs):
+            sink(b"12345")
+            return short
+
+        with patch.object(RequestManager, "stream", side_effect=fake_stream):
+            with self.assertRaises(Exception):
+                SegmentDownloader(retries=0).download(self._segments(1))
+        self.assertEqual(os.listdir(self._tmp.name), [])
+
+    def test_resume_skips_segments_the_manifest_verifies(self):
+        segments = self._segments(3)
+        manifest_path = Path(self._tmp.name) / "episode.manifest.json"
+
+        def fake_stream(url, sink, **kwargs):
+            sink(url.encode())
+            return OK
+
+        with patch.object(RequestManager, "stream", side_effect=fake_stream):
+            SegmentDownloader(manifest=DownloadManifest(manifest_path)).download(
+                segments
+            )
+        # Simulate a segment damaged after the crash.
+        with open(segments[1][1], "ab") as f:
+            f.write(b"junk")
+
+        with patch.object(RequestManager, "stream", side_effect=fake_stream) as stream:
+            SegmentDownloader(manifest=DownloadManifest(manifest_path)).download(
+                segments
+            )
+
+        self.assertEqual([c.args[0] for c in stream.call_args_list], [segments[1][0]])
+        with open(segments[1][1], "rb") as f:
+            self.assertEqual(f.read(), segments[1][0].encode())
+
+    def test_iter_bodies_yields_in_order_with_bounded_lookahead(self):
+        urls = [f"https://cdn.test/seg-{i}.ts" for i in range(6)]
+        started = []
+
+        def fake_stream(url, sink, **kwargs):
+            started.append(url)
+            sink(url.encode())
+            return OK
+
+        with patch.object(RequestManager, "stream", side_effect=fake_stream):
+            bodies = SegmentDownloader(workers=2).iter_bodies(urls)
+            first = next(bodies)
+            self.assertLessEqual(len(started), 3)
+            rest = list(bodies)
+
+        self.assertEqual([first, *rest], [url.encode() for url in urls])
+
+    def test_redownloaded_segment_is_charged_against_the_old_file(self):
+        segments = self._segments(1)
+        workspace = Mock()
+
+        def fake_stream(url, sink, **kwargs):
+            sink(b"x" * 5)
+            return OK
+
+        with patch.object(RequestManager, "stream", side_effect=fake_stream):
+            SegmentDownloader(workspace=workspace).download(segments)
+            SegmentDownloader(workspace=workspace).download(segments)
+
+        self.assertEqual(
+            [c.args for c in workspace.charge.call_args_list], [(5, 0), (5, 5)]
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,38 @@
+import threading
+import time
+import unittest
+
+from stream2mediaserver.processors.session_pool import HostSessionPool
+
+
+class HostSessionPoolTests(unittest.TestCase):
+    def test_one_session_per_host(self):
+        pool = HostSessionPool(object)
+        self.assertIs(pool.session("a.test"), pool.session("a.test"))
+        self.assertIsNot(pool.session("a.test"), pool.session("b.test"))
+
+    def test_slot_caps_concurrent_requests_per_host(self):
+        pool = HostSessionPool(object, max_connections=2)
+        active = []
+        peak = []
+        lock = threading.Lock()
+
+        def request():
+            with pool.slot("a.test"):
+                with lock:
+                    active.append(1)
+                    peak.append(len(active))
+                time.sleep(0.02)
+                with lock:
+                    active.pop()
+
+        threads = [threading.Thread(target=request) for _ in range(6)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(max(peak), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
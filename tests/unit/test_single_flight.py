@@ -0,0 +1,139 @@
+import asyncio
+import threading
+import time
+import unittest
+from types import SimpleNamespace
+from unittest.mock import patch
+
+from stream2mediaserver.config import config
+from stream2mediaserver.processors.request_manager import RequestManager
+from stream2mediaserver.processors.single_flight import AsyncSingleFlight, SingleFlight
+
+
+class SingleFlightTests(unittest.TestCase):
+    def test_concurrent_callers_share_one_call(self):
+        flight = SingleFlight()
+        calls = []
+        results = []
+
+        def work():
+            calls.append(1)
+            time.sleep(0.05)
+            return object()
+
+        threads = [
+            threading.Thread(target=lambda: results.append(flight.do("k", work)))
+            for _ in range(5)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(len({id(r) for r in results}), 1)
+
+    def test_key_is_released_after_completion(self):
+        flight = SingleFlight()
+        self.assertEqual(flight.do("k", lambda: 1), 1)
+        self.assertEqual(flight.do("k", lambda: 2), 2)
+
+    def test_error_propagates_to_caller(self):
+        flight = SingleFlight()
+        with self.assertRaises(ValueError):
+            flight.do("k", lambda: (_ for _ in ()).throw(ValueError()))
+
+
+class AsyncSingleFlightTests(unittest.IsolatedAsyncioTestCase):
+    async def test_concurrent_awaiters_share_one_call(self):
+        flight = AsyncSingleFlight()
+        calls = []
+
+        async def work():
+            calls.append(1)
+            await asyncio.sleep(0.01)
+            return object()
+
+        results = await asyncio.gather(*(flight.do("k", work) for _ in range(5)))
+
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(len({id(r) for r in results}), 1)
+
+    async def test_follower_takes_over_from_cancelled_leader(self):
+        flight = AsyncSingleFlight()
+        calls = []
+
+        async def work():
+            calls.append(1)
+            await asyncio.sleep(0.05)
+            return len(calls)
+
+        leader = asyncio.create_task(flight.do("k", work))
+        await asyncio.sleep(0)
+        followers = asyncio.gather(*(flight.do("k", work) for _ in range(3)))
+        await asyncio.sleep(0.01)
+        leader.cancel()
+
+        self.assertEqual(await followers, [2, 2, 2])
+        self.assertEqual(len(calls), 2)
+        with self.assertRaises(asyncio.CancelledError):
+            await leader
+
+    async def test_cancelled_follower_leaves_leader_running(self):
+        flight = AsyncSingleFlight()
+
+        async def work():
+            await asyncio.sleep(0.02)
+            return "done"
+
+        leader = asyncio.create_task(flight.do("k", work))
+        await asyncio.sleep(0)
+        follower = asyncio.create_task(flight.do("k", work))
+        await asyncio.sleep(0.005)
+        follower.cancel()
+
+        self.assertEqual(await leader, "done")
+        with self.assertRaises(asyncio.CancelledError):
+            await follower
+
+
+class RequestManagerSingleFlightTests(unittest.TestCase):
+    def setUp(self):
+        self._delay = config.provider_config.request_delay_seconds
+        config.provider_config.request_delay_seconds = 0
+
+    def tearDown(self):
+        config.provider_config.request_delay_seconds = self._delay
+
+    def test_identical_gets_share_one_request(self):
+        calls = []
+
+        def fake_request(method, url, **kwargs):
+            calls.append(url)
+            time.sleep(0.05)
+            return SimpleNamespace(
+                ok=True, status_code=200, headers={}, content=b"", url=url
+            )
+
+        session = SimpleNamespace(request=fake_request)
+        results = []
+        with patch.object(RequestManager, "_session_for", return_value=session):
+            threads = [
+                threading.Thread(
+                    target=lambda: results.append(
+                        RequestManager.get("https://a.test/x", params={"p": "1"})
+                    )
+                )
+                for _ in range(4)
+            ]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(len({id(r) for r in results}), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
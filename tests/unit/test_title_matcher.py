@@ -0,0 +1,53 @@
+import unittest
+from difflib import SequenceMatcher
+from unittest.mock import patch
+
+from stream2mediaserver.processors import title_matcher
+from stream2mediaserver.processors.title_matcher import TitleMatcher
+
+# (query token, title token): near misses on both sides of the 0.85 ratio.
+PAIRS = [
+    ("shippuden", "shippuuden"),
+    ("naruto", "naruta"),
+    ("titan", "titans"),
+    ("titan", "tit"),
+    ("stranger", "strange"),
+    ("stranger", "danger"),
+    ("attack", "atack"),
+    ("academia", "academy"),
+    ("abcdefghijkl", "abcdefghijklmnop"),  # ratio exactly 0.857...
+    ("титанів", "титани"),
+]
+
+
+class TitleMatcherTests(unittest.TestCase):
+    def assert_decisions_match_difflib(self):
+        for token, other in PAIRS:
+            expected = SequenceMatcher(None, token, other).ratio() >= 0.85
+            with self.subTest(token=token, other=other):
+                matcher = TitleMatcher(token)
+                self.assertEqual(matcher.score([other]) == 1.0, expected)
+
+    def test_fuzzy_decisions_match_difflib(self):
+        self.assert_decisions_match_difflib()
+
+    def test_fuzzy_decisions_match_difflib_without_rapidfuzz(self):
+        with patch.object(title_matcher, "Indel", None):
+            self.assert_decisions_match_difflib()
+
+    def test_pairs_are_compared_once_per_matcher(self):
+        matcher = TitleMatcher("Naruto Shippuden")
+        with patch.object(matcher, "_compare", wraps=matcher._compare) as compare:
+            for _ in range(3):
+                self.assertEqual(matcher.score(["Naruto Shippuuden"]), 1.0)
+        pairs = [c.args for c in compare.call_args_list]
+        self.assertIn(("shippuden", "shippuuden"), pairs)
+        self.assertEqual(len(pairs), len(set(pairs)))
+
+    def test_stopwords_and_short_tokens(self):
+        self.assertEqual(TitleMatcher("the and").score(["Anything"]), 1.0)
+        self.assertEqual(TitleMatcher("Dan Da Dan").score(["Red Data Girl"]), 0.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,142 @@
+import tempfile
+import unittest
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import patch
+
+from stream2mediaserver.config import config
+from stream2mediaserver.processors.request_manager import RequestManager
+from stream2mediaserver.processors.search_manager import SearchManager
+from stream2mediaserver.processors.token_cache import TokenCache
+
+
+class FakeResponse:
+    def __init__(self, text="", ok=True):
+        self.text = text
+        self.content = text.encode()
+        self.ok = ok
+
+
+HOMEPAGE = "<script>var dle_login_hash = 'abc123';</script>"
+
+
+class TokenCacheTests(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.path = Path(self._tmp.name) / "tokens.json"
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def test_survives_new_instance(self):
+        TokenCache(self.path).put("uakino", "https://uakino.best/", "abc")
+        self.assertEqual(
+            TokenCache(self.path).get("uakino", "https://uakino.best", ttl=60), "abc"
+        )
+
+    def test_expired_token_is_not_returned(self):
+        cache = TokenCache()
+        cache.put("uakino", "https://uakino.best", "abc")
+        self.assertIsNone(cache.get("uakino", "https://uakino.best", ttl=0))
+
+    def test_invalidate(self):
+        cache = TokenCache(self.path)
+        cache.put("uakino", "https://uakino.best", "abc")
+        cache.invalidate("uakino", "https://uakino.best")
+        self.assertIsNone(
+            TokenCache(self.path).get("uakino", "https://uakino.best", 60)
+        )
+
+
+class DleLoginHashCacheTests(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self._path = config.provider_config.token_cache_path
+        config.provider_config.token_cache_path = Path(self._tmp.name) / "t.json"
+
+    def tearDown(self):
+        config.provider_config.token_cache_path = self._path
+        SearchManager._dle_tokens = None
+        self._tmp.cleanup()
+
+    @patch("stream2mediaserver.processors.search_manager.RequestManager.get")
+    def test_hash_is_fetched_once(self, mock_get):
+        mock_get.return_value = FakeResponse(HOMEPAGE)
+        for _ in range(3):
+            self.assertEqual(
+                SearchManager.get_dle_login_hash("anitube", "https://a.test"), "abc123"
+            )
+        self.assertEqual(mock_get.call_count, 1)
+
+    @patch("stream2mediaserver.processors.search_manager.RequestManager.post")
+    @patch("stream2mediaserver.processors.search_manager.RequestManager.get")
+    def test_failed_search_refreshes_hash_and_retries(self, mock_get, mock_post):
+        mock_get.return_value = FakeResponse(HOMEPAGE)
+        mock_post.side_effect = [None, FakeResponse("<a style='display: block;'></a>")]
+
+        results = SearchManager.search_movies(
+            "anitube", "Ван Піс", "https://a.test", "https://a.test/search", "stale"
+        )
+
+        self.assertEqual(len(results), 1)
+        self.assertEqual(mock_post.call_args.kwargs["data"]["user_hash"], "abc123")
+
+
+class HashRefreshWithHttpCacheTests(unittest.TestCase):
+    """The refresh retry must reach the site even when the homepage is cached."""
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self._path = config.provider_config.token_cache_path
+        self._delay = config.provider_config.request_delay_seconds
+        config.provider_config.token_cache_path = Path(self._tmp.name) / "t.json"
+        config.provider_config.request_delay_seconds = 0
+        config.http_cache.path = Path(self._tmp.name) / "cache.sqlite"
+
+    def tearDown(self):
+        config.http_cache.path = None
+        config.provider_config.token_cache_path = self._path
+        config.provider_config.request_delay_seconds = self._delay
+        RequestManager._cache = None
+        SearchManager._dle_tokens = None
+        self._tmp.cleanup()
+
+    def test_stale_hash_retry_refetches_cached_homepage(self):
+        homepages = iter(["stale", "fresh"])
+        posted = []
+
+        def fake_request(method, url, **kwargs):
+            if method == "GET":
+                text = f"<script>var dle_login_hash = '{next(homepages)}';</script>"
+                return SimpleNamespace(
+                    status_code=200,
+                    ok=True,
+                    url=url,
+                    headers={},
+                    text=text,
+                    content=text.encode(),
+                )
+            posted.append(kwargs["data"]["user_hash"])
+            ok = kwargs["data"]["user_hash"] == "fresh"
+            text = "<a style='display: block;'></a>" if ok else ""
+            return SimpleNamespace(
+                status_code=200,
+                ok=True,
+                url=url,
+                headers={},
+                text=text,
+                content=text.encode(),
+            )
+
+        session = SimpleNamespace(request=fake_request)
+        with patch.object(RequestManager, "_session_for", return_value=session):
+            results = SearchManager.search_movies(
+                "anitube", "Ван Піс", "https://a.test/", "https://a.test/search"
+            )
+
+        self.assertEqual(posted, ["stale", "fresh"])
+        self.assertEqual(len(results), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,72 @@
+import unittest
+from types import SimpleNamespace
+
+from stream2mediaserver.processors.variant_policy import VariantPolicy
+
+
+def variant(uri, bandwidth, height=None, codecs=None):
+    resolution = (height * 16 // 9, height) if height else None
+    return SimpleNamespace(
+        uri=uri,
+        stream_info=SimpleNamespace(
+            bandwidth=bandwidth, resolution=resolution, codecs=codecs
+        ),
+    )
+
+
+class VariantPolicyTests(unittest.TestCase):
+    def setUp(self):
+        self.playlists = [
+            variant("360.m3u8", 800_000, 360, "avc1.4d401e,mp4a.40.2"),
+            variant("720.m3u8", 2_500_000, 720, "avc1.4d401f,mp4a.40.2"),
+            variant("1080-hevc.m3u8", 4_000_000, 1080, "hvc1.1.6.L120,mp4a.40.2"),
+            variant("1080.m3u8", 5_000_000, 1080, "avc1.640028,mp4a.40.2"),
+        ]
+
+    def test_without_limits_picks_highest_bandwidth(self):
+        self.assertEqual(VariantPolicy().select(self.playlists).uri, "1080.m3u8")
+
+    def test_height_and_bandwidth_caps(self):
+        self.assertEqual(
+            VariantPolicy(max_height=720).select(self.playlists).uri, "720.m3u8"
+        )
+        self.assertEqual(
+            VariantPolicy(max_bandwidth=4_500_000).select(self.playlists).uri,
+            "1080-hevc.m3u8",
+        )
+
+    def test_preferred_codec_wins_when_available(self):
+        policy = VariantPolicy(preferred_codecs=["hvc1", "avc1"])
+        self.assertEqual(policy.select(self.playlists).uri, "1080-hevc.m3u8")
+        policy = VariantPolicy(preferred_codecs=["av01"])
+        self.assertEqual(policy.select(self.playlists).uri, "1080.m3u8")
+
+    def test_throughput_target_keeps_variants_that_fit(self):
+        policy = VariantPolicy(target_seconds=600)
+        # 1440 s at 2.5 Mbit/s is 450 MB; 1 MB/s for 600 s allows 600 MB.
+        chosen = policy.select(self.playlists, duration=1440, throughput=1_000_000)
+        self.assertEqual(chosen.uri, "720.m3u8")
+
+    def test_falls_back_to_lightest_when_nothing_fits(self):
+        policy = VariantPolicy(max_height=240)
+        self.assertEqual(policy.select(self.playlists).uri, "360.m3u8")
+        self.assertIsNone(policy.select([]))
+
+    def test_ladder_respects_height_cap(self):
+        urls = [
+            "[360p]http://example.com/360.mp4",
+            "[1080p]http://example.com/1080.mp4",
+            "[720p]http://example.com/720.mp4",
+        ]
+        self.assertEqual(
+            VariantPolicy().select_ladder(urls), "http://example.com/1080.mp4"
+        )
+        self.assertEqual(
+            VariantPolicy(max_height=720).select_ladder(urls),
+            "http://example.com/720.mp4",
+        )
+        self.assertEqual(VariantPolicy().select_ladder(["http://x/a.mp4"]), "")
+
+
+if __name__ == "__main__":
+    unittest.main()